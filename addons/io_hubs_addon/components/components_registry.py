@@ -6,11 +6,16 @@ from bpy.types import PropertyGroup
 import importlib
 import inspect
 import os
+from collections import namedtuple
 from os.path import join, isfile, isdir, dirname, realpath
 
 from .hubs_component import HubsComponent
 
 
+# Definition values of a registered component, resolved once when it's registered instead of on every lookup.
+ComponentMetadata = namedtuple('ComponentMetadata', ['id', 'name', 'display_name', 'deps', 'panel_types', 'node_type'])
+
+
 class HubsComponentName(PropertyGroup):
     # For backwards compatibility reasons this attribute is called "name" but it actually points to the component id
     name: StringProperty(name="name")
@@ -93,6 +98,9 @@ def register_component(component_class):
         print(f"Registering component: {component_class.get_name()}")
     bpy.utils.register_class(component_class)
 
+    from ..io.utils import compile_gather_plan
+    compile_gather_plan(component_class)
+
     component_id = component_class.get_id()
     if component_class.get_node_type() == NodeType.SCENE:
         setattr(
@@ -140,6 +148,9 @@ def unregister_component(component_class):
 
     bpy.utils.unregister_class(component_class)
 
+    from ..io.utils import remove_gather_plan
+    remove_gather_plan(component_class)
+
     from ..io.gltf_exporter import glTF2ExportUserExtension
     glTF2ExportUserExtension.remove_excluded_property(component_class.get_id())
 
@@ -159,7 +170,7 @@ def load_user_components():
                     if hasattr(module, 'register_module'):
                         module.register_module()
                     register_component(member)
-                    __components_registry[member.get_name()] = member
+                    add_to_index(member)
                 except Exception:
                     import traceback
                     traceback.print_exc()
@@ -167,10 +178,14 @@ def load_user_components():
 
 def unload_user_components():
     global __components_registry
+    removed_components = []
     for _, component_class in __components_registry.items():
         for module_name in get_user_component_names():
             if module_name == component_class.get_name():
                 unregister_component(component_class)
+                removed_components.append(component_class)
+    for component_class in removed_components:
+        remove_from_index(component_class)
     for module in get_user_component_definitions():
         if hasattr(module, 'unregister_module'):
             module.unregister_module()
@@ -180,13 +195,15 @@ def load_components_registry():
     """Recurse in the components directory to build the components registry"""
     global __components_registry
     __components_registry = {}
+    __components_by_id.clear()
+    __components_metadata.clear()
     for module in get_component_definitions():
         for _, member in inspect.getmembers(module):
             if inspect.isclass(member) and issubclass(member, HubsComponent) and module.__name__ == member.__module__:
                 if hasattr(module, 'register_module'):
                     module.register_module()
                 register_component(member)
-                __components_registry[member.get_name()] = member
+                add_to_index(member)
 
     # When running Blender in factory startup mode and specifying an addon, that addon's register function is called.
     # As preferences are not available until the addon is enabled, the user component load fails when accessing them.
@@ -207,6 +224,32 @@ def unload_components_registry():
 
 
 __components_registry = {}
+__components_by_id = {}
+__components_metadata = {}
+
+
+def add_to_index(component_class):
+    '''Adds a registered component to the registry, keyed by its name, and to the id and metadata indices.'''
+    component_name = component_class.get_name()
+    __components_registry[component_name] = component_class
+    __components_by_id[component_class.get_id()] = component_class
+    __components_metadata[component_name] = ComponentMetadata(
+        id=component_class.get_id(),
+        name=component_name,
+        display_name=component_class.get_display_name(),
+        deps=tuple(component_class.get_deps()),
+        panel_types=tuple(component_class.get_panel_type()),
+        node_type=component_class.get_node_type()
+    )
+
+
+def remove_from_index(component_class):
+    component_name = component_class.get_name()
+    if __components_registry.get(component_name) is component_class:
+        del __components_registry[component_name]
+        __components_metadata.pop(component_name, None)
+    if __components_by_id.get(component_class.get_id()) is component_class:
+        del __components_by_id[component_class.get_id()]
 
 
 def get_components_registry():
@@ -215,11 +258,16 @@ def get_components_registry():
 
 
 def get_component_by_name(component_name):
-    global __components_registry
-    return next(
-        (component_class for _, component_class in __components_registry.items()
-         if component_class.get_name() == component_name),
-        None)
+    return __components_registry.get(component_name)
+
+
+def get_component_by_id(component_id):
+    return __components_by_id.get(component_id)
+
+
+def get_component_metadata(component_name):
+    '''Returns the cached ComponentMetadata of a registered component, or None if there is no component with that name.'''
+    return __components_metadata.get(component_name)
 
 
 def register():
@@ -260,3 +308,5 @@ def unregister():
 
     global __components_registry
     del __components_registry
+    __components_by_id.clear()
+    __components_metadata.clear()
@@ -1,3 +1,4 @@
+import bpy
 from bpy.props import FloatProperty, EnumProperty, FloatVectorProperty, BoolProperty
 from ..hubs_component import HubsComponent
 from ..types import Category, PanelType, NodeType
@@ -68,6 +69,14 @@ class AmmoShape(HubsComponent):
         description="Include invisible objects when generating a collider. (Only used if \"fit\" is set to \"all\")",
         default=False)
 
+    def gather(self, export_settings, object):
+        from ...io.utils import gather_properties
+        data = gather_properties(export_settings, object, self)
+        if export_settings.get('hubs_precompute_colliders') and isinstance(object, bpy.types.Object):
+            from ...io.ammo_shapes import precompute_ammo_shape
+            precompute_ammo_shape(export_settings, object, self, data)
+        return data
+
     def draw(self, context, layout, panel):
         super().draw(context, layout, panel)
 
@@ -1,4 +1,3 @@
-from ..models import audio
 from ..gizmos import CustomModelGizmo, bone_matrix_world
 from bpy.props import BoolProperty, StringProperty
 from ..hubs_component import HubsComponent
@@ -56,7 +55,7 @@ class Audio(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", audio.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", "audio")
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
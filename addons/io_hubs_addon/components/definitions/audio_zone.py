@@ -1,6 +1,5 @@
 from bpy.props import BoolProperty
 from ..gizmos import CustomModelGizmo, bone_matrix_world
-from ..models import box
 from ..hubs_component import HubsComponent
 from ..types import Category, PanelType, NodeType
 from .networked import migrate_networked
@@ -47,7 +46,7 @@ class AudioZone(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", box.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", "box")
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
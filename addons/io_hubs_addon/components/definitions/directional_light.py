@@ -1,4 +1,3 @@
-from ..models import directional_light
 from ..gizmos import CustomModelGizmo, bone_matrix_world, update_gizmos
 from bpy.props import FloatVectorProperty, FloatProperty, BoolProperty, IntVectorProperty
 from ..hubs_component import HubsComponent
@@ -23,7 +22,7 @@ class DirectionalLight(HubsComponent):
                                size=4,
                                min=0,
                                max=1,
-                               update=lambda self, context: update_gizmos())
+                               update=lambda self, context: update_gizmos(self.get_name()))
 
     intensity: FloatProperty(name="Intensity",
                              description="Intensity",
@@ -53,12 +52,13 @@ class DirectionalLight(HubsComponent):
 
         gizmo.hide = not ob.visible_get()
         gizmo.matrix_basis = mat
+        gizmo.color = getattr(target, cls.get_id()).color[:3]
 
     @classmethod
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", directional_light.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", "directional_light")
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
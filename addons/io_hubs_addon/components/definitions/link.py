@@ -1,4 +1,3 @@
-from ..models import link
 from ..gizmos import CustomModelGizmo, bone_matrix_world
 from bpy.props import StringProperty
 from ..hubs_component import HubsComponent
@@ -43,7 +42,7 @@ class Link(HubsComponent):
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", link.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", "link")
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
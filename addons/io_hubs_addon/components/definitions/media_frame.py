@@ -1,8 +1,7 @@
 import bpy
 from bpy.props import EnumProperty, FloatVectorProperty, BoolProperty
 from bpy.types import (Gizmo, Bone, EditBone)
-from ..gizmos import bone_matrix_world
-from ..models import box
+from ..gizmos import bone_matrix_world, get_custom_shape
 from ..hubs_component import HubsComponent
 from ..types import Category, PanelType, NodeType, MigrationType
 from ..utils import get_host_or_parents_scaled, is_linked, get_host_reference_message
@@ -44,8 +43,7 @@ class MediaFrameGizmo(Gizmo):
 
     def setup(self):
         if hasattr(self, "hubs_gizmo_shape"):
-            self.custom_shape = self.new_custom_shape(
-                'TRIS', self.hubs_gizmo_shape)
+            self.custom_shape = get_custom_shape(self.hubs_gizmo_shape)
 
 
 class MediaFrame(HubsComponent):
@@ -133,7 +131,7 @@ class MediaFrame(HubsComponent):
     @classmethod
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(MediaFrameGizmo.bl_idname)
-        setattr(gizmo, "hubs_gizmo_shape", box.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", "box")
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
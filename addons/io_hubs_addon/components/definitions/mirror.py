@@ -24,7 +24,7 @@ class Mirror(HubsComponent):
                                size=3,
                                min=0,
                                max=1,
-                               update=lambda self, context: update_gizmos())
+                               update=lambda self, context: update_gizmos(self.get_name()))
 
     def draw(self, context, layout, panel_type):
         super().draw(context, layout, panel_type)
@@ -82,4 +82,5 @@ class Mirror(HubsComponent):
                 loc) @ new_rot.normalized().to_matrix().to_4x4() @ Matrix.Diagonal(scale).to_4x4()
 
         gizmo.matrix_basis = mat_out
+        gizmo.color = getattr(target, cls.get_id()).color[:3]
         gizmo.hide = not ob.visible_get()
@@ -3,7 +3,6 @@ from ..hubs_component import HubsComponent
 from ..types import Category, NodeType, PanelType, MigrationType
 from ..consts import INTERPOLATION_MODES
 from ..gizmos import CustomModelGizmo, bone_matrix_world, update_gizmos
-from ..models import particle_emitter
 from ..utils import is_linked, get_host_reference_message
 import bpy
 from mathutils import Vector
@@ -65,7 +64,7 @@ class ParticleEmitter(HubsComponent):
                                     size=4,
                                     min=0,
                                     max=1,
-                                    update=lambda self, context: update_gizmos())
+                                    update=lambda self, context: update_gizmos(self.get_name()))
 
     startOpacity: FloatProperty(
         name="Start Opacity", description="Start Opacity", default=1.0)
@@ -159,12 +158,13 @@ class ParticleEmitter(HubsComponent):
 
         gizmo.hide = not ob.visible_get()
         gizmo.matrix_basis = mat
+        gizmo.color = getattr(target, cls.get_id()).startColor[:3]
 
     @classmethod
     def create_gizmo(cls, ob, gizmo_group):
         gizmo = gizmo_group.gizmos.new(CustomModelGizmo.bl_idname)
         gizmo.object = ob
-        setattr(gizmo, "hubs_gizmo_shape", particle_emitter.SHAPE)
+        setattr(gizmo, "hubs_gizmo_shape", "particle_emitter")
         gizmo.setup()
         gizmo.use_draw_scale = False
         gizmo.use_draw_modal = False
@@ -3,14 +3,89 @@ from bpy.types import (Gizmo, GizmoGroup)
 from bpy.props import (IntProperty)
 from .components_registry import get_component_by_name
 from bpy.app.handlers import persistent
-from math import radians
+from math import radians, sqrt
 from mathutils import Matrix
+import numpy as np
+
+# Gizmo model name -> custom shape (batch, shader)
+custom_shapes = {}
+# Gizmo model name -> distance of its farthest vertex from the origin
+custom_shape_radii = {}
+POINT_SHAPE_NAME = "__point__"
+POINT_SIZE = 6.0
+# Distance of the corners of the unit plane drawn by the primitive gizmos from their origin.
+PRIMITIVE_SHAPE_RADIUS = sqrt(2.0)
+
+# Cull states of the gizmos
+CULL_UNKNOWN = -1
+CULL_VISIBLE = 0
+CULL_POINT = 1
+CULL_HIDDEN = 2
 
 
 def gizmo_update(obj, gizmo):
     gizmo.matrix_basis = obj.matrix_world.normalized()
 
 
+def new_indexed_custom_shape(shape):
+    '''Like Gizmo.new_custom_shape but for an indexed triangle list of (vertices, triangles),
+    the vertex and index buffers are filled directly from the model memoryviews.'''
+    import gpu
+    from gpu.types import GPUBatch, GPUIndexBuf, GPUVertBuf, GPUVertFormat
+    vertices, triangles = shape
+    vertex_format = GPUVertFormat()
+    pos_id = vertex_format.attr_add(id="pos", comp_type='F32', len=3, fetch_mode='FLOAT')
+    vbo = GPUVertBuf(len=len(vertices), format=vertex_format)
+    vbo.attr_fill(id=pos_id, data=vertices)
+    ibo = GPUIndexBuf(type='TRIS', seq=triangles)
+    batch = GPUBatch(type='TRIS', buf=vbo, elem=ibo)
+    shader = gpu.shader.from_builtin('UNIFORM_COLOR' if bpy.app.version >= (3, 4, 0) else '3D_UNIFORM_COLOR')
+    batch.program_set(shader)
+    return (batch, shader)
+
+
+def get_custom_shape(name):
+    '''Returns the custom shape of the gizmo model. It's uploaded to the GPU once and shared by all the gizmos
+    drawing that model, each of them draws it with its own matrix.'''
+    shape = custom_shapes.get(name)
+    if shape is None:
+        from .models import load_gizmo_shape
+        shape = new_indexed_custom_shape(load_gizmo_shape(name))
+        custom_shapes[name] = shape
+
+    return shape
+
+
+def get_custom_shape_radius(name):
+    radius = custom_shape_radii.get(name)
+    if radius is None:
+        from .models import load_gizmo_shape
+        vertices, _ = load_gizmo_shape(name)
+        radius = float(np.linalg.norm(np.asarray(vertices), axis=1).max()) if len(vertices) else 0.0
+        custom_shape_radii[name] = radius
+
+    return radius
+
+
+def get_gizmo_shape_radius(gizmo):
+    '''Returns the bounding radius of the shape a gizmo draws, before it's scaled by the gizmo's matrix.'''
+    shape_name = getattr(gizmo, "hubs_gizmo_shape", None)
+    if shape_name:
+        return get_custom_shape_radius(shape_name)
+
+    return PRIMITIVE_SHAPE_RADIUS
+
+
+def get_point_shape(gizmo):
+    '''Returns the single point custom shape drawn instead of the gizmo models of far away gizmos.'''
+    shape = custom_shapes.get(POINT_SHAPE_NAME)
+    if shape is None:
+        shape = gizmo.new_custom_shape('POINTS', ((0.0, 0.0, 0.0),))
+        custom_shapes[POINT_SHAPE_NAME] = shape
+
+    return shape
+
+
 def bone_matrix_world(ob, bone, scaleOverride=None):
     loc, rot, scale = bone.matrix.to_4x4().decompose()
     # Account for bones using Y up
@@ -33,18 +108,31 @@ class CustomModelGizmo(Gizmo):
         "object",
         "hubs_gizmo_shape",
         "custom_shape",
+        "draw_as_point",
     )
 
+    def draw_point(self, select_id=None):
+        import gpu
+        gpu.state.point_size_set(POINT_SIZE)
+        self.draw_custom_shape(get_point_shape(self), select_id=select_id)
+        gpu.state.point_size_set(1.0)
+
     def draw(self, context):
-        self.draw_custom_shape(self.custom_shape)
+        if self.draw_as_point:
+            self.draw_point()
+        else:
+            self.draw_custom_shape(self.custom_shape)
 
     def draw_select(self, context, select_id):
-        self.draw_custom_shape(self.custom_shape, select_id=select_id)
+        if self.draw_as_point:
+            self.draw_point(select_id=select_id)
+        else:
+            self.draw_custom_shape(self.custom_shape, select_id=select_id)
 
     def setup(self):
+        self.draw_as_point = False
         if hasattr(self, "hubs_gizmo_shape"):
-            self.custom_shape = self.new_custom_shape(
-                'TRIS', self.hubs_gizmo_shape)
+            self.custom_shape = get_custom_shape(self.hubs_gizmo_shape)
 
     def invoke(self, context, event):
         if hasattr(self, "object") and context.mode == 'OBJECT':
@@ -68,10 +156,18 @@ class HubsGizmoGroup(GizmoGroup):
 
     has_widgets = False
     windows_processed = 0
+    # Bumped by update_gizmos, a gizmo group instance that missed the sync of a version syncs on its next refresh.
+    scene_version = 0
+    # Component name -> scene version in which its gizmos were invalidated, they are created again on the next sync.
+    invalidated_components = {}
 
     def add_gizmo(self, ob, host, host_type):
+        added = []
+        host_key = ob.name_full + host.name
         for component_item in host.hubs_component_list.items:
             component_name = component_item.name
+            if host_key in self.widgets.get(component_name, {}):
+                continue
             component_class = get_component_by_name(component_name)
             if not component_class:
                 continue
@@ -80,18 +176,144 @@ class HubsGizmoGroup(GizmoGroup):
                 if component_name not in self.widgets:
                     self.widgets[component_name] = {}
 
-                host_key = ob.name_full + host.name
-                if host_key not in self.widgets[component_name]:
-                    self.widgets[component_name][host_key] = {
-                        'ob': ob,
-                        'host_name': host.name,
-                        'host_type': host_type,
-                        'gizmo': gizmo
-                    }
+                widget = self.widgets[component_name][host_key] = {
+                    'ob': ob,
+                    'host_name': host.name,
+                    'host_type': host_type,
+                    'gizmo': gizmo
+                }
+                added.append((component_name, widget))
+
+        return added
+
+    def get_hosts(self, scene):
+        '''Returns the (object, host, host type) of every object and bone in the scene, keyed like the widgets.'''
+        hosts = {}
+        for ob in scene.objects:
+            hosts[ob.name_full + ob.name] = (ob, ob, 'OBJECT')
+            if ob.type == 'ARMATURE':
+                bones = ob.data.edit_bones if ob.mode == 'EDIT' else ob.data.bones
+                for bone in bones:
+                    hosts[ob.name_full + bone.name] = (ob, bone, 'BONE')
+
+        return hosts
+
+    def sync_widgets(self, scene):
+        '''Removes the gizmos of the hosts and components that are gone and adds the gizmos of the new ones.
+        The gizmos of the unchanged hosts are kept, only their object references are renewed as they don't survive undo.
+        It's called by update_gizmos outside of drawing, so the new gizmos are placed here rather than on the next refresh.'''
+        hosts = self.get_hosts(scene)
+        added = []
+        for component_name, component_widgets in self.widgets.items():
+            is_invalidated = HubsGizmoGroup.invalidated_components.get(component_name, -1) > self.scene_version
+            for host_key, widget in list(component_widgets.items()):
+                ob, host, _ = hosts.get(host_key, (None, None, None))
+                if is_invalidated or not host or host.hubs_component_list.items.find(component_name) == -1:
+                    self.gizmos.remove(widget['gizmo'])
+                    del component_widgets[host_key]
+                else:
+                    widget['ob'] = ob
+                    if hasattr(widget['gizmo'], "object"):
+                        widget['gizmo'].object = host
+
+        for ob, host, host_type in hosts.values():
+            added += self.add_gizmo(ob, host, host_type)
+
+        self.scene_version = HubsGizmoGroup.scene_version
+        if any(self.widgets.values()):
+            HubsGizmoGroup.has_widgets = True
+        # The object pointers can change on undo, so the index is rebuilt even if no gizmos were added or removed.
+        self.index_widgets()
+        if not self.update_widgets(added):
+            self.refresh_all = True
+
+    def index_widgets(self):
+        '''Indexes the widgets by the pointer of their object, so a refresh only visits the widgets of the moved objects.
+        Pointers are used because they don't change when objects are renamed.'''
+        self.object_widgets = {}
+        self.cull_widgets = []
+        for component_name, component_widgets in self.widgets.items():
+            for widget in component_widgets.values():
+                self.object_widgets.setdefault(widget['ob'].as_pointer(), []).append((component_name, widget))
+                widget['cull_index'] = len(self.cull_widgets)
+                self.cull_widgets.append(widget)
+
+        count = len(self.cull_widgets)
+        self.cull_centers = np.zeros((count, 3), dtype=np.float32)
+        self.cull_radii = np.zeros(count, dtype=np.float32)
+        self.cull_states = np.full(count, CULL_UNKNOWN, dtype=np.int8)
+        self.can_draw_points = np.array(
+            [isinstance(widget['gizmo'], CustomModelGizmo) for widget in self.cull_widgets], dtype=bool)
+        for widget in self.cull_widgets:
+            gizmo = widget['gizmo']
+            widget['radius'] = get_gizmo_shape_radius(gizmo)
+            # New gizmos haven't been culled yet, so they are only hidden by their host.
+            widget.setdefault('hidden', gizmo.hide)
+            self.update_cull_bounds(widget)
+
+    def update_cull_bounds(self, widget):
+        '''Stores the bounding sphere of the gizmo after its matrix was updated, the radius of its shape scaled
+        by the largest scale of its basis matrix and by its basis scale, like the shape is drawn.'''
+        gizmo = widget['gizmo']
+        matrix = gizmo.matrix_basis
+        index = widget['cull_index']
+        scale = max(matrix.col[i].xyz.length for i in range(3)) * gizmo.scale_basis
+        self.cull_centers[index] = matrix.translation
+        self.cull_radii[index] = widget['radius'] * scale
+        self.cull_states[index] = CULL_UNKNOWN
+
+    def get_cull_states(self, context):
+        '''Returns the cull state of every gizmo: hidden outside the view frustum or beyond the draw distance,
+        drawn as a point beyond the draw distance if enabled, otherwise visible. The gizmos are tested at once
+        against the frustum planes of the view, so orbiting the view doesn't go through the gizmos one by one.'''
+        from ..preferences import get_addon_pref
+        prefs = get_addon_pref(context)
+        states = np.full(len(self.cull_widgets), CULL_VISIBLE, dtype=np.int8)
+        region_data = context.region_data
+        if not region_data:
+            return states
+
+        if prefs.cull_gizmos:
+            # Frustum planes from the rows of the perspective matrix, pointing inwards.
+            matrix = np.array(region_data.perspective_matrix, dtype=np.float64)
+            planes = np.array([matrix[3] + matrix[0], matrix[3] - matrix[0],
+                               matrix[3] + matrix[1], matrix[3] - matrix[1],
+                               matrix[3] + matrix[2], matrix[3] - matrix[2]])
+            planes /= np.maximum(np.linalg.norm(planes[:, :3], axis=1), 1e-12)[:, np.newaxis]
+            distances = self.cull_centers @ planes[:, :3].T + planes[:, 3]
+            states[np.any(distances < -self.cull_radii[:, np.newaxis], axis=1)] = CULL_HIDDEN
+
+        if prefs.gizmo_draw_distance and region_data.is_perspective:
+            view_location = np.array(region_data.view_matrix.inverted().translation, dtype=np.float32)
+            distances = np.linalg.norm(self.cull_centers - view_location, axis=1) - self.cull_radii
+            is_far = (distances > prefs.gizmo_draw_distance) & (states == CULL_VISIBLE)
+            states[is_far] = CULL_HIDDEN
+            if prefs.draw_far_gizmos_as_points:
+                states[is_far & self.can_draw_points] = CULL_POINT
+
+        return states
+
+    def cull_gizmos(self, context):
+        if not self.cull_widgets:
+            return
+
+        states = self.get_cull_states(context)
+        for index in np.nonzero(states != self.cull_states)[0]:
+            widget = self.cull_widgets[index]
+            gizmo = widget['gizmo']
+            state = int(states[index])
+            gizmo.hide = widget['hidden'] or state == CULL_HIDDEN
+            if self.can_draw_points[index]:
+                gizmo.draw_as_point = state == CULL_POINT
+
+        self.cull_states = states
 
     def setup(self, context):
         # A new instance of the gizmo group is instantiated, and setup is called once for each instance, for each open window.
         self.widgets = {}
+        self.scene_version = HubsGizmoGroup.scene_version
+        self.refresh_all = True
+        gizmo_groups[context.region.as_pointer()] = self
 
         for ob in context.scene.objects:
             self.add_gizmo(ob, ob, 'OBJECT')
@@ -103,6 +325,7 @@ class HubsGizmoGroup(GizmoGroup):
                     for bone in ob.data.bones:
                         self.add_gizmo(ob, bone, 'BONE')
 
+        self.index_widgets()
         if self.widgets:
             HubsGizmoGroup.has_widgets = True
 
@@ -123,40 +346,116 @@ class HubsGizmoGroup(GizmoGroup):
     def update_bone_gizmo(self, component_name, ob, bone, pose_bone, gizmo):
         self.update_gizmo(component_name, ob, pose_bone, bone, gizmo)
 
+    def draw_prepare(self, context):
+        # Called on every redraw, so it only updates the visibility of the gizmos from the view.
+        self.cull_gizmos(context)
+
+    def update_widget(self, component_name, widget):
+        gizmo = widget['gizmo']
+        ob = widget['ob']
+        host_name = widget['host_name']
+
+        if widget['host_type'] == 'BONE':
+            # https://docs.blender.org/api/current/info_gotcha.html#editbones-posebones-bone-bones
+            if ob.mode == 'EDIT':
+                edit_bone = ob.data.edit_bones[host_name]
+                self.update_bone_gizmo(
+                    component_name, ob, edit_bone, edit_bone, gizmo)
+            else:
+                bone = ob.data.bones[host_name]
+                pose_bone = ob.pose.bones[host_name]
+                self.update_bone_gizmo(
+                    component_name, ob, bone, pose_bone, gizmo)
+        else:
+            self.update_object_gizmo(
+                component_name, ob, gizmo)
+
+    def update_widgets(self, widgets):
+        '''Updates the matrix and visibility of the widgets, returns False if they are out of sync with the objects.'''
+        for component_name, widget in widgets:
+            try:
+                # Components only hide their gizmos when their host is hidden, so the culling is undone before updating them.
+                widget['gizmo'].hide = widget['hidden']
+                self.update_widget(component_name, widget)
+                widget['hidden'] = widget['gizmo'].hide
+                self.update_cull_bounds(widget)
+
+            except (ReferenceError, KeyError):
+                # ReferenceErrors shouldn't happen, but if objects and widgets have gotten out of sync refresh the whole system.
+                # KeyErrors can happen when an object's armature is changed, so refresh the whole system for this as well.
+                return False
+
+        return True
+
     def refresh(self, context):
-        for component_name in self.widgets:
-            component_widgets = self.widgets[component_name].copy()
-            for widget in component_widgets.values():
-                gizmo = widget['gizmo']
-                ob = widget['ob']
-                host_name = widget['host_name']
-
-                try:
-                    if widget['host_type'] == 'BONE':
-                        # https://docs.blender.org/api/current/info_gotcha.html#editbones-posebones-bone-bones
-                        if ob.mode == 'EDIT':
-                            edit_bone = ob.data.edit_bones[host_name]
-                            self.update_bone_gizmo(
-                                component_name, ob, edit_bone, edit_bone, gizmo)
-                        else:
-                            bone = ob.data.bones[host_name]
-                            pose_bone = ob.pose.bones[host_name]
-                            self.update_bone_gizmo(
-                                component_name, ob, bone, pose_bone, gizmo)
-                    else:
-                        self.update_object_gizmo(
-                            component_name, ob, gizmo)
-
-                except (ReferenceError, KeyError):
-                    # ReferenceErrors shouldn't happen, but if objects and widgets have gotten out of sync refresh the whole system.
-                    # KeyErrors can happen when an object's armature is changed, so refresh the whole system for this as well.
-                    bpy.app.timers.register(update_gizmos)
-                    return
+        # Regions update_gizmos couldn't reach, like the ones of inactive workspaces, sync when they are shown again.
+        if self.scene_version != HubsGizmoGroup.scene_version:
+            self.sync_widgets(context.scene)
+
+        # Only the gizmos of the objects that changed since the last refresh of this region are updated.
+        dirty_pointers = dirty_objects.pop(context.region.as_pointer(), set())
+        if self.refresh_all or dirty_pointers is None:
+            widgets = [(component_name, widget)
+                       for component_name, component_widgets in self.widgets.items()
+                       for widget in component_widgets.values()]
+            self.refresh_all = False
+        else:
+            widgets = [item for pointer in dirty_pointers for item in self.object_widgets.get(pointer, ())]
+
+        if not self.update_widgets(widgets):
+            self.refresh_all = True
+            bpy.app.timers.register(update_gizmos)
 
 
 objects_count = -1
 gizmo_system_registered = False
 msgbus_owners = []
+# 3D view region pointer -> the gizmo group instance drawing in that region
+gizmo_groups = {}
+# 3D view region pointer -> pointers of the objects whose gizmos need to be updated on the next refresh of that region,
+# or None if all of them do.
+dirty_objects = {}
+
+
+def mark_objects_dirty(object_pointers=None):
+    '''Queues the update of the gizmos of the objects in every 3D view, all of them if no objects are passed.'''
+    regions = set()
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            for region in area.regions:
+                if region.type != 'WINDOW':
+                    continue
+                key = region.as_pointer()
+                regions.add(key)
+                if object_pointers is None:
+                    dirty_objects[key] = None
+                elif key not in dirty_objects:
+                    dirty_objects[key] = set(object_pointers)
+                elif dirty_objects[key] is not None:
+                    dirty_objects[key].update(object_pointers)
+
+    # Forget the regions that were closed.
+    for key in list(dirty_objects):
+        if key not in regions:
+            del dirty_objects[key]
+
+
+def get_dirty_objects(depsgraph):
+    '''Returns the pointers of the objects whose gizmos need to be updated after a depsgraph update, None if all of them.
+    Geometry only updates are skipped, except for armatures as posing them moves their bone gizmos.'''
+    object_pointers = set()
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            ob = update.id.original
+            if update.is_updated_transform or not update.is_updated_geometry or ob.type == 'ARMATURE':
+                object_pointers.add(ob.as_pointer())
+        elif isinstance(update.id, (bpy.types.Armature, bpy.types.Collection)):
+            # Edit bones and collection visibility can change the gizmos of objects that aren't in the updates.
+            return None
+
+    return object_pointers
 
 
 def msgbus_callback(*args):
@@ -165,17 +464,29 @@ def msgbus_callback(*args):
 
 @persistent
 def undo_post(dummy):
+    mark_objects_dirty()
     update_gizmos()
 
 
 @persistent
 def redo_post(dummy):
+    mark_objects_dirty()
     update_gizmos()
 
 
 @persistent
-def depsgraph_update_post(dummy):
+def frame_change_post(dummy):
+    # Animated objects aren't part of the depsgraph updates.
+    mark_objects_dirty()
+
+
+@persistent
+def depsgraph_update_post(scene, depsgraph):
     global objects_count
+    object_pointers = get_dirty_objects(depsgraph)
+    if object_pointers is None or object_pointers:
+        mark_objects_dirty(object_pointers)
+
     do_gizmo_update = False
     open_scenes_object_count = 0
     wm = bpy.context.window_manager
@@ -266,6 +577,7 @@ def unregister_gizmo_system():
 
 
 def unregister_gizmos():
+    gizmo_groups.clear()
     try:
         bpy.utils.unregister_class(HubsGizmoGroup)
         bpy.utils.unregister_class(CustomModelGizmo)
@@ -273,12 +585,55 @@ def unregister_gizmos():
         pass
 
 
-def update_gizmos():
+def rebuild_gizmos():
+    '''Recreates all the gizmos by registering the gizmo group again.'''
     global gizmo_system_registered
     unregister_gizmos()
     register_gizmos() if gizmo_system_registered else register_gizmo_system()
 
 
+def update_gizmos(component_name=None):
+    '''Updates the gizmos after components, objects or bones were added, removed or renamed.
+    The running gizmo groups add and remove the gizmos of the changed hosts right away,
+    the gizmo system is only registered again if it isn't running or had nothing to draw.
+    Passing a component name recreates the gizmos of that component, for properties only read when a gizmo is created.'''
+    if not gizmo_system_registered or not HubsGizmoGroup.has_widgets:
+        rebuild_gizmos()
+        return
+
+    HubsGizmoGroup.scene_version += 1
+    if component_name:
+        HubsGizmoGroup.invalidated_components[component_name] = HubsGizmoGroup.scene_version
+
+    sync_gizmo_groups()
+
+
+def sync_gizmo_groups():
+    '''Syncs the gizmos of the 3D views of every window with the scene of that window.'''
+    synced = set()
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            for region in area.regions:
+                key = region.as_pointer()
+                if region.type == 'WINDOW' and key in gizmo_groups:
+                    synced.add(key)
+                    try:
+                        gizmo_groups[key].sync_widgets(window.scene)
+                    except ReferenceError:
+                        # The gizmo group was freed with its region and the pointer reused by a new region.
+                        del gizmo_groups[key]
+            area.tag_redraw()
+
+    # The gizmo groups of hidden screens sync on their next refresh, only the ones freed with their region are dropped.
+    for key in [key for key in gizmo_groups if key not in synced]:
+        try:
+            gizmo_groups[key].gizmos
+        except ReferenceError:
+            del gizmo_groups[key]
+
+
 def register_functions():
     def register():
         global objects_count
@@ -289,6 +644,8 @@ def register_functions():
         if depsgraph_update_post not in bpy.app.handlers.depsgraph_update_post:
             bpy.app.handlers.depsgraph_update_post.append(
                 depsgraph_update_post)
+        if frame_change_post not in bpy.app.handlers.frame_change_post:
+            bpy.app.handlers.frame_change_post.append(frame_change_post)
 
         bpy.types.Armature.hubs_old_bones_length = IntProperty(
             options={'HIDDEN', 'SKIP_SAVE'})
@@ -301,8 +658,12 @@ def register_functions():
         if depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
             bpy.app.handlers.depsgraph_update_post.remove(
                 depsgraph_update_post)
+        if frame_change_post in bpy.app.handlers.frame_change_post:
+            bpy.app.handlers.frame_change_post.remove(frame_change_post)
 
         unregister_gizmo_system()
+        custom_shapes.clear()
+        dirty_objects.clear()
 
         del bpy.types.Armature.hubs_old_bones_length
 
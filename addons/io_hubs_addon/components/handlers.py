@@ -1,7 +1,9 @@
 import bpy
 from bpy.app.handlers import persistent
 from .components_registry import get_components_registry
-from .utils import redirect_c_stdout, get_host_components, is_linked, get_host_reference_message, has_component
+from .utils import (
+    redirect_c_stdout, get_host_components, build_host_index, is_linked, get_host_reference_message, has_component
+)
 from .gizmos import update_gizmos
 from .types import MigrationType, PanelType
 import io
@@ -14,6 +16,8 @@ previous_window_setups = []
 file_loading = False
 msgbus_owners = []
 object_data_switched = False
+# The report of the migration done when the current file was loaded.
+load_migration_report = []
 
 
 def migrate(component, migration_type, panel_type, host, migration_report, ob=None):
@@ -56,106 +60,39 @@ def migrate_components(
         override_report_title=""):
     migration_report = []
     migrated_linked_components = []
-    armature_objects = {}
     link_migration_occurred = False
     display_registration_message = False
 
     if do_beta_versioning:
         display_registration_message |= handle_beta_versioning()
 
-    for scene in bpy.data.scenes:
-        for component in get_host_components(scene):
-            if not has_component(scene, component.get_name()):
-                # The component was removed in a previous migration
-                continue
-            try:
-                was_migrated = migrate(
-                    component, migration_type, PanelType.SCENE, scene, migration_report)
-            except Exception as e:
-                was_migrated = True
-                error = f"Error: Migration failed for component {component.get_display_name()} on scene \"{scene.name_full}\""
-                migration_report.append(f"{error}\n{e} (See Blender's console for details)")
-                print(error)
-                traceback.print_exc()
-
-            display_registration_message |= was_migrated
-            if was_migrated and is_linked(scene):
-                link_migration_occurred = True
-                component_info = f"{component.get_display_name()} component on scene \"{scene.name_full}\""
-                migrated_linked_components.append(component_info)
-
     for ob in bpy.data.objects:
-        for component in get_host_components(ob):
-            if not has_component(ob, component.get_name()):
-                # The component was removed in a previous migration
-                continue
-            try:
-                was_migrated = migrate(
-                    component, migration_type, PanelType.OBJECT, ob, migration_report, ob=ob)
-            except Exception as e:
-                was_migrated = True
-                error = f"Error: Migration failed for component {component.get_display_name()} on object \"{ob.name_full}\""
-                migration_report.append(f"{error}\n{e} (See Blender's console for details)")
-                print(error)
-                traceback.print_exc()
-
-            display_registration_message |= was_migrated
-            if was_migrated and is_linked(ob):
-                link_migration_occurred = True
-                component_info = f"{component.get_display_name()} component on object \"{ob.name_full}\""
-                migrated_linked_components.append(component_info)
-
-        if ob.type == 'ARMATURE':
-            if ob.mode == 'EDIT':
-                ob.update_from_editmode()
-
-            armature_name = ob.data.name_full
-            if armature_name not in armature_objects:
-                # Store the first object to use this armature for later when armatures are migrated (armatures can only be migrated once anyway)
-                armature_objects[armature_name] = ob
-
-    for armature in bpy.data.armatures:
-        ob = armature_objects.get(armature.name_full, armature)
-        for bone in armature.bones:
-            for component in get_host_components(bone):
-                if not has_component(bone, component.get_name()):
-                    # The component was removed in a previous migration
-                    continue
-                try:
-                    was_migrated = migrate(
-                        component, migration_type, PanelType.BONE, bone, migration_report, ob=ob)
-                except Exception as e:
-                    was_migrated = True
-                    error = f"Error: Migration failed for component {component.get_display_name()} on bone \"{bone.name}\" in \"{ob.name_full}\""
-                    migration_report.append(f"{error}\n{e} (See Blender's console for details)")
-                    print(error)
-                    traceback.print_exc()
-
-                display_registration_message |= was_migrated
-                if was_migrated and is_linked(ob):
-                    link_migration_occurred = True
-                    component_info = f"{component.get_display_name()} component on bone \"{bone.name}\" in \"{ob.name_full}\""
-                    migrated_linked_components.append(component_info)
-
-    for material in bpy.data.materials:
-        for component in get_host_components(material):
-            if not has_component(material, component.get_name()):
-                # The component was removed in a previous migration
+        if ob.type == 'ARMATURE' and ob.mode == 'EDIT':
+            # Sync the edit bones before the bones are indexed.
+            ob.update_from_editmode()
+
+    for entry in build_host_index()['entries']:
+        host = entry['host']
+        panel_type = entry['panel_type']
+        ob = entry['ob']
+        for component_name, component_class, component in entry['components']:
+            if not component_class or not has_component(host, component_name):
+                # The component isn't registered or was removed in a previous migration
                 continue
             try:
                 was_migrated = migrate(
-                    component, migration_type, PanelType.MATERIAL, material, migration_report)
+                    component, migration_type, panel_type, host, migration_report, ob=ob)
             except Exception as e:
                 was_migrated = True
-                error = f"Error: Migration failed for component {component.get_display_name()} on material \"{material.name_full}\""
+                error = f"Error: Migration failed for component {component.get_display_name()} on {panel_type.value} {get_host_reference_message(panel_type, host, ob=ob)}"
                 migration_report.append(f"{error}\n{e} (See Blender's console for details)")
                 print(error)
                 traceback.print_exc()
 
             display_registration_message |= was_migrated
-            if was_migrated and is_linked(material):
+            if was_migrated and is_linked(ob if panel_type == PanelType.BONE else host):
                 link_migration_occurred = True
-                component_info = f"{component.get_display_name()} component on material \"{material.name_full}\""
+                component_info = f"{component.get_display_name()} component on {panel_type.value} {get_host_reference_message(panel_type, host, ob=ob)}"
                 migrated_linked_components.append(component_info)
 
     if do_update_gizmos:
@@ -180,6 +117,8 @@ def migrate_components(
             bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title=title, report_string='\n\n'.join(migration_report))
         bpy.app.timers.register(report_migration)
 
+    return migration_report
+
 
 def version_beta_components():
     for scene in bpy.data.scenes:
@@ -223,12 +162,13 @@ def load_post(dummy):
     global previous_undo_step_index
     global previous_window_setups
     global file_loading
+    global load_migration_report
     previous_undo_steps_dump = ""
     previous_undo_step_index = 0
     previous_window_setups = []
     file_loading = True
 
-    migrate_components(MigrationType.GLOBAL, do_beta_versioning=True)
+    load_migration_report = migrate_components(MigrationType.GLOBAL, do_beta_versioning=True)
     register_msgbus()
 
 
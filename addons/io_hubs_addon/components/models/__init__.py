@@ -0,0 +1,45 @@
+import struct
+import sys
+from array import array
+from os.path import join, dirname, realpath
+
+# Gizmo model files, written by scripts/export_gizmo.py:
+# a header with the magic, the vertex count and the index count, followed by the vertex positions
+# as little endian float32 triplets and the triangle vertex indices as little endian uint32.
+GIZMO_SHAPE_MAGIC = b'HGZ1'
+GIZMO_SHAPE_HEADER = struct.Struct('<4sII')
+
+__gizmo_shapes = {}
+
+
+def read_gizmo_shape(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    magic, vertex_count, index_count = GIZMO_SHAPE_HEADER.unpack_from(data)
+    if magic != GIZMO_SHAPE_MAGIC or index_count % 3:
+        raise ValueError(f"{path} is not a gizmo model file")
+
+    vertices_offset = GIZMO_SHAPE_HEADER.size
+    indices_offset = vertices_offset + vertex_count * 3 * 4
+    vertices = array('f')
+    vertices.frombytes(data[vertices_offset:indices_offset])
+    indices = array('I')
+    indices.frombytes(data[indices_offset:indices_offset + index_count * 4])
+    if sys.byteorder == 'big':
+        vertices.byteswap()
+        indices.byteswap()
+
+    return (memoryview(vertices).cast('B').cast('f', (vertex_count, 3)),
+            memoryview(indices).cast('B').cast('I', (index_count // 3, 3)))
+
+
+def load_gizmo_shape(name):
+    '''Returns the (vertices, triangles) of the gizmo model as memoryviews, ready to be uploaded to the GPU.
+    The model file is only read the first time a gizmo uses it.'''
+    shape = __gizmo_shapes.get(name)
+    if shape is None:
+        shape = read_gizmo_shape(join(dirname(realpath(__file__)), name + ".bin"))
+        __gizmo_shapes[name] = shape
+
+    return shape
@@ -1 +0,0 @@
-SHAPE = ((0.000000, 0.181373, 0.036077),(0.128250, 0.128250, -0.036077),(0.000000, 0.181373, -0.036077),(-0.072648, 0.072648, -0.153760),(0.000000, 0.036077, -0.181373),(-0.025510, 0.025511, -0.181373),(0.128250, 0.128250, 0.036077),(0.000000, 0.153760, 0.102740),(0.108725, 0.108725, 0.102740),(0.025511, 0.025510, -0.181373),(0.000000, 0.102739, -0.153760),(0.072648, 0.072648, -0.153760),(0.181373, -0.000000, -0.036077),(0.128250, -0.128250, 0.036077),(0.128250, -0.128250, -0.036077),(0.000000, 0.153760, 0.102740),(-0.072648, 0.072648, 0.153761),(0.000000, 0.102739, 0.153761),(0.000000, 0.102739, 0.153761),(0.025511, 0.025510, 0.181373),(0.072648, 0.072648, 0.153761),(0.102739, -0.000000, 0.153761),(0.025510, -0.025511, 0.181373),(0.072648, -0.072648, 0.153761),(0.000000, 0.153760, 0.102740),(0.072648, 0.072648, 0.153761),(0.108725, 0.108725, 0.102740),(0.000000, 0.181373, 0.036077),(-0.108725, 0.108725, 0.102740),(0.000000, 0.153760, 0.102740),(0.181373, -0.000000, 0.036077),(0.108725, -0.108725, 0.102740),(0.128250, -0.128250, 0.036077),(0.128250, 0.128250, -0.036077),(0.181373, -0.000000, 0.036077),(0.181373, -0.000000, -0.036077),(0.000000, -0.000000, 0.184926),(0.036077, -0.000000, 0.181373),(0.025511, 0.025510, 0.181373),(0.108725, 0.108725, 0.102740),(0.102739, -0.000000, 0.153761),(0.153760, -0.000000, 0.102740),(0.025511, 0.025510, -0.181373),(0.102739, -0.000000, -0.153760),(0.036077, -0.000000, -0.181373),(0.000000, 0.181373, -0.036077),(0.108725, 0.108725, -0.102739),(0.000000, 0.153760, -0.102739),(-0.072648, 0.072648, 0.153761),(0.000000, 0.036077, 0.181373),(0.000000, 0.102739, 0.153761),(0.000000, -0.000000, -0.184926),(0.000000, 0.036077, -0.181373),(0.025511, 0.025510, -0.181373),(0.153760, -0.000000, -0.102739),(0.128250, -0.128250, -0.036077),(0.108725, -0.108725, -0.102739),(0.108725, -0.108725, 0.102740),(0.102739, -0.000000, 0.153761),(0.072648, -0.072648, 0.153761),(0.128250, -0.128250, -0.036077),(-0.000000, -0.181373, 0.036077),(-0.000000, -0.181373, -0.036077),(0.102739, -0.000000, -0.153760),(0.108725, -0.108725, -0.102739),(0.072648, -0.072648, -0.153760),(0.000000, -0.000000, -0.184926),(0.025511, 0.025510, -0.181373),(0.036077, -0.000000, -0.181373),(0.072648, -0.072648, 0.153761),(-0.000000, -0.036077, 0.181373),(-0.000000, -0.102739, 0.153761),(0.036077, -0.000000, -0.181373),(0.072648, -0.072648, -0.153760),(0.025510, -0.025511, -0.181373),(0.128250, -0.128250, 0.036077),(-0.000000, -0.153760, 0.102740),(-0.000000, -0.181373, 0.036077),(0.000000, -0.000000, 0.184926),(0.025510, -0.025511, 0.181373),(0.036077, -0.000000, 0.181373),(-0.000000, -0.153760, 0.102740),(0.072648, -0.072648, 0.153761),(-0.000000, -0.102739, 0.153761),(-0.000000, -0.181373, -0.036077),(-0.128250, -0.128250, 0.036077),(-0.128250, -0.128250, -0.036077),(0.108725, -0.108725, -0.102739),(-0.000000, -0.181373, -0.036077),(-0.000000, -0.153760, -0.102739),(0.000000, -0.000000, -0.184926),(0.036077, -0.000000, -0.181373),(0.025510, -0.025511, -0.181373),(-0.000000, -0.102739, 0.153761),(-0.025511, -0.025510, 0.181373),(-0.072648, -0.072648, 0.153761),(0.025510, -0.025511, -0.181373),(-0.000000, -0.102739, -0.153760),(-0.000000, -0.036077, -0.181373),(-0.000000, -0.181373, 0.036077),(-0.108725, -0.108725, 0.102740),(-0.128250, -0.128250, 0.036077),(0.072648, -0.072648, -0.153760),(-0.000000, -0.153760, -0.102739),(-0.000000, -0.102739, -0.153760),(0.000000, -0.000000, 0.184926),(-0.000000, -0.036077, 0.181373),(0.025510, -0.025511, 0.181373),(-0.000000, -0.153760, 0.102740),(-0.072648, -0.072648, 0.153761),(-0.108725, -0.108725, 0.102740),(-0.128250, -0.128250, -0.036077),(-0.181373, 0.000000, 0.036077),(-0.181373, 0.000000, -0.036077),(-0.000000, -0.153760, -0.102739),(-0.128250, -0.128250, -0.036077),(-0.108725, -0.108725, -0.102739),(0.000000, -0.000000, -0.184926),(0.025510, -0.025511, -0.181373),(-0.000000, -0.036077, -0.181373),(-0.108725, -0.108725, 0.102740),(-0.102739, 0.000000, 0.153761),(-0.153760, 0.000000, 0.102740),(-0.000000, -0.036077, -0.181373),(-0.072648, -0.072648, -0.153760),(-0.025511, -0.025510, -0.181373),(-0.128250, -0.128250, 0.036077),(-0.153760, 0.000000, 0.102740),(-0.181373, 0.000000, 0.036077),(-0.000000, -0.102739, -0.153760),(-0.108725, -0.108725, -0.102739),(-0.072648, -0.072648, -0.153760),(-0.102739, 0.000000, 0.153761),(-0.025511, -0.025510, 0.181373),(-0.036077, 0.000000, 0.181373),(0.000000, -0.000000, 0.184926),(-0.025511, -0.025510, 0.181373),(-0.000000, -0.036077, 0.181373),(-0.181373, 0.000000, -0.036077),(-0.128250, 0.128250, 0.036077),(-0.128250, 0.128250, -0.036077),(-0.102739, 0.000000, -0.153760),(-0.108725, -0.108725, -0.102739),(-0.153760, 0.000000, -0.102739),(-0.108725, -0.108725, -0.102739),(-0.181373, 0.000000, -0.036077),(-0.153760, 0.000000, -0.102739),(-0.025511, -0.025510, -0.181373),(-0.102739, 0.000000, -0.153760),(-0.036077, 0.000000, -0.181373),(-0.181373, 0.000000, 0.036077),(-0.108725, 0.108725, 0.102740),(-0.128250, 0.128250, 0.036077),(-0.072648, 0.072648, 0.153761),(-0.036077, 0.000000, 0.181373),(-0.025510, 0.025511, 0.181373),(0.000000, -0.000000, 0.184926),(-0.036077, 0.000000, 0.181373),(-0.025511, -0.025510, 0.181373),(0.000000, -0.000000, -0.184926),(-0.000000, -0.036077, -0.181373),(-0.025511, -0.025510, -0.181373),(-0.128250, 0.128250, 0.036077),(0.000000, 0.181373, -0.036077),(-0.128250, 0.128250, -0.036077),(-0.102739, 0.000000, -0.153760),(-0.108725, 0.108725, -0.102739),(-0.072648, 0.072648, -0.153760),(-0.153760, 0.000000, -0.102739),(-0.128250, 0.128250, -0.036077),(-0.108725, 0.108725, -0.102739),(-0.153760, 0.000000, 0.102740),(-0.072648, 0.072648, 0.153761),(-0.108725, 0.108725, 0.102740),(0.000000, -0.000000, 0.184926),(-0.025510, 0.025511, 0.181373),(-0.036077, 0.000000, 0.181373),(-0.036077, 0.000000, -0.181373),(-0.072648, 0.072648, -0.153760),(-0.025510, 0.025511, -0.181373),(0.000000, -0.000000, -0.184926),(-0.025511, -0.025510, -0.181373),(-0.036077, 0.000000, -0.181373),(-0.108725, 0.108725, -0.102739),(0.000000, 0.102739, -0.153760),(-0.072648, 0.072648, -0.153760),(-0.128250, 0.128250, -0.036077),(0.000000, 0.153760, -0.102739),(-0.108725, 0.108725, -0.102739),(0.000000, -0.000000, -0.184926),(-0.025510, 0.025511, -0.181373),(0.000000, 0.036077, -0.181373),(0.000000, -0.000000, 0.184926),(0.000000, 0.036077, 0.181373),(-0.025510, 0.025511, 0.181373),(0.000000, -0.000000, -0.184926),(-0.036077, 0.000000, -0.181373),(-0.025510, 0.025511, -0.181373),(0.153760, -0.000000, -0.102739),(0.128250, 0.128250, -0.036077),(0.181373, -0.000000, -0.036077),(0.000000, 0.153760, -0.102739),(0.072648, 0.072648, -0.153760),(0.000000, 0.102739, -0.153760),(0.102739, -0.000000, 0.153761),(0.025511, 0.025510, 0.181373),(0.036077, -0.000000, 0.181373),(0.072648, 0.072648, -0.153760),(0.153760, -0.000000, -0.102739),(0.102739, -0.000000, -0.153760),(0.000000, -0.000000, 0.184926),(0.025511, 0.025510, 0.181373),(0.000000, 0.036077, 0.181373),(0.128250, 0.128250, 0.036077),(0.153760, -0.000000, 0.102740),(0.181373, -0.000000, 0.036077),(0.000000, -0.032030, 0.501351),(0.000000, 0.000000, 0.232005),(0.022648, -0.022648, 0.501351),(0.022648, -0.022648, 0.501351),(0.000000, 0.000000, 0.232005),(0.032030, -0.000000, 0.501351),(0.032030, -0.000000, 0.501351),(0.000000, 0.000000, 0.232005),(0.022648, 0.022648, 0.501351),(0.022648, 0.022648, 0.501351),(0.000000, 0.000000, 0.232005),(0.000000, 0.032030, 0.501351),(0.000000, 0.032030, 0.501351),(0.000000, 0.000000, 0.232005),(-0.022648, 0.022648, 0.501351),(-0.022648, 0.022648, 0.501351),(0.000000, 0.000000, 0.232005),(-0.032030, -0.000000, 0.501351),(-0.032030, -0.000000, 0.501351),(0.000000, 0.000000, 0.232005),(-0.022648, -0.022648, 0.501351),(-0.022648, -0.022648, 0.501351),(0.000000, 0.000000, 0.232005),(0.000000, -0.032030, 0.501351),(0.000000, -0.032030, -0.501351),(0.022648, -0.022648, -0.501351),(0.000000, -0.000000, -0.232005),(0.022648, -0.022648, -0.501351),(0.032030, 0.000000, -0.501351),(0.000000, -0.000000, -0.232005),(0.032030, 0.000000, -0.501351),(0.022648, 0.022648, -0.501351),(0.000000, -0.000000, -0.232005),(0.022648, 0.022648, -0.501351),(0.000000, 0.032030, -0.501351),(0.000000, -0.000000, -0.232005),(0.000000, 0.032030, -0.501351),(-0.022648, 0.022648, -0.501351),(0.000000, -0.000000, -0.232005),(-0.022648, 0.022648, -0.501351),(-0.032030, 0.000000, -0.501351),(0.000000, -0.000000, -0.232005),(-0.032030, 0.000000, -0.501351),(-0.022648, -0.022648, -0.501351),(0.000000, -0.000000, -0.232005),(-0.022648, -0.022648, -0.501351),(0.000000, -0.032030, -0.501351),(0.000000, -0.000000, -0.232005),(0.501351, -0.032030, 0.000000),(0.232005, 0.000000, -0.000000),(0.501351, -0.022648, -0.022648),(0.501351, -0.022648, -0.022648),(0.232005, 0.000000, -0.000000),(0.501351, -0.000000, -0.032030),(0.501351, -0.000000, -0.032030),(0.232005, 0.000000, -0.000000),(0.501351, 0.022648, -0.022648),(0.501351, 0.022648, -0.022648),(0.232005, 0.000000, -0.000000),(0.501351, 0.032030, 0.000000),(0.501351, 0.032030, 0.000000),(0.232005, 0.000000, -0.000000),(0.501351, 0.022648, 0.022648),(0.501351, 0.022648, 0.022648),(0.232005, 0.000000, -0.000000),(0.501351, -0.000000, 0.032030),(0.501351, -0.000000, 0.032030),(0.232005, 0.000000, -0.000000),(0.501351, -0.022648, 0.022648),(0.501351, -0.022648, 0.022648),(0.232005, 0.000000, -0.000000),(0.501351, -0.032030, 0.000000),(-0.501351, -0.032029, -0.000000),(-0.501351, -0.022648, -0.022648),(-0.232005, 0.000000, 0.000000),(-0.501351, -0.022648, -0.022648),(-0.501351, 0.000000, -0.032030),(-0.232005, 0.000000, 0.000000),(-0.501351, 0.000000, -0.032030),(-0.501351, 0.022649, -0.022648),(-0.232005, 0.000000, 0.000000),(-0.501351, 0.022649, -0.022648),(-0.501351, 0.032030, -0.000000),(-0.232005, 0.000000, 0.000000),(-0.501351, 0.032030, -0.000000),(-0.501351, 0.022649, 0.022648),(-0.232005, 0.000000, 0.000000),(-0.501351, 0.022649, 0.022648),(-0.501351, 0.000000, 0.032030),(-0.232005, 0.000000, 0.000000),(-0.501351, 0.000000, 0.032030),(-0.501351, -0.022648, 0.022648),(-0.232005, 0.000000, 0.000000),(-0.501351, -0.022648, 0.022648),(-0.501351, -0.032029, -0.000000),(-0.232005, 0.000000, 0.000000),(-0.370524, -0.022648, -0.338494),(-0.354509, -0.032030, -0.354509),(-0.164052, -0.000000, -0.164052),(-0.377158, -0.000000, -0.331861),(-0.370524, -0.022648, -0.338494),(-0.164052, -0.000000, -0.164052),(-0.370524, 0.022648, -0.338494),(-0.377158, -0.000000, -0.331861),(-0.164052, -0.000000, -0.164052),(-0.354509, 0.032030, -0.354509),(-0.370524, 0.022648, -0.338494),(-0.164052, -0.000000, -0.164052),(-0.338494, 0.022648, -0.370524),(-0.354509, 0.032030, -0.354509),(-0.164052, -0.000000, -0.164052),(-0.331861, -0.000000, -0.377157),(-0.338494, 0.022648, -0.370524),(-0.164052, -0.000000, -0.164052),(-0.338494, -0.022648, -0.370524),(-0.331861, -0.000000, -0.377157),(-0.164052, -0.000000, -0.164052),(-0.354509, -0.032030, -0.354509),(-0.370524, -0.022648, -0.338494),(-0.377158, -0.000000, -0.331861),(-0.377158, -0.000000, -0.331861),(-0.370524, 0.022648, -0.338494),(-0.354509, 0.032030, -0.354509),(-0.354509, 0.032030, -0.354509),(-0.338494, 0.022648, -0.370524),(-0.331861, -0.000000, -0.377157),(-0.331861, -0.000000, -0.377157),(-0.338494, -0.022648, -0.370524),(-0.354509, -0.032030, -0.354509),(-0.354509, -0.032030, -0.354509),(-0.377158, -0.000000, -0.331861),(-0.354509, 0.032030, -0.354509),(-0.354509, 0.032030, -0.354509),(-0.331861, -0.000000, -0.377157),(-0.354509, -0.032030, -0.354509),(-0.015524, -0.417144, 0.000000),(0.000001, -0.417144, 0.017897),(0.000001, -0.156002, 0.029354),(0.000000, 0.181373, 0.036077),(0.128250, 0.128250, 0.036077),(0.128250, 0.128250, -0.036077),(-0.072648, 0.072648, -0.153760),(0.000000, 0.102739, -0.153760),(0.000000, 0.036077, -0.181373),(0.128250, 0.128250, 0.036077),(0.000000, 0.181373, 0.036077),(0.000000, 0.153760, 0.102740),(0.025511, 0.025510, -0.181373),(0.000000, 0.036077, -0.181373),(0.000000, 0.102739, -0.153760),(0.181373, -0.000000, -0.036077),(0.181373, -0.000000, 0.036077),(0.128250, -0.128250, 0.036077),(0.000000, 0.153760, 0.102740),(-0.108725, 0.108725, 0.102740),(-0.072648, 0.072648, 0.153761),(0.000000, 0.102739, 0.153761),(0.000000, 0.036077, 0.181373),(0.025511, 0.025510, 0.181373),(0.102739, -0.000000, 0.153761),(0.036077, -0.000000, 0.181373),(0.025510, -0.025511, 0.181373),(0.000000, 0.153760, 0.102740),(0.000000, 0.102739, 0.153761),(0.072648, 0.072648, 0.153761),(0.000000, 0.181373, 0.036077),(-0.128250, 0.128250, 0.036077),(-0.108725, 0.108725, 0.102740),(0.181373, -0.000000, 0.036077),(0.153760, -0.000000, 0.102740),(0.108725, -0.108725, 0.102740),(0.128250, 0.128250, -0.036077),(0.128250, 0.128250, 0.036077),(0.181373, -0.000000, 0.036077),(0.108725, 0.108725, 0.102740),(0.072648, 0.072648, 0.153761),(0.102739, -0.000000, 0.153761),(0.025511, 0.025510, -0.181373),(0.072648, 0.072648, -0.153760),(0.102739, -0.000000, -0.153760),(0.000000, 0.181373, -0.036077),(0.128250, 0.128250, -0.036077),(0.108725, 0.108725, -0.102739),(-0.072648, 0.072648, 0.153761),(-0.025510, 0.025511, 0.181373),(0.000000, 0.036077, 0.181373),(0.153760, -0.000000, -0.102739),(0.181373, -0.000000, -0.036077),(0.128250, -0.128250, -0.036077),(0.108725, -0.108725, 0.102740),(0.153760, -0.000000, 0.102740),(0.102739, -0.000000, 0.153761),(0.128250, -0.128250, -0.036077),(0.128250, -0.128250, 0.036077),(-0.000000, -0.181373, 0.036077),(0.102739, -0.000000, -0.153760),(0.153760, -0.000000, -0.102739),(0.108725, -0.108725, -0.102739),(0.072648, -0.072648, 0.153761),(0.025510, -0.025511, 0.181373),(-0.000000, -0.036077, 0.181373),(0.036077, -0.000000, -0.181373),(0.102739, -0.000000, -0.153760),(0.072648, -0.072648, -0.153760),(0.128250, -0.128250, 0.036077),(0.108725, -0.108725, 0.102740),(-0.000000, -0.153760, 0.102740),(-0.000000, -0.153760, 0.102740),(0.108725, -0.108725, 0.102740),(0.072648, -0.072648, 0.153761),(-0.000000, -0.181373, -0.036077),(-0.000000, -0.181373, 0.036077),(-0.128250, -0.128250, 0.036077),(0.108725, -0.108725, -0.102739),(0.128250, -0.128250, -0.036077),(-0.000000, -0.181373, -0.036077),(-0.000000, -0.102739, 0.153761),(-0.000000, -0.036077, 0.181373),(-0.025511, -0.025510, 0.181373),(0.025510, -0.025511, -0.181373),(0.072648, -0.072648, -0.153760),(-0.000000, -0.102739, -0.153760),(-0.000000, -0.181373, 0.036077),(-0.000000, -0.153760, 0.102740),(-0.108725, -0.108725, 0.102740),(0.072648, -0.072648, -0.153760),(0.108725, -0.108725, -0.102739),(-0.000000, -0.153760, -0.102739),(-0.000000, -0.153760, 0.102740),(-0.000000, -0.102739, 0.153761),(-0.072648, -0.072648, 0.153761),(-0.128250, -0.128250, -0.036077),(-0.128250, -0.128250, 0.036077),(-0.181373, 0.000000, 0.036077),(-0.000000, -0.153760, -0.102739),(-0.000000, -0.181373, -0.036077),(-0.128250, -0.128250, -0.036077),(-0.108725, -0.108725, 0.102740),(-0.072648, -0.072648, 0.153761),(-0.102739, 0.000000, 0.153761),(-0.000000, -0.036077, -0.181373),(-0.000000, -0.102739, -0.153760),(-0.072648, -0.072648, -0.153760),(-0.128250, -0.128250, 0.036077),(-0.108725, -0.108725, 0.102740),(-0.153760, 0.000000, 0.102740),(-0.000000, -0.102739, -0.153760),(-0.000000, -0.153760, -0.102739),(-0.108725, -0.108725, -0.102739),(-0.102739, 0.000000, 0.153761),(-0.072648, -0.072648, 0.153761),(-0.025511, -0.025510, 0.181373),(-0.181373, 0.000000, -0.036077),(-0.181373, 0.000000, 0.036077),(-0.128250, 0.128250, 0.036077),(-0.102739, 0.000000, -0.153760),(-0.072648, -0.072648, -0.153760),(-0.108725, -0.108725, -0.102739),(-0.108725, -0.108725, -0.102739),(-0.128250, -0.128250, -0.036077),(-0.181373, 0.000000, -0.036077),(-0.025511, -0.025510, -0.181373),(-0.072648, -0.072648, -0.153760),(-0.102739, 0.000000, -0.153760),(-0.181373, 0.000000, 0.036077),(-0.153760, 0.000000, 0.102740),(-0.108725, 0.108725, 0.102740),(-0.072648, 0.072648, 0.153761),(-0.102739, 0.000000, 0.153761),(-0.036077, 0.000000, 0.181373),(-0.128250, 0.128250, 0.036077),(0.000000, 0.181373, 0.036077),(0.000000, 0.181373, -0.036077),(-0.102739, 0.000000, -0.153760),(-0.153760, 0.000000, -0.102739),(-0.108725, 0.108725, -0.102739),(-0.153760, 0.000000, -0.102739),(-0.181373, 0.000000, -0.036077),(-0.128250, 0.128250, -0.036077),(-0.153760, 0.000000, 0.102740),(-0.102739, 0.000000, 0.153761),(-0.072648, 0.072648, 0.153761),(-0.036077, 0.000000, -0.181373),(-0.102739, 0.000000, -0.153760),(-0.072648, 0.072648, -0.153760),(-0.108725, 0.108725, -0.102739),(0.000000, 0.153760, -0.102739),(0.000000, 0.102739, -0.153760),(-0.128250, 0.128250, -0.036077),(0.000000, 0.181373, -0.036077),(0.000000, 0.153760, -0.102739),(0.153760, -0.000000, -0.102739),(0.108725, 0.108725, -0.102739),(0.128250, 0.128250, -0.036077),(0.000000, 0.153760, -0.102739),(0.108725, 0.108725, -0.102739),(0.072648, 0.072648, -0.153760),(0.102739, -0.000000, 0.153761),(0.072648, 0.072648, 0.153761),(0.025511, 0.025510, 0.181373),(0.072648, 0.072648, -0.153760),(0.108725, 0.108725, -0.102739),(0.153760, -0.000000, -0.102739),(0.128250, 0.128250, 0.036077),(0.108725, 0.108725, 0.102740),(0.153760, -0.000000, 0.102740),(-0.501351, -0.032029, -0.000000),(-0.501351, -0.022648, 0.022648),(-0.501351, 0.000000, 0.032030),(-0.501351, 0.000000, 0.032030),(-0.501351, 0.022649, 0.022648),(-0.501351, 0.032030, -0.000000),(-0.501351, 0.032030, -0.000000),(-0.501351, 0.022649, -0.022648),(-0.501351, 0.000000, -0.032030),(-0.501351, 0.000000, -0.032030),(-0.501351, -0.022648, -0.022648),(-0.501351, -0.032029, -0.000000),(-0.501351, -0.032029, -0.000000),(-0.501351, 0.000000, 0.032030),(-0.501351, 0.032030, -0.000000),(-0.501351, 0.032030, -0.000000),(-0.501351, 0.000000, -0.032030),(-0.501351, -0.032029, -0.000000),(-0.354509, -0.032030, -0.354509),(-0.338494, -0.022648, -0.370524),(-0.164052, -0.000000, -0.164052),(0.000000, -0.032030, -0.501351),(-0.022648, -0.022648, -0.501351),(-0.032030, 0.000000, -0.501351),(-0.032030, 0.000000, -0.501351),(-0.022648, 0.022648, -0.501351),(0.000000, 0.032030, -0.501351),(0.000000, 0.032030, -0.501351),(0.022648, 0.022648, -0.501351),(0.032030, 0.000000, -0.501351),(0.032030, 0.000000, -0.501351),(0.022648, -0.022648, -0.501351),(0.000000, -0.032030, -0.501351),(0.000000, -0.032030, -0.501351),(-0.032030, 0.000000, -0.501351),(0.000000, 0.032030, -0.501351),(0.000000, 0.032030, -0.501351),(0.032030, 0.000000, -0.501351),(0.000000, -0.032030, -0.501351),(0.501351, -0.000000, 0.032030),(0.501351, -0.022648, 0.022648),(0.501351, -0.032030, 0.000000),(0.501351, -0.032030, 0.000000),(0.501351, -0.022648, -0.022648),(0.501351, -0.000000, -0.032030),(0.501351, -0.000000, -0.032030),(0.501351, 0.022648, -0.022648),(0.501351, 0.032030, 0.000000),(0.501351, 0.032030, 0.000000),(0.501351, 0.022648, 0.022648),(0.501351, -0.000000, 0.032030),(0.501351, -0.000000, 0.032030),(0.501351, -0.032030, 0.000000),(0.501351, -0.000000, -0.032030),(0.501351, -0.000000, -0.032030),(0.501351, 0.032030, 0.000000),(0.501351, -0.000000, 0.032030),(-0.032030, -0.000000, 0.501351),(-0.022648, -0.022648, 0.501351),(0.000000, -0.032030, 0.501351),(0.000000, -0.032030, 0.501351),(0.022648, -0.022648, 0.501351),(0.032030, -0.000000, 0.501351),(0.032030, -0.000000, 0.501351),(0.022648, 0.022648, 0.501351),(0.000000, 0.032030, 0.501351),(0.000000, 0.032030, 0.501351),(-0.022648, 0.022648, 0.501351),(-0.032030, -0.000000, 0.501351),(-0.032030, -0.000000, 0.501351),(0.000000, -0.032030, 0.501351),(0.032030, -0.000000, 0.501351),(0.032030, -0.000000, 0.501351),(0.000000, 0.032030, 0.501351),(-0.032030, -0.000000, 0.501351),(0.000001, -0.156002, 0.029354),(0.000001, -0.417144, 0.017897),(0.015525, -0.417144, 0.000000),(-0.037686, -0.156002, 0.000000),(-0.015524, -0.417144, 0.000000),(0.000001, -0.156002, 0.029354),(0.037687, -0.156002, 0.000000),(0.000001, -0.156002, 0.029354),(0.015525, -0.417144, 0.000000),(-0.015524, -0.417144, 0.000000),(0.000001, -0.156002, -0.029353),(0.000001, -0.417144, -0.017896),(0.000001, -0.156002, -0.029353),(0.015525, -0.417144, 0.000000),(0.000001, -0.417144, -0.017896),(-0.037686, -0.156002, 0.000000),(0.000001, -0.156002, -0.029353),(-0.015524, -0.417144, 0.000000),(0.037687, -0.156002, 0.000000),(0.015525, -0.417144, 0.000000),(0.000001, -0.156002, -0.029353),(0.000001, -0.417144, 0.017897),(-0.015524, -0.417144, 0.000000),(-0.127998, -0.318886, 0.000000),(0.128000, -0.318886, 0.000000),(0.015525, -0.417144, 0.000000),(0.000001, -0.417144, 0.017897),(0.000001, -0.625057, 0.000000),(0.000001, -0.417144, 0.017897),(-0.127998, -0.318886, 0.000000),(0.000001, -0.625057, 0.000000),(0.128000, -0.318886, 0.000000),(0.000001, -0.417144, 0.017897),(0.000001, -0.417144, -0.017896),(-0.127998, -0.318886, 0.000000),(-0.015524, -0.417144, 0.000000),(0.128000, -0.318886, 0.000000),(0.000001, -0.417144, -0.017896),(0.015525, -0.417144, 0.000000),(0.000001, -0.625057, 0.000000),(-0.127998, -0.318886, 0.000000),(0.000001, -0.417144, -0.017896),(0.000001, -0.625057, 0.000000),(0.000001, -0.417144, -0.017896),(0.128000, -0.318886, 0.000000),(0.000000, 0.000000, 0.232005),(-0.032030, -0.000000, 0.501351),(-0.022648, 0.022648, 0.501351),(-0.022648, 0.022648, 0.501351),(-0.022648, -0.022648, 0.501351),(0.000000, -0.032030, 0.501351),(0.000000, 0.032030, 0.501351),(0.022648, -0.022648, 0.501351),(0.022648, 0.022648, 0.501351),(-0.022648, 0.022648, 0.501351),(0.000000, -0.032030, 0.501351),(0.000000, 0.032030, 0.501351),(0.022648, 0.022648, 0.501351),(0.032030, -0.000000, 0.501351),(0.000000, 0.000000, 0.232005),(0.000000, 0.000000, 0.232005),(-0.022648, 0.022648, 0.501351),(0.000000, 0.032030, 0.501351),(0.000000, 0.000000, 0.232005),(0.000000, 0.032030, 0.501351),(0.022648, 0.022648, 0.501351),(-0.338494, -0.022649, 0.370524),(-0.354509, -0.032030, 0.354509),(-0.164052, -0.000000, 0.164053),(-0.331861, -0.000000, 0.377158),(-0.338494, -0.022649, 0.370524),(-0.164052, -0.000000, 0.164053),(-0.338494, 0.022648, 0.370524),(-0.331861, -0.000000, 0.377158),(-0.164052, -0.000000, 0.164053),(-0.354509, 0.032030, 0.354509),(-0.338494, 0.022648, 0.370524),(-0.164052, -0.000000, 0.164053),(-0.370524, 0.022648, 0.338494),(-0.354509, 0.032030, 0.354509),(-0.164052, -0.000000, 0.164053),(-0.377158, -0.000000, 0.331861),(-0.370524, 0.022648, 0.338494),(-0.164052, -0.000000, 0.164053),(-0.370524, -0.022649, 0.338494),(-0.377158, -0.000000, 0.331861),(-0.164052, -0.000000, 0.164053),(-0.354509, -0.032030, 0.354509),(-0.338494, -0.022649, 0.370524),(-0.331861, -0.000000, 0.377158),(-0.331861, -0.000000, 0.377158),(-0.338494, 0.022648, 0.370524),(-0.354509, 0.032030, 0.354509),(-0.354509, 0.032030, 0.354509),(-0.370524, 0.022648, 0.338494),(-0.377158, -0.000000, 0.331861),(-0.377158, -0.000000, 0.331861),(-0.370524, -0.022649, 0.338494),(-0.354509, -0.032030, 0.354509),(-0.354509, -0.032030, 0.354509),(-0.331861, -0.000000, 0.377158),(-0.354509, 0.032030, 0.354509),(-0.354509, 0.032030, 0.354509),(-0.377158, -0.000000, 0.331861),(-0.354509, -0.032030, 0.354509),(-0.354509, -0.032030, 0.354509),(-0.370524, -0.022649, 0.338494),(-0.164052, -0.000000, 0.164053),(0.370524, -0.022649, 0.338494),(0.354509, -0.032030, 0.354509),(0.164052, -0.000000, 0.164053),(0.377158, -0.000000, 0.331861),(0.370524, -0.022649, 0.338494),(0.164052, -0.000000, 0.164053),(0.370524, 0.022648, 0.338494),(0.377158, -0.000000, 0.331861),(0.164052, -0.000000, 0.164053),(0.354509, 0.032030, 0.354509),(0.370524, 0.022648, 0.338494),(0.164052, -0.000000, 0.164053),(0.338494, 0.022648, 0.370524),(0.354509, 0.032030, 0.354509),(0.164052, -0.000000, 0.164053),(0.331861, -0.000000, 0.377158),(0.338494, 0.022648, 0.370524),(0.164052, -0.000000, 0.164053),(0.338494, -0.022649, 0.370524),(0.331861, -0.000000, 0.377158),(0.164052, -0.000000, 0.164053),(0.354509, -0.032030, 0.354509),(0.370524, -0.022649, 0.338494),(0.377158, -0.000000, 0.331861),(0.377158, -0.000000, 0.331861),(0.370524, 0.022648, 0.338494),(0.354509, 0.032030, 0.354509),(0.354509, 0.032030, 0.354509),(0.338494, 0.022648, 0.370524),(0.331861, -0.000000, 0.377158),(0.331861, -0.000000, 0.377158),(0.338494, -0.022649, 0.370524),(0.354509, -0.032030, 0.354509),(0.354509, -0.032030, 0.354509),(0.377158, -0.000000, 0.331861),(0.354509, 0.032030, 0.354509),(0.354509, 0.032030, 0.354509),(0.331861, -0.000000, 0.377158),(0.354509, -0.032030, 0.354509),(0.354509, -0.032030, 0.354509),(0.338494, -0.022649, 0.370524),(0.164052, -0.000000, 0.164053),(0.338494, -0.022648, -0.370524),(0.354509, -0.032030, -0.354509),(0.164052, -0.000000, -0.164052),(0.331861, -0.000000, -0.377157),(0.338494, -0.022648, -0.370524),(0.164052, -0.000000, -0.164052),(0.338494, 0.022648, -0.370524),(0.331861, -0.000000, -0.377157),(0.164052, -0.000000, -0.164052),(0.354509, 0.032030, -0.354509),(0.338494, 0.022648, -0.370524),(0.164052, -0.000000, -0.164052),(0.370524, 0.022648, -0.338494),(0.354509, 0.032030, -0.354509),(0.164052, -0.000000, -0.164052),(0.377158, -0.000000, -0.331861),(0.370524, 0.022648, -0.338494),(0.164052, -0.000000, -0.164052),(0.370524, -0.022648, -0.338494),(0.377158, -0.000000, -0.331861),(0.164052, -0.000000, -0.164052),(0.354509, -0.032030, -0.354509),(0.338494, -0.022648, -0.370524),(0.331861, -0.000000, -0.377157),(0.331861, -0.000000, -0.377157),(0.338494, 0.022648, -0.370524),(0.354509, 0.032030, -0.354509),(0.354509, 0.032030, -0.354509),(0.370524, 0.022648, -0.338494),(0.377158, -0.000000, -0.331861),(0.377158, -0.000000, -0.331861),(0.370524, -0.022648, -0.338494),(0.354509, -0.032030, -0.354509),(0.354509, -0.032030, -0.354509),(0.331861, -0.000000, -0.377157),(0.354509, 0.032030, -0.354509),(0.354509, 0.032030, -0.354509),(0.377158, -0.000000, -0.331861),(0.354509, -0.032030, -0.354509),(0.354509, -0.032030, -0.354509),(0.370524, -0.022648, -0.338494),(0.164052, -0.000000, -0.164052),)
\ No newline at end of file
@@ -1 +0,0 @@
-SHAPE = ((-0.000000, -0.136614, 0.103780),(-0.000000, -0.273228, 0.213055),(0.081533, -0.273228, 0.196837),(-0.000000, -0.136614, 0.103780),(0.081533, -0.273228, 0.196837),(0.039715, -0.136614, 0.095881),(0.039715, -0.136614, 0.095881),(0.081533, -0.273228, 0.196837),(0.150653, -0.273228, 0.150653),(0.039715, -0.136614, 0.095881),(0.150653, -0.273228, 0.150653),(0.073384, -0.136614, 0.073384),(0.073384, -0.136614, 0.073384),(0.150653, -0.273228, 0.150653),(0.196837, -0.273228, 0.081533),(0.073384, -0.136614, 0.073384),(0.196837, -0.273228, 0.081533),(0.095881, -0.136614, 0.039715),(0.095881, -0.136614, 0.039715),(0.196837, -0.273228, 0.081533),(0.213055, -0.273228, -0.000000),(0.095881, -0.136614, 0.039715),(0.213055, -0.273228, -0.000000),(0.103780, -0.136614, -0.000000),(0.103780, -0.136614, -0.000000),(0.213055, -0.273228, -0.000000),(0.196837, -0.273228, -0.081533),(0.103780, -0.136614, -0.000000),(0.196837, -0.273228, -0.081533),(0.095881, -0.136614, -0.039715),(0.095881, -0.136614, -0.039715),(0.196837, -0.273228, -0.081533),(0.150653, -0.273228, -0.150653),(0.095881, -0.136614, -0.039715),(0.150653, -0.273228, -0.150653),(0.073384, -0.136614, -0.073384),(0.073384, -0.136614, -0.073384),(0.150653, -0.273228, -0.150653),(0.081533, -0.273228, -0.196837),(0.073384, -0.136614, -0.073384),(0.081533, -0.273228, -0.196837),(0.039715, -0.136614, -0.095881),(0.039715, -0.136614, -0.095881),(0.081533, -0.273228, -0.196837),(-0.000000, -0.273228, -0.213055),(0.039715, -0.136614, -0.095881),(-0.000000, -0.273228, -0.213055),(-0.000000, -0.136614, -0.103780),(-0.000000, -0.136614, -0.103780),(-0.000000, -0.273228, -0.213055),(-0.081533, -0.273228, -0.196837),(-0.000000, -0.136614, -0.103780),(-0.081533, -0.273228, -0.196837),(-0.039715, -0.136614, -0.095881),(-0.039715, -0.136614, -0.095881),(-0.081533, -0.273228, -0.196837),(-0.150653, -0.273228, -0.150653),(-0.039715, -0.136614, -0.095881),(-0.150653, -0.273228, -0.150653),(-0.073384, -0.136614, -0.073384),(-0.073384, -0.136614, -0.073384),(-0.150653, -0.273228, -0.150653),(-0.196837, -0.273228, -0.081533),(-0.073384, -0.136614, -0.073384),(-0.196837, -0.273228, -0.081533),(-0.095881, -0.136614, -0.039715),(-0.095881, -0.136614, -0.039715),(-0.196837, -0.273228, -0.081533),(-0.213055, -0.273228, -0.000000),(-0.095881, -0.136614, -0.039715),(-0.213055, -0.273228, -0.000000),(-0.103780, -0.136614, -0.000000),(-0.103780, -0.136614, -0.000000),(-0.213055, -0.273228, -0.000000),(-0.196837, -0.273228, 0.081533),(-0.103780, -0.136614, -0.000000),(-0.196837, -0.273228, 0.081533),(-0.095881, -0.136614, 0.039715),(-0.095881, -0.136614, 0.039715),(-0.196837, -0.273228, 0.081533),(-0.150653, -0.273228, 0.150653),(-0.095881, -0.136614, 0.039715),(-0.150653, -0.273228, 0.150653),(-0.073384, -0.136614, 0.073384),(-0.073384, -0.136614, 0.073384),(-0.150653, -0.273228, 0.150653),(-0.081533, -0.273228, 0.196837),(-0.073384, -0.136614, 0.073384),(-0.081533, -0.273228, 0.196837),(-0.039715, -0.136614, 0.095881),(-0.039715, -0.136614, 0.095881),(-0.081533, -0.273228, 0.196837),(-0.000000, -0.273228, 0.213055),(-0.039715, -0.136614, 0.095881),(-0.000000, -0.273228, 0.213055),(-0.000000, -0.136614, 0.103780),(0.032018, -0.430293, -0.467249),(-0.022558, -0.435454, -0.462855),(-0.031498, -0.404397, -0.492328),(0.032018, -0.430293, -0.467249),(0.006328, -0.438765, -0.458397),(-0.022558, -0.435454, -0.462855),(-0.031498, -0.404397, -0.492328),(-0.006163, -0.395421, -0.499781),(0.021860, -0.399256, -0.496531),(0.038693, -0.413807, -0.483397),(0.021860, -0.399256, -0.496531),(-0.000000, -0.273228, -0.247900),(-0.022558, -0.435454, -0.462855),(-0.038680, -0.421726, -0.476810),(-0.031498, -0.404397, -0.492328),(-0.038680, -0.421726, -0.476810),(-0.022558, -0.435454, -0.462855),(-0.000000, -0.273228, -0.247900),(0.032018, -0.430293, -0.467249),(0.038693, -0.413807, -0.483397),(-0.000000, -0.273228, -0.247900),(0.021860, -0.399256, -0.496531),(0.038693, -0.413807, -0.483397),(0.032018, -0.430293, -0.467249),(-0.031498, -0.404397, -0.492328),(-0.038680, -0.421726, -0.476810),(-0.000000, -0.273228, -0.247900),(0.021860, -0.399256, -0.496531),(0.032018, -0.430293, -0.467249),(-0.031498, -0.404397, -0.492328),(-0.022558, -0.435454, -0.462855),(0.006328, -0.438765, -0.458397),(-0.000000, -0.273228, -0.247900),(0.021860, -0.399256, -0.496531),(-0.006163, -0.395421, -0.499781),(-0.000000, -0.273228, -0.247900),(-0.006163, -0.395421, -0.499781),(-0.031498, -0.404397, -0.492328),(-0.000000, -0.273228, -0.247900),(0.006328, -0.438765, -0.458397),(0.032018, -0.430293, -0.467249),(-0.000000, -0.273228, -0.247900),(-0.467249, -0.430293, -0.032018),(-0.462855, -0.435454, 0.022558),(-0.492328, -0.404397, 0.031498),(-0.467249, -0.430293, -0.032018),(-0.458397, -0.438766, -0.006328),(-0.462855, -0.435454, 0.022558),(-0.492328, -0.404397, 0.031498),(-0.499781, -0.395421, 0.006163),(-0.496531, -0.399256, -0.021860),(-0.483397, -0.413807, -0.038693),(-0.496531, -0.399256, -0.021860),(-0.247900, -0.273228, 0.000000),(-0.462855, -0.435454, 0.022558),(-0.476810, -0.421726, 0.038680),(-0.492328, -0.404397, 0.031498),(-0.476810, -0.421726, 0.038680),(-0.462855, -0.435454, 0.022558),(-0.247900, -0.273228, 0.000000),(-0.467249, -0.430293, -0.032018),(-0.483397, -0.413807, -0.038693),(-0.247900, -0.273228, 0.000000),(-0.496531, -0.399256, -0.021860),(-0.483397, -0.413807, -0.038693),(-0.467249, -0.430293, -0.032018),(-0.492328, -0.404397, 0.031498),(-0.476810, -0.421726, 0.038680),(-0.247900, -0.273228, 0.000000),(-0.496531, -0.399256, -0.021860),(-0.467249, -0.430293, -0.032018),(-0.492328, -0.404397, 0.031498),(-0.462855, -0.435454, 0.022558),(-0.458397, -0.438766, -0.006328),(-0.247900, -0.273228, 0.000000),(-0.496531, -0.399256, -0.021860),(-0.499781, -0.395421, 0.006163),(-0.247900, -0.273228, 0.000000),(-0.499781, -0.395421, 0.006163),(-0.492328, -0.404397, 0.031498),(-0.247900, -0.273228, 0.000000),(-0.458397, -0.438766, -0.006328),(-0.467249, -0.430293, -0.032018),(-0.247900, -0.273228, 0.000000),(-0.032018, -0.430293, 0.467249),(0.022558, -0.435454, 0.462855),(0.031498, -0.404397, 0.492328),(-0.032018, -0.430293, 0.467249),(-0.006328, -0.438766, 0.458397),(0.022558, -0.435454, 0.462855),(0.031498, -0.404397, 0.492328),(0.006163, -0.395421, 0.499781),(-0.021860, -0.399256, 0.496531),(-0.038693, -0.413807, 0.483397),(-0.021860, -0.399256, 0.496531),(0.000000, -0.273228, 0.247900),(0.022558, -0.435454, 0.462855),(0.038680, -0.421727, 0.476810),(0.031498, -0.404397, 0.492328),(0.038680, -0.421727, 0.476810),(0.022558, -0.435454, 0.462855),(0.000000, -0.273228, 0.247900),(-0.032018, -0.430293, 0.467249),(-0.038693, -0.413807, 0.483397),(0.000000, -0.273228, 0.247900),(-0.021860, -0.399256, 0.496531),(-0.038693, -0.413807, 0.483397),(-0.032018, -0.430293, 0.467249),(0.031498, -0.404397, 0.492328),(0.038680, -0.421727, 0.476810),(0.000000, -0.273228, 0.247900),(-0.021860, -0.399256, 0.496531),(-0.032018, -0.430293, 0.467249),(0.031498, -0.404397, 0.492328),(0.022558, -0.435454, 0.462855),(-0.006328, -0.438766, 0.458397),(0.000000, -0.273228, 0.247900),(-0.021860, -0.399256, 0.496531),(0.006163, -0.395421, 0.499781),(0.000000, -0.273228, 0.247900),(0.006163, -0.395421, 0.499781),(0.031498, -0.404397, 0.492328),(0.000000, -0.273228, 0.247900),(-0.006328, -0.438766, 0.458397),(-0.032018, -0.430293, 0.467249),(0.000000, -0.273228, 0.247900),(0.467249, -0.430293, 0.032017),(0.462855, -0.435454, -0.022558),(0.492328, -0.404397, -0.031498),(0.467249, -0.430293, 0.032017),(0.458397, -0.438765, 0.006328),(0.462855, -0.435454, -0.022558),(0.492328, -0.404397, -0.031498),(0.499781, -0.395421, -0.006163),(0.496531, -0.399256, 0.021860),(0.483397, -0.413807, 0.038693),(0.496531, -0.399256, 0.021860),(0.247900, -0.273228, -0.000000),(0.462855, -0.435454, -0.022558),(0.476810, -0.421726, -0.038680),(0.492328, -0.404397, -0.031498),(0.476810, -0.421726, -0.038680),(0.462855, -0.435454, -0.022558),(0.247900, -0.273228, -0.000000),(0.467249, -0.430293, 0.032017),(0.483397, -0.413807, 0.038693),(0.247900, -0.273228, -0.000000),(0.496531, -0.399256, 0.021860),(0.483397, -0.413807, 0.038693),(0.467249, -0.430293, 0.032017),(0.492328, -0.404397, -0.031498),(0.476810, -0.421726, -0.038680),(0.247900, -0.273228, -0.000000),(0.496531, -0.399256, 0.021860),(0.467249, -0.430293, 0.032017),(0.492328, -0.404397, -0.031498),(0.462855, -0.435454, -0.022558),(0.458397, -0.438765, 0.006328),(0.247900, -0.273228, -0.000000),(0.496531, -0.399256, 0.021860),(0.499781, -0.395421, -0.006163),(0.247900, -0.273228, -0.000000),(0.499781, -0.395421, -0.006163),(0.492328, -0.404397, -0.031498),(0.247900, -0.273228, -0.000000),(0.458397, -0.438765, 0.006328),(0.467249, -0.430293, 0.032017),(0.247900, -0.273228, -0.000000),(-0.035475, 0.000000, 0.085645),(-0.039715, -0.136614, 0.095881),(-0.000000, -0.136614, 0.103780),(-0.035475, 0.000000, 0.085645),(-0.000000, -0.136614, 0.103780),(-0.000000, 0.000000, 0.092701),(-0.065549, 0.000000, 0.065550),(-0.073384, -0.136614, 0.073384),(-0.039715, -0.136614, 0.095881),(-0.065549, 0.000000, 0.065550),(-0.039715, -0.136614, 0.095881),(-0.035475, 0.000000, 0.085645),(-0.085645, 0.000000, 0.035475),(-0.095881, -0.136614, 0.039715),(-0.073384, -0.136614, 0.073384),(-0.085645, 0.000000, 0.035475),(-0.073384, -0.136614, 0.073384),(-0.065549, 0.000000, 0.065550),(-0.092701, 0.000000, 0.000000),(-0.103780, -0.136614, -0.000000),(-0.095881, -0.136614, 0.039715),(-0.092701, 0.000000, 0.000000),(-0.095881, -0.136614, 0.039715),(-0.085645, 0.000000, 0.035475),(-0.085645, 0.000000, -0.035475),(-0.095881, -0.136614, -0.039715),(-0.103780, -0.136614, -0.000000),(-0.085645, 0.000000, -0.035475),(-0.103780, -0.136614, -0.000000),(-0.092701, 0.000000, 0.000000),(-0.065549, 0.000000, -0.065549),(-0.073384, -0.136614, -0.073384),(-0.095881, -0.136614, -0.039715),(-0.065549, 0.000000, -0.065549),(-0.095881, -0.136614, -0.039715),(-0.085645, 0.000000, -0.035475),(-0.035475, 0.000000, -0.085645),(-0.039715, -0.136614, -0.095881),(-0.073384, -0.136614, -0.073384),(-0.035475, 0.000000, -0.085645),(-0.073384, -0.136614, -0.073384),(-0.065549, 0.000000, -0.065549),(-0.000000, 0.000000, -0.092701),(-0.000000, -0.136614, -0.103780),(-0.039715, -0.136614, -0.095881),(-0.000000, 0.000000, -0.092701),(-0.039715, -0.136614, -0.095881),(-0.035475, 0.000000, -0.085645),(0.035475, 0.000000, -0.085645),(0.039715, -0.136614, -0.095881),(-0.000000, -0.136614, -0.103780),(0.035475, 0.000000, -0.085645),(-0.000000, -0.136614, -0.103780),(-0.000000, 0.000000, -0.092701),(0.065549, 0.000000, -0.065549),(0.073384, -0.136614, -0.073384),(0.039715, -0.136614, -0.095881),(0.065549, 0.000000, -0.065549),(0.039715, -0.136614, -0.095881),(0.035475, 0.000000, -0.085645),(0.085645, 0.000000, -0.035475),(0.095881, -0.136614, -0.039715),(0.073384, -0.136614, -0.073384),(0.085645, 0.000000, -0.035475),(0.073384, -0.136614, -0.073384),(0.065549, 0.000000, -0.065549),(0.092701, 0.000000, 0.000000),(0.103780, -0.136614, -0.000000),(0.095881, -0.136614, -0.039715),(0.092701, 0.000000, 0.000000),(0.095881, -0.136614, -0.039715),(0.085645, 0.000000, -0.035475),(0.085645, 0.000000, 0.035475),(0.095881, -0.136614, 0.039715),(0.103780, -0.136614, -0.000000),(0.085645, 0.000000, 0.035475),(0.103780, -0.136614, -0.000000),(0.092701, 0.000000, 0.000000),(0.065549, 0.000000, 0.065550),(0.073384, -0.136614, 0.073384),(0.095881, -0.136614, 0.039715),(0.065549, 0.000000, 0.065550),(0.095881, -0.136614, 0.039715),(0.085645, 0.000000, 0.035475),(0.035475, 0.000000, 0.085645),(0.039715, -0.136614, 0.095881),(0.073384, -0.136614, 0.073384),(0.035475, 0.000000, 0.085645),(0.073384, -0.136614, 0.073384),(0.065549, 0.000000, 0.065550),(-0.000000, 0.000000, 0.092701),(-0.000000, -0.136614, 0.103780),(0.039715, -0.136614, 0.095881),(-0.000000, 0.000000, 0.092701),(0.039715, -0.136614, 0.095881),(0.035475, 0.000000, 0.085645),(0.000000, -0.229197, 0.098270),(0.063210, -0.177151, 0.063210),(0.000000, -0.177151, 0.089393),(0.000000, -0.302802, 0.052675),(0.057715, -0.273320, 0.057715),(0.000000, -0.273320, 0.081621),(0.000000, -0.125105, 0.059123),(0.063210, -0.177151, 0.063210),(0.041807, -0.125105, 0.041807),(0.000000, -0.229197, 0.098270),(0.057715, -0.273320, 0.057715),(0.069488, -0.229197, 0.069488),(0.000000, -0.302802, 0.052675),(0.000000, -0.313155, -0.000000),(0.037247, -0.302802, 0.037247),(0.063210, -0.177151, 0.063210),(0.059123, -0.125105, 0.000000),(0.041807, -0.125105, 0.041807),(0.069488, -0.229197, 0.069488),(0.081621, -0.273320, 0.000000),(0.098270, -0.229197, 0.000000),(0.037247, -0.302802, 0.037247),(0.000000, -0.313155, -0.000000),(0.052675, -0.302802, -0.000000),(0.069488, -0.229197, 0.069488),(0.089393, -0.177151, 0.000000),(0.063210, -0.177151, 0.063210),(0.037247, -0.302802, 0.037247),(0.081621, -0.273320, 0.000000),(0.057715, -0.273320, 0.057715),(0.059123, -0.125105, 0.000000),(0.063210, -0.177151, -0.063210),(0.041807, -0.125105, -0.041807),(0.098270, -0.229197, 0.000000),(0.057715, -0.273320, -0.057715),(0.069488, -0.229197, -0.069488),(0.052675, -0.302802, -0.000000),(0.000000, -0.313155, -0.000000),(0.037247, -0.302802, -0.037247),(0.098270, -0.229197, 0.000000),(0.063210, -0.177151, -0.063210),(0.089393, -0.177151, 0.000000),(0.052675, -0.302802, -0.000000),(0.057715, -0.273320, -0.057715),(0.081621, -0.273320, 0.000000),(0.069488, -0.229197, -0.069488),(0.000000, -0.177151, -0.089393),(0.063210, -0.177151, -0.063210),(0.037247, -0.302802, -0.037247),(0.000000, -0.273320, -0.081621),(0.057715, -0.273320, -0.057715),(0.041807, -0.125105, -0.041807),(0.000000, -0.177151, -0.089393),(0.000000, -0.125105, -0.059123),(0.057715, -0.273320, -0.057715),(0.000000, -0.229197, -0.098270),(0.069488, -0.229197, -0.069488),(0.037247, -0.302802, -0.037247),(0.000000, -0.313155, -0.000000),(0.000000, -0.302802, -0.052675),(0.000000, -0.177151, -0.089393),(-0.069487, -0.229197, -0.069488),(-0.063210, -0.177151, -0.063210),(0.000000, -0.302802, -0.052675),(-0.057715, -0.273320, -0.057715),(0.000000, -0.273320, -0.081621),(0.000000, -0.177151, -0.089393),(-0.041807, -0.125105, -0.041807),(0.000000, -0.125105, -0.059123),(0.000000, -0.273320, -0.081621),(-0.069487, -0.229197, -0.069488),(0.000000, -0.229197, -0.098270),(0.000000, -0.302802, -0.052675),(0.000000, -0.313155, -0.000000),(-0.037247, -0.302802, -0.037247),(-0.041807, -0.125105, -0.041807),(-0.089392, -0.177151, 0.000000),(-0.059123, -0.125105, 0.000000),(-0.057715, -0.273320, -0.057715),(-0.098270, -0.229197, 0.000000),(-0.069487, -0.229197, -0.069488),(-0.037247, -0.302802, -0.037247),(0.000000, -0.313155, -0.000000),(-0.052675, -0.302802, -0.000000),(-0.069487, -0.229197, -0.069488),(-0.089392, -0.177151, 0.000000),(-0.063210, -0.177151, -0.063210),(-0.037247, -0.302802, -0.037247),(-0.081621, -0.273320, 0.000000),(-0.057715, -0.273320, -0.057715),(-0.081621, -0.273320, 0.000000),(-0.069487, -0.229197, 0.069488),(-0.098270, -0.229197, 0.000000),(-0.052675, -0.302802, -0.000000),(0.000000, -0.313155, -0.000000),(-0.037247, -0.302802, 0.037247),(-0.089392, -0.177151, 0.000000),(-0.069487, -0.229197, 0.069488),(-0.063210, -0.177151, 0.063210),(-0.052675, -0.302802, -0.000000),(-0.057715, -0.273320, 0.057715),(-0.081621, -0.273320, 0.000000),(-0.089392, -0.177151, 0.000000),(-0.041807, -0.125105, 0.041807),(-0.059123, -0.125105, 0.000000),(-0.069487, -0.229197, 0.069488),(0.000000, -0.177151, 0.089393),(-0.063210, -0.177151, 0.063210),(-0.037247, -0.302802, 0.037247),(0.000000, -0.273320, 0.081621),(-0.057715, -0.273320, 0.057715),(-0.041807, -0.125105, 0.041807),(0.000000, -0.177151, 0.089393),(0.000000, -0.125105, 0.059123),(-0.057715, -0.273320, 0.057715),(0.000000, -0.229197, 0.098270),(-0.069487, -0.229197, 0.069488),(-0.037247, -0.302802, 0.037247),(0.000000, -0.313155, -0.000000),(0.000000, -0.302802, 0.052675),(0.000000, -0.229197, 0.098270),(0.069488, -0.229197, 0.069488),(0.063210, -0.177151, 0.063210),(0.000000, -0.302802, 0.052675),(0.037247, -0.302802, 0.037247),(0.057715, -0.273320, 0.057715),(0.000000, -0.125105, 0.059123),(0.000000, -0.177151, 0.089393),(0.063210, -0.177151, 0.063210),(0.000000, -0.229197, 0.098270),(0.000000, -0.273320, 0.081621),(0.057715, -0.273320, 0.057715),(0.063210, -0.177151, 0.063210),(0.089393, -0.177151, 0.000000),(0.059123, -0.125105, 0.000000),(0.069488, -0.229197, 0.069488),(0.057715, -0.273320, 0.057715),(0.081621, -0.273320, 0.000000),(0.069488, -0.229197, 0.069488),(0.098270, -0.229197, 0.000000),(0.089393, -0.177151, 0.000000),(0.037247, -0.302802, 0.037247),(0.052675, -0.302802, -0.000000),(0.081621, -0.273320, 0.000000),(0.059123, -0.125105, 0.000000),(0.089393, -0.177151, 0.000000),(0.063210, -0.177151, -0.063210),(0.098270, -0.229197, 0.000000),(0.081621, -0.273320, 0.000000),(0.057715, -0.273320, -0.057715),(0.098270, -0.229197, 0.000000),(0.069488, -0.229197, -0.069488),(0.063210, -0.177151, -0.063210),(0.052675, -0.302802, -0.000000),(0.037247, -0.302802, -0.037247),(0.057715, -0.273320, -0.057715),(0.069488, -0.229197, -0.069488),(0.000000, -0.229197, -0.098270),(0.000000, -0.177151, -0.089393),(0.037247, -0.302802, -0.037247),(0.000000, -0.302802, -0.052675),(0.000000, -0.273320, -0.081621),(0.041807, -0.125105, -0.041807),(0.063210, -0.177151, -0.063210),(0.000000, -0.177151, -0.089393),(0.057715, -0.273320, -0.057715),(0.000000, -0.273320, -0.081621),(0.000000, -0.229197, -0.098270),(0.000000, -0.177151, -0.089393),(0.000000, -0.229197, -0.098270),(-0.069487, -0.229197, -0.069488),(0.000000, -0.302802, -0.052675),(-0.037247, -0.302802, -0.037247),(-0.057715, -0.273320, -0.057715),(0.000000, -0.177151, -0.089393),(-0.063210, -0.177151, -0.063210),(-0.041807, -0.125105, -0.041807),(0.000000, -0.273320, -0.081621),(-0.057715, -0.273320, -0.057715),(-0.069487, -0.229197, -0.069488),(-0.041807, -0.125105, -0.041807),(-0.063210, -0.177151, -0.063210),(-0.089392, -0.177151, 0.000000),(-0.057715, -0.273320, -0.057715),(-0.081621, -0.273320, 0.000000),(-0.098270, -0.229197, 0.000000),(-0.069487, -0.229197, -0.069488),(-0.098270, -0.229197, 0.000000),(-0.089392, -0.177151, 0.000000),(-0.037247, -0.302802, -0.037247),(-0.052675, -0.302802, -0.000000),(-0.081621, -0.273320, 0.000000),(-0.081621, -0.273320, 0.000000),(-0.057715, -0.273320, 0.057715),(-0.069487, -0.229197, 0.069488),(-0.089392, -0.177151, 0.000000),(-0.098270, -0.229197, 0.000000),(-0.069487, -0.229197, 0.069488),(-0.052675, -0.302802, -0.000000),(-0.037247, -0.302802, 0.037247),(-0.057715, -0.273320, 0.057715),(-0.089392, -0.177151, 0.000000),(-0.063210, -0.177151, 0.063210),(-0.041807, -0.125105, 0.041807),(-0.069487, -0.229197, 0.069488),(0.000000, -0.229197, 0.098270),(0.000000, -0.177151, 0.089393),(-0.037247, -0.302802, 0.037247),(0.000000, -0.302802, 0.052675),(0.000000, -0.273320, 0.081621),(-0.041807, -0.125105, 0.041807),(-0.063210, -0.177151, 0.063210),(0.000000, -0.177151, 0.089393),(-0.057715, -0.273320, 0.057715),(0.000000, -0.273320, 0.081621),(0.000000, -0.229197, 0.098270),(0.041807, -0.125105, 0.041807),(0.023779, 0.000000, 0.057407),(0.000000, -0.125105, 0.059123),(0.041807, -0.125105, 0.041807),(0.057407, 0.000000, 0.023779),(0.043938, 0.000000, 0.043938),(0.059123, -0.125105, 0.000000),(0.057407, 0.000000, 0.023779),(0.041807, -0.125105, 0.041807),(0.059123, -0.125105, 0.000000),(0.057407, 0.000000, -0.023779),(0.062137, 0.000000, -0.000000),(0.041807, -0.125105, -0.041807),(0.057407, 0.000000, -0.023779),(0.059123, -0.125105, 0.000000),(0.041807, -0.125105, -0.041807),(0.023779, 0.000000, -0.057407),(0.043938, 0.000000, -0.043938),(0.000000, -0.125105, -0.059123),(0.023779, 0.000000, -0.057407),(0.041807, -0.125105, -0.041807),(0.000000, -0.125105, -0.059123),(-0.023779, 0.000000, -0.057407),(0.000000, 0.000000, -0.062137),(-0.041807, -0.125105, -0.041807),(-0.023779, 0.000000, -0.057407),(0.000000, -0.125105, -0.059123),(-0.041807, -0.125105, -0.041807),(-0.057407, 0.000000, -0.023779),(-0.043938, 0.000000, -0.043938),(-0.059123, -0.125105, 0.000000),(-0.057407, 0.000000, -0.023779),(-0.041807, -0.125105, -0.041807),(-0.059123, -0.125105, 0.000000),(-0.057407, 0.000000, 0.023779),(-0.062137, 0.000000, -0.000000),(-0.041807, -0.125105, 0.041807),(-0.057407, 0.000000, 0.023779),(-0.059123, -0.125105, 0.000000),(-0.041807, -0.125105, 0.041807),(-0.023779, 0.000000, 0.057407),(-0.043938, 0.000000, 0.043938),(0.000000, -0.125105, 0.059123),(-0.023779, 0.000000, 0.057407),(-0.041807, -0.125105, 0.041807),(0.000000, -0.125105, 0.059123),(0.023779, 0.000000, 0.057407),(0.000000, 0.000000, 0.062137),(0.041807, -0.125105, 0.041807),(0.043938, 0.000000, 0.043938),(0.023779, 0.000000, 0.057407),(0.059123, -0.125105, 0.000000),(0.062137, 0.000000, -0.000000),(0.057407, 0.000000, 0.023779),(0.041807, -0.125105, -0.041807),(0.043938, 0.000000, -0.043938),(0.057407, 0.000000, -0.023779),(0.000000, -0.125105, -0.059123),(0.000000, 0.000000, -0.062137),(0.023779, 0.000000, -0.057407),(-0.041807, -0.125105, -0.041807),(-0.043938, 0.000000, -0.043938),(-0.023779, 0.000000, -0.057407),(-0.059123, -0.125105, 0.000000),(-0.062137, 0.000000, -0.000000),(-0.057407, 0.000000, -0.023779),(-0.041807, -0.125105, 0.041807),(-0.043938, 0.000000, 0.043938),(-0.057407, 0.000000, 0.023779),(0.000000, -0.125105, 0.059123),(0.000000, 0.000000, 0.062137),(-0.023779, 0.000000, 0.057407),)
\ No newline at end of file
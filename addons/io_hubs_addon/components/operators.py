@@ -8,7 +8,7 @@ from .utils import get_object_source, has_component, add_component, remove_compo
 from .components_registry import get_components_registry, get_component_by_name
 from ..preferences import get_addon_pref
 from .handlers import migrate_components
-from .gizmos import update_gizmos
+from .gizmos import rebuild_gizmos
 from .utils import is_linked, redraw_component_ui
 from ..icons import get_hubs_icons
 import os
@@ -280,7 +280,7 @@ class UpdateHubsGizmos(Operator):
     bl_description = "Force a re-evaluation of all objects/components and update their gizmos"
 
     def execute(self, context):
-        update_gizmos()
+        rebuild_gizmos()
         return {'FINISHED'}
 
 
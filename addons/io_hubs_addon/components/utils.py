@@ -1,6 +1,6 @@
 import tempfile
 import bpy
-from .components_registry import get_component_by_name, get_components_registry
+from .components_registry import get_component_by_name, get_components_registry, get_component_metadata
 from .gizmos import update_gizmos
 from .types import PanelType
 from mathutils import Vector
@@ -79,9 +79,8 @@ def is_dep_required(obj, component_name, dep_name):
     items = obj.hubs_component_list.items
     for cmp in items:
         if cmp.name != component_name:
-            dep_component_class = get_component_by_name(
-                cmp.name)
-            if dep_name in dep_component_class.get_deps():
+            dep_component_metadata = get_component_metadata(cmp.name)
+            if dep_component_metadata and dep_name in dep_component_metadata.deps:
                 is_required = True
                 break
     return is_required
@@ -235,18 +234,62 @@ def redirect_c_stdout(binary_stream):
         os.close(original_stdout_file_descriptor_copy)
 
 
-def get_host_components(host):
-    # Note: this used to be a generator but we detected some issues in Mac so we reverted to returning an array.
-    components = []
+def get_host_component_items(host):
+    '''Returns a (component_name, component_class, component) tuple for each item in the host's component list.
+    The component class and component are None for components that aren't registered.'''
+    component_items = []
     for component_item in host.hubs_component_list.items:
         component_name = component_item.name
         component_class = get_component_by_name(component_name)
-        if not component_class:
-            continue
+        component = getattr(host, get_component_metadata(component_name).id) if component_class else None
+        component_items.append((component_name, component_class, component))
+    return component_items
+
 
-        component = getattr(host, component_class.get_id())
-        components.append(component)
-    return components
+def get_host_components(host):
+    # Note: this used to be a generator but we detected some issues in Mac so we reverted to returning an array.
+    return [component for _, component_class, component in get_host_component_items(host) if component_class]
+
+
+def build_host_index():
+    '''Scans every component host in the file once and resolves its components.
+    Returns a dict with an "entries" list, in scene/object/bone/material order, and a "hosts" dict to look up the entries by host.
+    Each entry stores the host, its panel type, the object to pass to the component methods and the host component items.
+    Bones are indexed once per armature, with the first object using the armature as the object, falling back to the armature itself.'''
+    entries = []
+    armature_objects = {}
+
+    def add_entry(host, panel_type, ob=None):
+        component_items = get_host_component_items(host)
+        if component_items:
+            entries.append({
+                'host': host,
+                'panel_type': panel_type,
+                'ob': ob,
+                'components': component_items
+            })
+
+    # Note: we loop through copied lists so that the index isn't affected by hosts being renamed while it's in use.
+    for scene in bpy.data.scenes[:]:
+        add_entry(scene, PanelType.SCENE)
+
+    for ob in bpy.data.objects[:]:
+        add_entry(ob, PanelType.OBJECT, ob=ob)
+        if ob.type == 'ARMATURE' and ob.data not in armature_objects:
+            armature_objects[ob.data] = ob
+
+    for armature in bpy.data.armatures[:]:
+        ob = armature_objects.get(armature, armature)
+        for bone in armature.bones[:]:
+            add_entry(bone, PanelType.BONE, ob=ob)
+
+    for material in bpy.data.materials[:]:
+        add_entry(material, PanelType.MATERIAL)
+
+    return {
+        'entries': entries,
+        'hosts': {entry['host']: entry for entry in entries}
+    }
 
 
 def wrap_text(text, max_length=70):
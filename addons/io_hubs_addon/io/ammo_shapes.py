@@ -0,0 +1,367 @@
+import bpy
+import bmesh
+import numpy as np
+from ..components.utils import children_recursive, has_component
+
+# Object types the glTF exporter converts to meshes.
+MESH_OBJECT_TYPES = {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}
+# Collider types whose fit can be computed at export, the client computes them from the object's vertices otherwise.
+# Hulls are left out, the client always builds them from the vertices.
+PRECOMPUTED_SHAPE_TYPES = {'box', 'sphere'}
+# Number of support directions per hull vertex tried when simplifying a hull, more directions pick more evenly spread vertices.
+HULL_SIMPLIFY_MAX_DIRECTIONS_FACTOR = 8
+
+# glTF accessor component types.
+GLTF_FLOAT = 5126
+GLTF_UNSIGNED_INT = 5125
+
+
+def is_collider_visible(ob, component):
+    # The client skips meshes that are hidden with the visible component unless includeInvisible is set.
+    if component.includeInvisible or not has_component(ob, 'visible'):
+        return True
+    return ob.hubs_component_visible.visible
+
+
+def is_object_exported(ob, export_settings):
+    '''Returns whether the glTF exporter includes the object, following its selection, visibility, render and collection filters.'''
+    if export_settings.get('gltf_selected') and not ob.select_get():
+        return False
+    if export_settings.get('gltf_visible') and not ob.visible_get():
+        return False
+    if export_settings.get('gltf_renderable') and ob.hide_render:
+        return False
+    if export_settings.get('gltf_active_collection'):
+        collection = bpy.context.view_layer.active_layer_collection.collection
+        if export_settings.get('gltf_active_collection_with_nested', True):
+            return ob.name in collection.all_objects
+        return ob.name in collection.objects
+    return True
+
+
+def read_mesh_vertices(mesh):
+    vertices = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', vertices)
+    return vertices.reshape(-1, 3)
+
+
+def read_mesh_triangles(mesh):
+    mesh.calc_loop_triangles()
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int64)
+    mesh.loop_triangles.foreach_get('vertices', triangles)
+    return triangles.reshape(-1, 3)
+
+
+def read_object_mesh(export_settings, ob, with_triangles=False):
+    '''Returns the vertices of the mesh the object is exported with as a (N, 3) float32 array in object space,
+    and its triangles as a (M, 3) array of vertex indices if with_triangles is set.'''
+    def read(mesh):
+        return read_mesh_vertices(mesh), read_mesh_triangles(mesh) if with_triangles else None
+
+    if ob.type == 'MESH' and not export_settings.get('gltf_apply'):
+        return read(ob.data)
+
+    ob_eval = ob.evaluated_get(bpy.context.evaluated_depsgraph_get())
+    mesh = ob_eval.to_mesh()
+    try:
+        return read(mesh)
+    finally:
+        ob_eval.to_mesh_clear()
+
+
+def get_collider_geometry(export_settings, host, component, with_triangles=False):
+    '''Returns the vertices the client fits the collider of the host to, as a (N, 3) float64 array in the host's glTF space,
+    and their triangles as a (M, 3) array of vertex indices if with_triangles is set.
+    Like the client, these are the vertices of the host's mesh and of the meshes of all its exported descendants.'''
+    host_matrix = np.array(host.matrix_world.inverted_safe(), dtype=np.float64)
+    vertex_arrays = []
+    triangle_arrays = []
+    vertex_count = 0
+    children = [ob for ob in children_recursive(host) if is_object_exported(ob, export_settings)]
+    for ob in [host] + children:
+        if ob.type not in MESH_OBJECT_TYPES or not is_collider_visible(ob, component):
+            continue
+
+        vertices, triangles = read_object_mesh(export_settings, ob, with_triangles)
+        if not len(vertices):
+            continue
+
+        vertices = vertices.astype(np.float64)
+        if ob != host:
+            matrix = host_matrix @ np.array(ob.matrix_world, dtype=np.float64)
+            vertices = vertices @ matrix[:3, :3].T + matrix[:3, 3]
+        vertex_arrays.append(vertices)
+        if with_triangles:
+            triangle_arrays.append(triangles + vertex_count)
+        vertex_count += len(vertices)
+
+    if not vertex_arrays:
+        return np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.int64) if with_triangles else None
+
+    vertices = np.concatenate(vertex_arrays)
+    if export_settings['gltf_yup']:
+        vertices = np.stack((vertices[:, 0], vertices[:, 2], -vertices[:, 1]), axis=1)
+    return vertices, np.concatenate(triangle_arrays) if with_triangles else None
+
+
+def compute_box_half_extents(vertices, min_half_extent, max_half_extent):
+    '''Returns the half extents of the box fitted to the vertices, clamped like three-to-ammo's _computeHalfExtents.'''
+    half_extents = (vertices.max(axis=0) - vertices.min(axis=0)) * 0.5
+    return np.maximum(np.minimum(half_extents, max_half_extent), min_half_extent)
+
+
+def compute_sphere_radius(vertices):
+    '''Returns the radius of the sphere fitted to the vertices, like three-to-ammo's _computeRadius.
+    The sphere is centered on the center of the bounds, not on the vertices' centroid.'''
+    center = (vertices.max(axis=0) + vertices.min(axis=0)) * 0.5
+    return float(np.sqrt(((vertices - center) ** 2).sum(axis=1).max()))
+
+
+def get_sphere_directions(count):
+    '''Returns count unit vectors evenly spread over the sphere (a Fibonacci lattice).'''
+    indices = np.arange(count, dtype=np.float64) + 0.5
+    z = 1.0 - 2.0 * indices / count
+    radius = np.sqrt(1.0 - z * z)
+    theta = np.pi * (1.0 + 5.0 ** 0.5) * indices
+    return np.stack((radius * np.cos(theta), radius * np.sin(theta), z), axis=1)
+
+
+def get_support_points(points, directions):
+    '''Returns the unique points that are the furthest along any of the directions, all of them are on the convex hull.'''
+    indices = np.unique(np.argmax(points @ directions.T, axis=0))
+    return points[indices]
+
+
+def build_convex_hull(points):
+    '''Returns the vertices of the convex hull of the points, computed with BMesh. Degenerate (flat) point sets are returned as is.'''
+    bm = bmesh.new()
+    try:
+        for point in points:
+            bm.verts.new(point)
+        result = bmesh.ops.convex_hull(bm, input=bm.verts[:], use_existing_faces=False)
+        hull = [element.co[:] for element in result['geom'] if isinstance(element, bmesh.types.BMVert)]
+    finally:
+        bm.free()
+
+    return np.array(hull, dtype=np.float64) if len(hull) >= 4 else points
+
+
+def get_convex_hull_volume(points):
+    '''Returns the volume of the convex hull of the points, computed with BMesh.'''
+    if len(points) < 4:
+        return 0.0
+
+    bm = bmesh.new()
+    try:
+        for point in points:
+            bm.verts.new(point)
+        bmesh.ops.convex_hull(bm, input=bm.verts[:], use_existing_faces=False)
+        return bm.calc_volume()
+    finally:
+        bm.free()
+
+
+def build_convex_hull_mesh(points):
+    '''Returns the vertices and triangles of the convex hull of the points, computed with BMesh.'''
+    bm = bmesh.new()
+    try:
+        for point in points:
+            bm.verts.new(point)
+        result = bmesh.ops.convex_hull(bm, input=bm.verts[:], use_existing_faces=False)
+        unused_verts = [element for element in result['geom_interior'] + result['geom_unused']
+                        if isinstance(element, bmesh.types.BMVert)]
+        bmesh.ops.delete(bm, geom=unused_verts, context='VERTS')
+        bmesh.ops.triangulate(bm, faces=bm.faces[:])
+        bm.verts.index_update()
+        vertices = np.array([vert.co[:] for vert in bm.verts], dtype=np.float32)
+        triangles = np.array([[vert.index for vert in face.verts] for face in bm.faces], dtype=np.uint32)
+    finally:
+        bm.free()
+
+    return vertices, triangles.reshape(-1, 3)
+
+
+def remove_interior_points(points):
+    '''Discards the points that are inside the hull of the extreme points along a few directions,
+    so only a fraction of the points have to go through the exact hull computation.'''
+    extreme_points = get_support_points(points, get_sphere_directions(32))
+    if len(extreme_points) < 4:
+        return points
+
+    bm = bmesh.new()
+    try:
+        for point in extreme_points:
+            bm.verts.new(point)
+        result = bmesh.ops.convex_hull(bm, input=bm.verts[:], use_existing_faces=False)
+        faces = [element for element in result['geom'] if isinstance(element, bmesh.types.BMFace)]
+        bmesh.ops.recalc_face_normals(bm, faces=faces)
+        planes = np.array([face.normal[:] + (-face.normal.dot(face.verts[0].co),) for face in faces], dtype=np.float64)
+    finally:
+        bm.free()
+
+    if not len(planes):
+        return points
+
+    # Points strictly behind every face plane can't be on the hull.
+    scale = max(float(np.abs(points).max()), 1.0)
+    distances = points @ planes[:, :3].T + planes[:, 3]
+    return points[(distances > -1e-6 * scale).any(axis=1)]
+
+
+def compute_convex_hull(vertices, max_vertices):
+    '''Returns the vertices of the convex hull of the vertices, simplified to at most max_vertices vertices.
+    The simplified hull keeps the hull vertices that are the furthest along evenly spread directions, so it stays inside the full hull.'''
+    points = np.unique(vertices, axis=0)
+    if len(points) > max_vertices:
+        points = build_convex_hull(remove_interior_points(points))
+
+    if len(points) <= max_vertices:
+        return points
+
+    simplified = points[:0]
+    direction_count = max_vertices
+    while direction_count <= max_vertices * HULL_SIMPLIFY_MAX_DIRECTIONS_FACTOR:
+        support_points = get_support_points(points, get_sphere_directions(direction_count))
+        if len(support_points) > max_vertices:
+            break
+        simplified = support_points
+        direction_count *= 2
+
+    return simplified
+
+
+def get_world_scale(export_settings, host):
+    '''Returns the scale of the host's world matrix along the glTF axes, like the one three.js decomposes from the node's matrixWorld.'''
+    scale = np.linalg.norm(np.array(host.matrix_world, dtype=np.float64)[:3, :3], axis=0)
+    if export_settings['gltf_yup']:
+        scale = scale[[0, 2, 1]]
+    return scale
+
+
+def precompute_ammo_shape(export_settings, host, component, data):
+    '''Replaces the automatic fit of the gathered ammo-shape with the fitted dimensions, so the client can skip computing them.
+    The dimensions are in glTF space, like the ones the client computes from the vertices. The client scales automatically
+    fitted shapes by the host's world scale but not manual ones, so the scale is baked into the dimensions.'''
+    if component.fit != 'all' or component.type not in PRECOMPUTED_SHAPE_TYPES:
+        return
+
+    vertices, _ = get_collider_geometry(export_settings, host, component)
+    if not len(vertices):
+        return
+
+    if component.type == 'box':
+        # The extents are clamped before they are scaled, like three-to-ammo does.
+        half_extents = compute_box_half_extents(vertices, component.minHalfExtent, component.maxHalfExtent)
+        half_extents *= get_world_scale(export_settings, host)
+        data['fit'] = 'manual'
+        data['halfExtents'] = dict(zip(('x', 'y', 'z'), half_extents.tolist()))
+    else:
+        data['fit'] = 'manual'
+        # Bullet only uses the x scale of spheres.
+        data['sphereRadius'] = compute_sphere_radius(vertices) * float(get_world_scale(export_settings, host)[0])
+
+
+def create_accessor(array, component_type, accessor_type, with_bounds=False):
+    from io_scene_gltf2.io.com import gltf2_io
+    from .utils import gltf2_io_binary_data
+    return gltf2_io.Accessor(
+        buffer_view=gltf2_io_binary_data.BinaryData(data=array.tobytes()),
+        byte_offset=None,
+        component_type=component_type,
+        count=len(array),
+        extensions=None,
+        extras=None,
+        max=array.max(axis=0).tolist() if with_bounds else None,
+        min=array.min(axis=0).tolist() if with_bounds else None,
+        name=None,
+        normalized=None,
+        sparse=None,
+        type=accessor_type
+    )
+
+
+def create_collider_node(name, vertices, triangles, ammo_shape_data):
+    '''Returns a glTF node with the hull mesh and an ammo-shape hull fitted to it.
+    The mesh is hidden, it's only there for the client to build the hull from.'''
+    from io_scene_gltf2.io.com import gltf2_io, gltf2_io_extensions
+    from .utils import HUBS_CONFIG
+    mesh = gltf2_io.Mesh(
+        extensions=None,
+        extras=None,
+        name=name,
+        primitives=[gltf2_io.MeshPrimitive(
+            attributes={'POSITION': create_accessor(vertices, GLTF_FLOAT, "VEC3", with_bounds=True)},
+            extensions=None,
+            extras=None,
+            indices=create_accessor(triangles.ravel(), GLTF_UNSIGNED_INT, "SCALAR"),
+            material=None,
+            mode=None,
+            targets=None
+        )],
+        weights=None
+    )
+
+    extension_name = HUBS_CONFIG["gltfExtensionName"]
+    return gltf2_io.Node(
+        camera=None,
+        children=[],
+        extensions={extension_name: gltf2_io_extensions.Extension(
+            name=extension_name,
+            extension={
+                'visible': {'visible': False},
+                'ammo-shape': {
+                    **ammo_shape_data,
+                    'type': 'hull',
+                    'fit': 'all',
+                    'includeInvisible': True
+                }
+            },
+            required=False
+        )},
+        extras=None,
+        matrix=None,
+        mesh=mesh,
+        name=name,
+        rotation=None,
+        scale=None,
+        skin=None,
+        translation=None,
+        weights=None
+    )
+
+
+def add_collider_hull_nodes(gltf2_object, blender_object, export_settings):
+    '''Replaces the mesh ammo-shape of the exported node with convex hull colliders on generated child nodes.'''
+    from .utils import HUBS_CONFIG
+    if not isinstance(blender_object, bpy.types.Object) or not has_component(blender_object, 'ammo-shape'):
+        return
+
+    component = blender_object.hubs_component_ammo_shape
+    hubs_extension = (gltf2_object.extensions or {}).get(HUBS_CONFIG["gltfExtensionName"])
+    if component.type != 'mesh' or not hubs_extension or 'ammo-shape' not in hubs_extension.extension:
+        return
+
+    vertices, triangles = get_collider_geometry(export_settings, blender_object, component, with_triangles=True)
+    if not len(vertices):
+        return
+
+    from .convex_decomposition import decompose_mesh
+    hulls = decompose_mesh(vertices, triangles, export_settings['hubs_collider_max_hulls'],
+                           export_settings['hubs_collider_hull_max_vertices'])
+
+    ammo_shape_data = hubs_extension.extension['ammo-shape']
+    collider_nodes = []
+    for hull in hulls:
+        hull_vertices, hull_triangles = build_convex_hull_mesh(hull)
+        if len(hull_triangles):
+            collider_nodes.append(create_collider_node(
+                f"{blender_object.name}_collider_{len(collider_nodes)}", hull_vertices, hull_triangles, ammo_shape_data))
+
+    # Keep the mesh collider if the mesh is too flat to be wrapped by hulls.
+    if not collider_nodes:
+        return
+
+    del hubs_extension.extension['ammo-shape']
+    if gltf2_object.children is None:
+        gltf2_object.children = []
+    gltf2_object.children.extend(collider_nodes)
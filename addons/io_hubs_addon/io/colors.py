@@ -0,0 +1,111 @@
+import numpy as np
+import struct
+
+# Number of levels of the 8 bit sRGB colors stored in the glTF components.
+COLOR_LEVELS = 256
+
+HEX_BYTES = tuple(f"{level:02x}" for level in range(COLOR_LEVELS))
+
+linear_to_srgb_thresholds = None
+srgb_to_linear_table = None
+color_properties = {}
+
+
+def float_from_bits(bits):
+    return struct.unpack('<d', struct.pack('<q', bits))[0]
+
+
+def float_to_bits(value):
+    return struct.unpack('<q', struct.pack('<d', value))[0]
+
+
+def get_linear_to_srgb_thresholds():
+    '''Returns the smallest linear value that gather_color_property quantizes to each sRGB level.
+    The thresholds are found by bisecting the float64 bit patterns with the scalar lin2srgb, so the batched conversion matches it exactly.'''
+    global linear_to_srgb_thresholds
+    if linear_to_srgb_thresholds is None:
+        from .utils import lin2srgb
+        thresholds = np.empty(COLOR_LEVELS, dtype=np.float64)
+        thresholds[0] = -np.inf
+        low = float_to_bits(0.0)
+        for level in range(1, COLOR_LEVELS):
+            # Positive floats sort like their bit patterns, and each threshold is above the previous one.
+            high = float_to_bits(1.0)
+            while low < high:
+                middle = (low + high) // 2
+                if lin2srgb(float_from_bits(middle)) * 256.0 >= level:
+                    high = middle
+                else:
+                    low = middle + 1
+            thresholds[level] = float_from_bits(low)
+        linear_to_srgb_thresholds = thresholds
+
+    return linear_to_srgb_thresholds
+
+
+def get_srgb_to_linear_table():
+    '''Returns the linear value of each 8 bit sRGB level, as set_color_from_hex stores it in COLOR properties.'''
+    global srgb_to_linear_table
+    if srgb_to_linear_table is None:
+        from .utils import srgb2lin
+        srgb_to_linear_table = tuple(srgb2lin(level / 255 if level > 0 else 0) for level in range(COLOR_LEVELS))
+
+    return srgb_to_linear_table
+
+
+def quantize_colors(colors, color_type):
+    '''Converts an (n, 3) array of Blender color values to 8 bit sRGB levels, like gather_color_property does for each color.'''
+    colors = np.asarray(colors, dtype=np.float64)
+    if color_type == "COLOR":
+        return np.searchsorted(get_linear_to_srgb_thresholds(), colors, side='right') - 1
+
+    return np.clip(np.floor(colors * 256.0), 0, COLOR_LEVELS - 1).astype(np.int64)
+
+
+def format_hex_colors(levels):
+    return ["#" + HEX_BYTES[r] + HEX_BYTES[g] + HEX_BYTES[b] for r, g, b in levels.tolist()]
+
+
+def get_color_properties(component_class):
+    '''Returns the (property_name, subtype) of the color properties of a component class.'''
+    properties = color_properties.get(component_class)
+    if properties is None:
+        properties = color_properties[component_class] = []
+        for property_name in component_class.get_properties():
+            property_definition = component_class.bl_rna.properties[property_name]
+            if getattr(property_definition, 'is_array', None) and property_definition.subtype.startswith('COLOR'):
+                properties.append((property_name, property_definition.subtype))
+
+    return properties
+
+
+def batch_gather_color_properties(export_settings, host_index):
+    '''Converts the color properties of all the indexed components at once, grouped by property.
+    gather_color_property picks up the results, falling back to converting the color itself for hosts that aren't indexed.'''
+    components_by_property = {}
+    for entry in host_index['entries']:
+        for _, component_class, component in entry['components']:
+            if not component_class:
+                continue
+            for property_key in get_color_properties(component_class):
+                components_by_property.setdefault(property_key, []).append(component)
+
+    gathered_colors = {}
+    for (property_name, color_type), components in components_by_property.items():
+        colors = [getattr(component, property_name)[:3] for component in components]
+        hex_colors = format_hex_colors(quantize_colors(colors, color_type))
+        for component, hex_color in zip(components, hex_colors):
+            gathered_colors[(component, property_name, color_type)] = hex_color
+
+    export_settings['hubs_gathered_colors'] = gathered_colors
+
+
+def get_gathered_color(export_settings, component, property_name, color_type):
+    gathered_colors = export_settings.get('hubs_gathered_colors')
+    if not gathered_colors:
+        return None
+    return gathered_colors.get((component, property_name, color_type))
+
+
+def clear_gathered_colors(export_settings):
+    export_settings.pop('hubs_gathered_colors', None)
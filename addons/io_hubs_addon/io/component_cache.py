@@ -0,0 +1,174 @@
+import bpy
+from bpy.app.handlers import persistent
+
+# Incremented on every depsgraph update, the change stamp of an ID is the value of the counter when it was last updated.
+# Component properties set through RNA tag their owner ID, so a host is unchanged as long as the stamp of its ID is.
+change_counter = 0
+# ID session uid -> change stamp. Only the IDs something is cached for are tracked, the others are ignored by the handler.
+change_stamps = {}
+
+# (ID session uid, bone name, component class) -> {'stamp', 'values'} with the gathered values of the properties that
+# don't reference other data.
+component_payloads = {}
+static_properties = {}
+
+payload_stats = {
+    'reused': 0,
+    'gathered': 0,
+}
+
+
+@persistent
+def component_change_handler(scene, depsgraph):
+    global change_counter
+    change_counter += 1
+    for update in depsgraph.updates:
+        session_uid = update.id.original.session_uid
+        if session_uid in change_stamps:
+            change_stamps[session_uid] = change_counter
+
+
+@persistent
+def clear_component_payloads_handler(*args):
+    # Undo and redo can restore properties without a depsgraph update and file load reallocates the IDs, so drop everything.
+    clear_component_payloads()
+
+
+def get_change_stamp(id_data):
+    '''Returns the change stamp of an ID and starts tracking it.
+    The depsgraph handler is only installed while IDs are tracked, so it costs nothing until the cache is used.'''
+    stamp = change_stamps.get(id_data.session_uid)
+    if stamp is None:
+        if component_change_handler not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(component_change_handler)
+        stamp = change_stamps[id_data.session_uid] = change_counter
+    return stamp
+
+
+def clear_component_payloads():
+    global change_counter
+    component_payloads.clear()
+    change_stamps.clear()
+    # Start from a new stamp so that nothing cached with the old stamps is considered unchanged.
+    change_counter += 1
+    if component_change_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(component_change_handler)
+
+
+def get_static_properties(component_class):
+    '''Returns the names of the properties of a component class whose gathered value only depends on the component itself.
+    Pointer properties are excluded, their gathered value references data of the current export.'''
+    properties = static_properties.get(component_class)
+    if properties is None:
+        properties = static_properties[component_class] = {
+            property_name for property_name in component_class.get_properties()
+            if component_class.bl_rna.properties[property_name].bl_rna.identifier != 'PointerProperty'
+        }
+
+    return properties
+
+
+def is_cacheable_component(component_class):
+    '''Only components exported with the default gather are cached, custom gathers may depend on anything.'''
+    from ..components.hubs_component import HubsComponent
+    return component_class.gather is HubsComponent.gather and bool(get_static_properties(component_class))
+
+
+def is_animated(id_data):
+    '''Animated and driven properties change with the frame, which can be set during the export, so they are never cached.'''
+    animation_data = getattr(id_data, 'animation_data', None)
+    return bool(animation_data and (animation_data.action or animation_data.drivers or animation_data.nla_tracks))
+
+
+def copy_value(value):
+    # Copy the gathered lists and dicts so the cached values are never shared with the glTF.
+    if isinstance(value, list):
+        return [copy_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: copy_value(item) for key, item in value.items()}
+    return value
+
+
+def get_payload_key(host, component_class):
+    bone_name = host.name if isinstance(host, (bpy.types.Bone, bpy.types.EditBone)) else None
+    return (host.id_data.session_uid, bone_name, component_class)
+
+
+def gather_component_payload(export_settings, host, component_class, component):
+    '''Gathers a component, reusing the values cached in a previous export if its host hasn't changed since.
+    Pointer properties are always gathered again so that they reference the nodes, materials and images of this export.'''
+    from .utils import get_gather_plan
+    id_data = host.id_data
+    if is_animated(id_data):
+        payload_stats['gathered'] += 1
+        return component.gather(export_settings, host)
+
+    key = get_payload_key(host, component_class)
+    export_settings['hubs_component_payload_keys'].add(key)
+    stamp = get_change_stamp(id_data)
+    cached = component_payloads.get(key)
+
+    if cached is None or cached['stamp'] != stamp:
+        data = component.gather(export_settings, host)
+        component_payloads[key] = {
+            'stamp': stamp,
+            'values': {name: copy_value(data[name]) for name in get_static_properties(component_class) if name in data}
+        }
+        payload_stats['gathered'] += 1
+        return data
+
+    cached_values = cached['values']
+    data = {}
+    for name, gather in get_gather_plan(component_class).items():
+        if name in cached_values:
+            data[name] = copy_value(cached_values[name])
+        else:
+            data[name] = gather(export_settings, host, component, name)
+
+    payload_stats['reused'] += 1
+    return data
+
+
+def prepare_component_payloads(export_settings):
+    for key in payload_stats:
+        payload_stats[key] = 0
+    export_settings['hubs_component_payload_keys'] = set()
+
+    # Flush the pending depsgraph updates so the change stamps include every edit made since the last export.
+    bpy.context.evaluated_depsgraph_get()
+
+
+def prune_component_payloads(export_settings):
+    '''Drops the payloads of the components that weren't exported this time, so the cache only holds one export's worth.'''
+    exported_keys = export_settings.pop('hubs_component_payload_keys', set())
+    for key in [key for key in component_payloads if key not in exported_keys]:
+        del component_payloads[key]
+
+    tracked_ids = {key[0] for key in component_payloads}
+    for session_uid in [session_uid for session_uid in change_stamps if session_uid not in tracked_ids]:
+        del change_stamps[session_uid]
+
+    if not change_stamps and component_change_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(component_change_handler)
+
+
+def get_payload_stats_report():
+    if not (payload_stats['reused'] or payload_stats['gathered']):
+        return ""
+
+    return (f"Hubs component cache: {payload_stats['reused']} components reused, "
+            f"{payload_stats['gathered']} components gathered")
+
+
+def register():
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post):
+        handlers.append(clear_component_payloads_handler)
+
+
+def unregister():
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post):
+        if clear_component_payloads_handler in handlers:
+            handlers.remove(clear_component_payloads_handler)
+
+    clear_component_payloads()
+    static_properties.clear()
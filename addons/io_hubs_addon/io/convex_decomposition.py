@@ -0,0 +1,248 @@
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from .ammo_shapes import compute_convex_hull, get_convex_hull_volume
+
+# Number of voxels along the longest side of the mesh bounds.
+VOXEL_RESOLUTION = 40
+# Parts whose hull is bigger than their voxels by less than this fraction of the mesh volume are not split further.
+CONCAVITY_THRESHOLD = 0.01
+# Number of cut planes tried along each axis when splitting a part.
+CUT_CANDIDATES_PER_AXIS = 5
+# Maximum number of points sampled along a triangle edge, this bounds the samples of triangles much larger than a voxel.
+MAX_EDGE_SUBDIVISIONS = 256
+# Number of decompositions kept in memory, so that exporting again doesn't decompose unchanged meshes.
+MAX_CACHED_DECOMPOSITIONS = 32
+
+# Mesh data hash -> list of hull vertex arrays
+decompositions = OrderedDict()
+
+CORNER_OFFSETS = np.array([(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)])
+
+
+def sample_triangles(vertices, triangles, spacing):
+    '''Returns the vertices and points on the triangles, spaced at most spacing apart along their edges.'''
+    samples = [vertices]
+    if not len(triangles):
+        return vertices
+
+    a, b, c = vertices[triangles[:, 0]], vertices[triangles[:, 1]], vertices[triangles[:, 2]]
+    edge_lengths = np.stack((
+        np.linalg.norm(b - a, axis=1), np.linalg.norm(c - b, axis=1), np.linalg.norm(a - c, axis=1)), axis=1).max(axis=1)
+    subdivisions = np.clip(np.ceil(edge_lengths / spacing), 1, MAX_EDGE_SUBDIVISIONS).astype(np.intp)
+
+    # Triangles are sampled on a barycentric grid, grouped by the number of subdivisions so every group is sampled at once.
+    for count in np.unique(subdivisions):
+        if count == 1:
+            continue
+        i, j = np.nonzero(np.add.outer(np.arange(count + 1), np.arange(count + 1)) <= count)
+        u = (i / count)[np.newaxis, :, np.newaxis]
+        v = (j / count)[np.newaxis, :, np.newaxis]
+        group = subdivisions == count
+        points = a[group, np.newaxis] * (1.0 - u - v) + b[group, np.newaxis] * u + c[group, np.newaxis] * v
+        samples.append(points.reshape(-1, 3))
+
+    return np.concatenate(samples)
+
+
+def fill_interior(surface):
+    '''Returns the voxels enclosed by the surface voxels, including them. Open meshes leak and only keep their surface.'''
+    padded = np.pad(surface, 1)
+    outside = np.zeros_like(padded)
+    outside[0, :, :] = outside[-1, :, :] = True
+    outside[:, 0, :] = outside[:, -1, :] = True
+    outside[:, :, 0] = outside[:, :, -1] = True
+    outside &= ~padded
+
+    outside_count = outside.sum()
+    while True:
+        grown = outside.copy()
+        grown[1:] |= outside[:-1]
+        grown[:-1] |= outside[1:]
+        grown[:, 1:] |= outside[:, :-1]
+        grown[:, :-1] |= outside[:, 1:]
+        grown[:, :, 1:] |= outside[:, :, :-1]
+        grown[:, :, :-1] |= outside[:, :, 1:]
+        grown &= ~padded
+        grown_count = grown.sum()
+        if grown_count == outside_count:
+            break
+        outside, outside_count = grown, grown_count
+
+    return ~outside[1:-1, 1:-1, 1:-1]
+
+
+def get_hull_corners(mask, origin, voxel_size):
+    '''Returns the voxel corners of the part that can be vertices of its convex hull.
+    A corner can only be a hull vertex if it's the first or last occupied corner along each of the three axis lines through it.'''
+    corners = np.zeros(tuple(np.array(mask.shape) + 1), dtype=bool)
+    for x, y, z in CORNER_OFFSETS:
+        corners[x:x + mask.shape[0], y:y + mask.shape[1], z:z + mask.shape[2]] |= mask
+
+    candidates = corners.copy()
+    for axis in range(3):
+        size = corners.shape[axis]
+        first = np.argmax(corners, axis=axis)
+        last = size - 1 - np.argmax(np.flip(corners, axis=axis), axis=axis)
+        positions = np.arange(size).reshape([-1 if index == axis else 1 for index in range(3)])
+        candidates &= (positions == np.expand_dims(first, axis)) | (positions == np.expand_dims(last, axis))
+
+    return np.argwhere(candidates) * voxel_size + origin
+
+
+def get_part_concavity(mask, origin, voxel_size):
+    '''Returns the volume of the convex hull of the part not covered by its voxels.'''
+    hull_volume = get_convex_hull_volume(get_hull_corners(mask, origin, voxel_size))
+    return max(hull_volume - mask.sum() * voxel_size ** 3, 0.0)
+
+
+def split_part(mask, coordinates, origin, voxel_size):
+    '''Splits the part with the axis aligned plane that minimizes the concavity of the two halves.
+    Returns the two halves, or None if the part can't be split.'''
+    best = None
+    occupied = np.nonzero(mask)
+    for axis in range(3):
+        low, high = occupied[axis].min(), occupied[axis].max()
+        if high == low:
+            continue
+
+        cuts = np.unique(np.linspace(low, high + 1, CUT_CANDIDATES_PER_AXIS + 2)[1:-1].round().astype(np.intp))
+        for cut in cuts:
+            if cut <= low or cut > high:
+                continue
+
+            below = coordinates[axis] < cut
+            halves = (mask & below, mask & ~below)
+            cost = sum(get_part_concavity(half, origin, voxel_size) for half in halves)
+            if best is None or cost < best[0]:
+                best = (cost, halves)
+
+    return best[1] if best else None
+
+
+def decompose_voxels(solid, origin, voxel_size, max_hulls):
+    '''Splits the solid voxels into at most max_hulls parts, always splitting the most concave part next.'''
+    coordinates = np.indices(solid.shape)
+    total_volume = solid.sum() * voxel_size ** 3
+    parts = [(get_part_concavity(solid, origin, voxel_size), solid)]
+    final_parts = []
+
+    while parts and len(parts) + len(final_parts) < max_hulls:
+        parts.sort(key=lambda part: part[0])
+        concavity, mask = parts.pop()
+        halves = split_part(mask, coordinates, origin, voxel_size) if concavity > CONCAVITY_THRESHOLD * total_volume else None
+        if halves is None:
+            final_parts.append(mask)
+            continue
+
+        for half in halves:
+            parts.append((get_part_concavity(half, origin, voxel_size), half))
+
+    return merge_parts(final_parts + [mask for _, mask in parts], origin, voxel_size, CONCAVITY_THRESHOLD * total_volume)
+
+
+def describe_part(mask, origin, voxel_size):
+    '''Returns the data merge_parts compares parts with, the hull of each part is only built once.'''
+    corners = get_hull_corners(mask, origin, voxel_size)
+    occupied = np.nonzero(mask)
+    return {
+        'mask': mask,
+        'corners': corners,
+        'volume': mask.sum() * voxel_size ** 3,
+        'hull_volume': get_convex_hull_volume(corners),
+        'min': np.array([axis.min() for axis in occupied]),
+        'max': np.array([axis.max() for axis in occupied]),
+    }
+
+
+def get_merged_concavity(part, other_part, max_concavity):
+    '''Returns the concavity of the union of two parts, or None if it's known to be over max_concavity without building its hull.'''
+    # Parts whose voxel bounds don't touch leave a gap that their union's hull has to cover.
+    if (part['min'] > other_part['max'] + 1).any() or (other_part['min'] > part['max'] + 1).any():
+        return None
+
+    # The hull of the union contains the hulls of both parts.
+    volume = part['volume'] + other_part['volume']
+    if max(part['hull_volume'], other_part['hull_volume']) - volume > max_concavity:
+        return None
+
+    # The hull vertices of the union are hull vertices of one of the parts.
+    concavity = get_convex_hull_volume(np.concatenate((part['corners'], other_part['corners']))) - volume
+    return max(concavity, 0.0) if concavity <= max_concavity else None
+
+
+def merge_parts(parts, origin, voxel_size, max_concavity):
+    '''Merges pairs of parts whose union is still convex enough, undoing splits that only had to be made
+    because the cut planes are picked from a few candidates. The most convex union is merged first.
+    The concavity of a pair is computed once, after a merge only the pairs with the merged part are computed.'''
+    parts = dict(enumerate(describe_part(mask, origin, voxel_size) for mask in parts))
+    next_id = len(parts)
+    merges = {}
+    for part_id in parts:
+        for other_id in parts:
+            if other_id > part_id:
+                merges[(part_id, other_id)] = get_merged_concavity(parts[part_id], parts[other_id], max_concavity)
+
+    while True:
+        candidates = [(concavity, pair) for pair, concavity in merges.items() if concavity is not None]
+        if not candidates:
+            break
+
+        _, (part_id, other_id) = min(candidates, key=lambda candidate: candidate[0])
+        merged = describe_part(parts.pop(part_id)['mask'] | parts.pop(other_id)['mask'], origin, voxel_size)
+        merges = {pair: concavity for pair, concavity in merges.items() if part_id not in pair and other_id not in pair}
+        for existing_id, existing in parts.items():
+            merges[(existing_id, next_id)] = get_merged_concavity(existing, merged, max_concavity)
+        parts[next_id] = merged
+        next_id += 1
+
+    return [part['mask'] for part in parts.values()]
+
+
+def get_decomposition_key(vertices, triangles, max_hulls, max_vertices):
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(vertices, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(triangles, dtype=np.int64).tobytes())
+    digest.update(f"{VOXEL_RESOLUTION}:{CONCAVITY_THRESHOLD}:{max_hulls}:{max_vertices}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def decompose_mesh(vertices, triangles, max_hulls, max_vertices):
+    '''Approximates the mesh with at most max_hulls convex hulls of at most max_vertices vertices each, V-HACD style.
+    The mesh is voxelized, and the voxels are split recursively with the axis aligned planes that reduce the concavity the most.
+    Every hull wraps the surface points of the mesh in its part.
+    The results are kept in memory by the hash of the mesh data, so unchanged meshes are only decomposed once.'''
+    key = get_decomposition_key(vertices, triangles, max_hulls, max_vertices)
+    hulls = decompositions.get(key)
+    if hulls is not None:
+        decompositions.move_to_end(key)
+        return hulls
+
+    origin = vertices.min(axis=0)
+    extent = vertices.max(axis=0) - origin
+    voxel_size = max(float(extent.max()) / VOXEL_RESOLUTION, 1e-6)
+    shape = np.maximum(np.ceil(extent / voxel_size).astype(np.intp), 1)
+
+    samples = sample_triangles(vertices, triangles, voxel_size * 0.5)
+    sample_voxels = np.clip(((samples - origin) / voxel_size).astype(np.intp), 0, shape - 1)
+    surface = np.zeros(shape, dtype=bool)
+    surface[tuple(sample_voxels.T)] = True
+    solid = fill_interior(surface)
+
+    hulls = []
+    for mask in decompose_voxels(solid, origin, voxel_size, max_hulls):
+        points = samples[mask[tuple(sample_voxels.T)]]
+        if len(points) < 4:
+            # Parts made of interior voxels only are wrapped by the corners of their voxels.
+            points = get_hull_corners(mask, origin, voxel_size)
+        hulls.append(compute_convex_hull(points, max_vertices))
+
+    decompositions[key] = hulls
+    while len(decompositions) > MAX_CACHED_DECOMPOSITIONS:
+        decompositions.popitem(last=False)
+
+    return hulls
+
+
+def clear_decompositions():
+    decompositions.clear()
@@ -0,0 +1,130 @@
+import bpy
+import time
+from contextlib import nullcontext
+
+
+class DelayedGatherScheduler:
+    '''Runs the component gathers that were delayed until all the nodes of the export or import were created.
+    Each gather records the hosts it references, the gathers of those hosts are run before it.
+    Reference cycles are broken by running the remaining gathers in the order they were added.'''
+
+    def __init__(self):
+        self.entries = []
+
+    def add(self, gather, component_name, host, references=(), on_result=None):
+        self.entries.append({
+            'gather': gather,
+            'component_name': component_name,
+            'host': host,
+            'references': references,
+            'on_result': on_result
+        })
+
+    def clear(self):
+        self.entries.clear()
+
+    def get_ordered_entries(self):
+        entries_by_host = {}
+        for entry in self.entries:
+            entries_by_host.setdefault(entry['host'], []).append(entry)
+
+        ordered_entries = []
+        visited = set()
+        for root_entry in self.entries:
+            if id(root_entry) in visited:
+                continue
+
+            visited.add(id(root_entry))
+            stack = [(root_entry, self.get_dependencies(root_entry, entries_by_host))]
+            while stack:
+                entry, dependencies = stack[-1]
+                dependency = next(dependencies, None)
+                if dependency is None:
+                    stack.pop()
+                    ordered_entries.append(entry)
+                elif id(dependency) not in visited:
+                    visited.add(id(dependency))
+                    stack.append((dependency, self.get_dependencies(dependency, entries_by_host)))
+
+        return ordered_entries
+
+    @staticmethod
+    def get_dependencies(entry, entries_by_host):
+        for reference in entry['references']:
+            for dependency in entries_by_host.get(reference, ()):
+                if dependency is not entry:
+                    yield dependency
+
+    def run(self, section=None, on_error=None):
+        '''Runs the gathers in dependency order and returns a (component_name, host, duration, error) tuple for each of them.
+        section returns a context manager to wrap each gather with, like export_profiler.profile.
+        Failed gathers are passed to on_error, or the exception is raised if there is no on_error.'''
+        results = []
+        entries = self.get_ordered_entries()
+        self.entries = []
+        for entry in entries:
+            error = None
+            start = time.perf_counter()
+            try:
+                with section(entry) if section else nullcontext():
+                    value = entry['gather']()
+                if entry['on_result']:
+                    entry['on_result'](value)
+            except Exception as err:
+                if on_error is None:
+                    raise
+                error = err
+                on_error(entry, err)
+            results.append((entry['component_name'], entry['host'], time.perf_counter() - start, error))
+
+        return results
+
+
+def get_component_references(component):
+    '''Returns the objects and materials referenced by the pointer properties of a component.
+    The bone selected in the bone_id property of bone targeting components is returned as well.'''
+    references = []
+    for property_name in type(component).get_properties():
+        property_definition = component.bl_rna.properties[property_name]
+        if property_definition.bl_rna.identifier != 'PointerProperty':
+            continue
+        if property_definition.fixed_type.identifier not in ('Object', 'Material'):
+            continue
+
+        target = getattr(component, property_name)
+        if not target:
+            continue
+
+        references.append(target)
+        bone_id = getattr(component, 'bone_id', None)
+        if bone_id and isinstance(target, bpy.types.Object) and target.type == 'ARMATURE':
+            bone = target.data.bones.get(bone_id)
+            if bone:
+                references.append(bone)
+
+    return references
+
+
+def get_import_references(gltf, component_value):
+    '''Returns the Blender objects and bones created for the nodes linked in an imported component.'''
+    references = []
+    if not isinstance(component_value, dict):
+        return references
+
+    for property_value in component_value.values():
+        if not isinstance(property_value, dict) or property_value.get('__mhc_link_type') != "node":
+            continue
+
+        vnode = gltf.vnodes.get(property_value.get('index'))
+        if vnode is None:
+            continue
+
+        if getattr(vnode, 'blender_object', None):
+            references.append(vnode.blender_object)
+        elif getattr(vnode, 'blender_bone_name', None) and vnode.bone_arma in gltf.vnodes:
+            armature = gltf.vnodes[vnode.bone_arma].blender_object
+            bone = armature.data.bones.get(vnode.blender_bone_name) if armature else None
+            if bone:
+                references.append(bone)
+
+    return references
@@ -0,0 +1,131 @@
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+PROFILE_FILE_SUFFIX = ".hubs-profile.json"
+
+# The profiler of the export in progress. A failed or cancelled export never reaches the post export callback,
+# so the next export stops the profiler it left behind.
+active_profiler = None
+
+
+class ExportProfiler:
+    '''Records the wall time, call count and net allocated memory of the export hooks and component gathers.
+    The results are written as a Chrome trace (chrome://tracing, Perfetto) with an aggregated summary.'''
+
+    def __init__(self):
+        self.events = []
+        self.summary = {}
+        self.started_tracemalloc = not tracemalloc.is_tracing()
+        if self.started_tracemalloc:
+            tracemalloc.start()
+        self.start_time = time.perf_counter()
+
+    @contextmanager
+    def section(self, name, category):
+        start = time.perf_counter()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            allocated = tracemalloc.get_traced_memory()[0] - start_memory
+            self.record(name, category, start, end, allocated)
+
+    def record(self, name, category, start, end, allocated):
+        duration = end - start
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.start_time) * 1e6,
+            "dur": duration * 1e6,
+            "pid": 1,
+            "tid": 1,
+            "args": {"allocated_bytes": allocated}
+        })
+
+        key = f"{category}:{name}"
+        stats = self.summary.get(key)
+        if stats is None:
+            stats = self.summary[key] = {
+                "name": name,
+                "category": category,
+                "calls": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "allocated_bytes": 0
+            }
+        stats["calls"] += 1
+        stats["total_ms"] += duration * 1e3
+        stats["max_ms"] = max(stats["max_ms"], duration * 1e3)
+        stats["allocated_bytes"] += allocated
+
+    def stop(self):
+        if self.started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.started_tracemalloc = False
+
+    def finish(self):
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        self.stop()
+
+        return {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "hubsSummary": {
+                "total_ms": (time.perf_counter() - self.start_time) * 1e3,
+                "peak_traced_bytes": peak_memory,
+                "sections": sorted(self.summary.values(), key=lambda stats: stats["total_ms"], reverse=True)
+            }
+        }
+
+
+def stop_export_profiler():
+    '''Stops the allocation tracking of a profiled export that didn't finish.'''
+    global active_profiler
+    if active_profiler is not None:
+        print("Warning: The previous Hubs export profile wasn't finished, stopping its allocation tracking")
+        active_profiler.stop()
+        active_profiler = None
+
+
+def start_export_profiler(export_settings):
+    global active_profiler
+    stop_export_profiler()
+    active_profiler = export_settings['hubs_profiler'] = ExportProfiler()
+
+
+def profile(export_settings, name, category="hook"):
+    '''Returns a context manager that records the enclosed code in the export profile, if profiling is enabled.'''
+    profiler = export_settings.get('hubs_profiler')
+    if profiler is None:
+        return nullcontext()
+    return profiler.section(name, category)
+
+
+def get_profile_path(export_settings):
+    filepath = export_settings.get('gltf_filepath', '')
+    return os.path.splitext(filepath)[0] + PROFILE_FILE_SUFFIX
+
+
+def finish_export_profiler(export_settings):
+    global active_profiler
+    profiler = export_settings.pop('hubs_profiler', None)
+    if profiler is None:
+        return
+
+    try:
+        profile_data = profiler.finish()
+    finally:
+        if active_profiler is profiler:
+            active_profiler = None
+    profile_path = get_profile_path(export_settings)
+    try:
+        with open(profile_path, 'w') as f:
+            json.dump(profile_data, f)
+        print(f"Hubs export profile written to {profile_path}")
+    except OSError as err:
+        print(f"Error: Unable to write the Hubs export profile to {profile_path}: {err}")
@@ -0,0 +1,369 @@
+import bpy
+import functools
+import hashlib
+import json
+import os
+import struct
+
+GLB_MAGIC = b'glTF'
+GLB_VERSION = 2
+GLB_HEADER_LENGTH = 12
+CHUNK_HEADER_LENGTH = 8
+CHUNK_TYPE_JSON = 0x4E4F534A
+CHUNK_TYPE_BIN = 0x004E4942
+BUFFER_VIEW_ALIGNMENT = 4
+COPY_BLOCK_SIZE = 1024 * 1024
+
+# Extensions that don't reference accessors, or whose accessor references are handled here. Unused accessors are only
+# stripped when every used extension is known, otherwise an unknown extension could still reference them.
+ACCESSOR_SAFE_EXTENSIONS = {
+    'MOZ_hubs_components',
+    'MOZ_lightmap',
+    'MOZ_texture_rgbe',
+    'KHR_draco_mesh_compression',
+    'KHR_lights_punctual',
+    'KHR_mesh_quantization',
+    'KHR_texture_basisu',
+    'KHR_texture_transform',
+    'EXT_mesh_gpu_instancing',
+    'EXT_texture_webp',
+}
+
+
+class GLBFormatError(Exception):
+    pass
+
+
+def read_glb_layout(f):
+    '''Reads the GLB header and JSON chunk and returns the parsed JSON with the offset and length of the BIN chunk data.
+    The BIN chunk itself is not read, buffer views are streamed from the file when needed.'''
+    header = f.read(GLB_HEADER_LENGTH)
+    if len(header) < GLB_HEADER_LENGTH:
+        raise GLBFormatError("File is too short to be a GLB")
+    magic, version, length = struct.unpack('<4sII', header)
+    if magic != GLB_MAGIC or version != GLB_VERSION:
+        raise GLBFormatError("Not a glTF 2.0 binary file")
+
+    chunk_length, chunk_type = struct.unpack('<II', f.read(CHUNK_HEADER_LENGTH))
+    if chunk_type != CHUNK_TYPE_JSON:
+        raise GLBFormatError("The first GLB chunk is not JSON")
+    gltf = json.loads(f.read(chunk_length).decode('utf-8'))
+
+    bin_offset = None
+    bin_length = 0
+    chunk_header = f.read(CHUNK_HEADER_LENGTH)
+    if len(chunk_header) == CHUNK_HEADER_LENGTH:
+        bin_length, chunk_type = struct.unpack('<II', chunk_header)
+        if chunk_type == CHUNK_TYPE_BIN:
+            bin_offset = f.tell()
+
+    return gltf, bin_offset, bin_length
+
+
+def iter_file_range(f, offset, length):
+    f.seek(offset)
+    while length > 0:
+        block = f.read(min(COPY_BLOCK_SIZE, length))
+        if not block:
+            raise GLBFormatError("Buffer view is out of the file bounds")
+        length -= len(block)
+        yield block
+
+
+def hash_buffer_view(f, bin_offset, buffer_view):
+    content_hash = hashlib.sha256()
+    for block in iter_file_range(f, bin_offset + buffer_view.get('byteOffset', 0), buffer_view['byteLength']):
+        content_hash.update(block)
+    return content_hash.hexdigest()
+
+
+def get_content_key(index, item):
+    '''Returns a key identifying the content of a JSON item, names and extras don't make items different.'''
+    return json.dumps({key: value for key, value in item.items() if key not in ('name', 'extras')}, sort_keys=True)
+
+
+def get_image_key(index, image):
+    if 'bufferView' not in image and 'uri' not in image:
+        return index
+    return get_content_key(index, image)
+
+
+def get_canonical_map(items, get_key):
+    '''Maps the index of every item to the index of the first item with the same key.'''
+    first_indices = {}
+    return [first_indices.setdefault(get_key(index, item), index) for index, item in enumerate(items)]
+
+
+def find_link_references(value, link_type, references):
+    '''Collects the (dict, key) of the __mhc_link_type links of the given type in the Hubs components.'''
+    if isinstance(value, dict):
+        if value.get('__mhc_link_type') == link_type and 'index' in value:
+            references.append((value, 'index'))
+        for child in value.values():
+            find_link_references(child, link_type, references)
+    elif isinstance(value, list):
+        for child in value:
+            find_link_references(child, link_type, references)
+    return references
+
+
+def find_texture_infos(value, references, key=None):
+    '''Collects the (dict, key) of the texture info indices in a material, including the MOZ_lightmap extension.'''
+    if isinstance(value, dict):
+        if '__mhc_link_type' in value:
+            # Component links are collected by find_link_references.
+            return references
+        if key and (key.endswith('Texture') or key == 'MOZ_lightmap') and 'index' in value:
+            references.append((value, 'index'))
+        for child_key, child in value.items():
+            find_texture_infos(child, references, child_key)
+    elif isinstance(value, list):
+        for child in value:
+            find_texture_infos(child, references, key)
+    return references
+
+
+def find_buffer_view_references(value, references):
+    if isinstance(value, dict):
+        if isinstance(value.get('bufferView'), int):
+            references.append((value, 'bufferView'))
+        for child in value.values():
+            find_buffer_view_references(child, references)
+    elif isinstance(value, list):
+        for child in value:
+            find_buffer_view_references(child, references)
+    return references
+
+
+def get_texture_references(gltf):
+    references = []
+    for material in gltf.get('materials', []):
+        find_texture_infos(material, references)
+    return find_link_references(gltf, "texture", references)
+
+
+def get_image_references(gltf):
+    references = []
+    for texture in gltf.get('textures', []):
+        if 'source' in texture:
+            references.append((texture, 'source'))
+        # MOZ_texture_rgbe and the other image format extensions store their image in the extension.
+        for extension in texture.get('extensions', {}).values():
+            if isinstance(extension, dict) and 'source' in extension:
+                references.append((extension, 'source'))
+    return find_link_references(gltf, "image", references)
+
+
+def get_sampler_references(gltf):
+    return [(texture, 'sampler') for texture in gltf.get('textures', []) if 'sampler' in texture]
+
+
+def get_accessor_references(gltf):
+    references = []
+    for mesh in gltf.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            references.extend((primitive['attributes'], name) for name in primitive.get('attributes', {}))
+            if 'indices' in primitive:
+                references.append((primitive, 'indices'))
+            for target in primitive.get('targets', []):
+                references.extend((target, name) for name in target)
+    for skin in gltf.get('skins', []):
+        if 'inverseBindMatrices' in skin:
+            references.append((skin, 'inverseBindMatrices'))
+    for animation in gltf.get('animations', []):
+        for sampler in animation.get('samplers', []):
+            references.extend((sampler, key) for key in ('input', 'output') if key in sampler)
+    for node in gltf.get('nodes', []):
+        instancing = node.get('extensions', {}).get('EXT_mesh_gpu_instancing')
+        if instancing:
+            references.extend((instancing['attributes'], name) for name in instancing.get('attributes', {}))
+    return references
+
+
+def can_strip_accessors(gltf):
+    return all(extension in ACCESSOR_SAFE_EXTENSIONS or extension.startswith('KHR_materials_')
+               for extension in gltf.get('extensionsUsed', []))
+
+
+def remap_references(references, index_map):
+    for container, key in references:
+        container[key] = index_map[container[key]]
+
+
+def compact(gltf, array_name, references):
+    '''Removes the items that aren't referenced from a top level array and remaps the references to the new indices.
+    Returns the number of removed items.'''
+    items = gltf.get(array_name)
+    if not items:
+        return 0
+
+    used = {container[key] for container, key in references}
+    index_map = {}
+    kept_items = []
+    for index, item in enumerate(items):
+        if index in used:
+            index_map[index] = len(kept_items)
+            kept_items.append(item)
+
+    remap_references(references, index_map)
+    if kept_items:
+        gltf[array_name] = kept_items
+    else:
+        # glTF arrays can't be empty.
+        del gltf[array_name]
+    return len(items) - len(kept_items)
+
+
+def deduplicate(gltf, array_name, references, get_key):
+    items = gltf.get(array_name, [])
+    canonical_map = get_canonical_map(items, get_key)
+    remap_references(references, canonical_map)
+
+
+def optimize_glb(filepath):
+    '''Deduplicates the buffer views, images, samplers and textures of a GLB file, strips the unused ones and rewrites
+    the file in place, remapping the Hubs component links and MOZ_texture_rgbe sources to the deduplicated items.
+    Returns a dict with the number of removed items per array and the number of bytes saved, or None if nothing changed.'''
+    with open(filepath, 'rb') as f:
+        gltf, bin_offset, bin_length = read_glb_layout(f)
+        buffers = gltf.get('buffers', [])
+        if len(buffers) != 1 or 'uri' in buffers[0] or bin_offset is None:
+            # Only self contained GLBs with a single BIN chunk buffer are optimized.
+            return None
+
+        buffer_views = gltf.get('bufferViews', [])
+        buffer_view_hashes = [hash_buffer_view(f, bin_offset, buffer_view) for buffer_view in buffer_views]
+
+        def get_buffer_view_key(index, buffer_view):
+            return (buffer_view['byteLength'], buffer_view.get('byteStride'), buffer_view.get('target'), buffer_view_hashes[index])
+
+        deduplicate(gltf, 'bufferViews', find_buffer_view_references(
+            {key: value for key, value in gltf.items() if key != 'bufferViews'}, []), get_buffer_view_key)
+        deduplicate(gltf, 'images', get_image_references(gltf), get_image_key)
+        deduplicate(gltf, 'samplers', get_sampler_references(gltf), get_content_key)
+        deduplicate(gltf, 'textures', get_texture_references(gltf), get_content_key)
+
+        removed = {}
+        removed['textures'] = compact(gltf, 'textures', get_texture_references(gltf))
+        removed['images'] = compact(gltf, 'images', get_image_references(gltf))
+        removed['samplers'] = compact(gltf, 'samplers', get_sampler_references(gltf))
+        if can_strip_accessors(gltf):
+            removed['accessors'] = compact(gltf, 'accessors', get_accessor_references(gltf))
+
+        buffer_view_references = find_buffer_view_references(
+            {key: value for key, value in gltf.items() if key != 'bufferViews'}, [])
+        removed['bufferViews'] = compact(gltf, 'bufferViews', buffer_view_references)
+
+        if not any(removed.values()):
+            return None
+
+        kept_buffer_views = gltf.get('bufferViews', [])
+        source_ranges = []
+        byte_length = 0
+        for buffer_view in kept_buffer_views:
+            source_ranges.append((bin_offset + buffer_view.get('byteOffset', 0), buffer_view['byteLength']))
+            byte_length += -byte_length % BUFFER_VIEW_ALIGNMENT
+            buffer_view['byteOffset'] = byte_length
+            byte_length += buffer_view['byteLength']
+        buffers[0]['byteLength'] = byte_length
+
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        try:
+            write_glb(f, tmp_path, gltf, source_ranges, byte_length)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    # The source file has to be closed before it's replaced, Windows doesn't allow replacing an open file.
+    try:
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    removed['bytes'] = bin_length - (byte_length + -byte_length % 4)
+    return removed
+
+
+def write_glb(src, dst_path, gltf, source_ranges, byte_length):
+    json_data = json.dumps(gltf, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    json_data += b' ' * (-len(json_data) % 4)
+    bin_chunk_length = byte_length + -byte_length % 4
+    total_length = GLB_HEADER_LENGTH + CHUNK_HEADER_LENGTH + len(json_data)
+    if source_ranges:
+        total_length += CHUNK_HEADER_LENGTH + bin_chunk_length
+
+    with open(dst_path, 'wb') as dst:
+        dst.write(struct.pack('<4sII', GLB_MAGIC, GLB_VERSION, total_length))
+        dst.write(struct.pack('<II', len(json_data), CHUNK_TYPE_JSON))
+        dst.write(json_data)
+        if not source_ranges:
+            return
+
+        dst.write(struct.pack('<II', bin_chunk_length, CHUNK_TYPE_BIN))
+        written = 0
+        for offset, length in source_ranges:
+            padding = -written % BUFFER_VIEW_ALIGNMENT
+            dst.write(b'\0' * padding)
+            for block in iter_file_range(src, offset, length):
+                dst.write(block)
+            written += padding + length
+        dst.write(b'\0' * (bin_chunk_length - written))
+
+
+def get_optimizer_report(filepath, removed):
+    removed_items = ", ".join(f"{count} {name}" for name, count in removed.items() if name != 'bytes' and count)
+    return f"Hubs GLB optimizer: removed {removed_items} from {filepath}, saving {removed['bytes'] / 1024 / 1024:.2f} MB"
+
+
+def run_glb_optimizer(filepath):
+    try:
+        removed = optimize_glb(filepath)
+    except (OSError, ValueError, KeyError, GLBFormatError) as err:
+        print(f"Error: Unable to optimize {filepath}: {err}")
+        return None
+
+    if removed:
+        print(get_optimizer_report(filepath, removed))
+
+
+# (filepath, steps, export start time) of the exports that weren't written yet when their post export callback ran in
+# background mode, where timers never fire. Scripts run them with run_pending_exported_file_steps once the export returns.
+pending_exported_file_steps = []
+
+
+def is_file_written(filepath, start_time):
+    return os.path.isfile(filepath) and os.path.getmtime(filepath) >= start_time
+
+
+def run_exported_file_steps(filepath, steps, start_time=0):
+    # Never run the steps on a missing file or on the file of a previous export, they could write back stale data.
+    if not is_file_written(filepath, start_time):
+        print(f"Warning: {filepath} wasn't written by the export, skipping the steps run on the exported file")
+        return
+
+    for step in steps:
+        step(filepath)
+
+
+def run_when_written(export_settings, steps):
+    '''Calls each step with the path of the exported file once it's written. Depending on the glTF add-on version the
+    post export callback runs before or after the file is written, in the former case the steps are deferred until the export is done.
+    Timers never fire in background mode so the steps are queued there until run_pending_exported_file_steps is called.'''
+    filepath = export_settings['gltf_filepath']
+    start_time = export_settings.get('hubs_export_start_time', 0)
+    if is_file_written(filepath, start_time):
+        run_exported_file_steps(filepath, steps, start_time)
+    elif bpy.app.background:
+        print(f"Warning: {filepath} isn't written yet, call run_pending_exported_file_steps() after the export returns to run the steps on it")
+        pending_exported_file_steps.append((filepath, steps, start_time))
+    else:
+        bpy.app.timers.register(functools.partial(run_exported_file_steps, filepath, steps, start_time), first_interval=0.0)
+
+
+def run_pending_exported_file_steps():
+    '''Runs the steps queued by the exports that weren't written yet in background mode.
+    Scripts exporting in the background call this once the export operator has returned.'''
+    while pending_exported_file_steps:
+        run_exported_file_steps(*pending_exported_file_steps.pop(0))
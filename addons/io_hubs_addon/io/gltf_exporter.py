@@ -1,8 +1,26 @@
 import bpy
-from .utils import HUBS_CONFIG
+from .utils import HUBS_CONFIG, get_vnode_index
+from .image_cache import reset_cache_stats, get_cache_stats_report
+from .image_prefetch import prefetch_images, clear_prefetched_images
+from .image_resize import (
+    gather_image_size_caps, clear_image_size_caps, clear_resized_images, reset_resize_stats, get_resize_stats_report)
+from .colors import batch_gather_color_properties, clear_gathered_colors
+from .delayed_gathers import DelayedGatherScheduler, get_component_references
+from .lightmap_cache import has_lightmap_nodes
+from . import lightmap_cache
+from . import component_cache
+from .glb_optimizer import run_glb_optimizer, run_when_written
+from .size_report import run_size_report, get_size_budgets
+from . import size_report
+from .ammo_shapes import add_collider_hull_nodes
+from .convex_decomposition import clear_decompositions
+from .export_profiler import start_export_profiler, stop_export_profiler, finish_export_profiler, profile
 from bpy.props import PointerProperty
-from ..components.components_registry import get_components_registry
-from ..components.utils import get_host_components
+from ..components.types import PanelType
+from ..components.utils import build_host_index, get_host_component_items
+import functools
+import operator
+import time
 import traceback
 
 if bpy.app.version < (3, 0, 0):
@@ -23,6 +41,8 @@ def patched_gather_gltf(exporter, export_settings):
 
 EXTENSION_NAME = HUBS_CONFIG["gltfExtensionName"]
 EXTENSION_VERSION = HUBS_CONFIG["gltfExtensionVersion"]
+# Delayed gathers taking longer than this (in seconds) are reported in the console.
+SLOW_DELAYED_GATHER_TIME = 0.1
 
 
 def get_version_string():
@@ -31,43 +51,31 @@ def get_version_string():
     return f"{info[0]}.{info[1]}.{info[2]}"
 
 
+def get_host_index(export_settings):
+    host_index = export_settings.get('hubs_host_index')
+    if host_index is None:
+        host_index = build_host_index()
+        export_settings['hubs_host_index'] = host_index
+    return host_index
+
+
 def export_callback(callback_method, export_settings):
-    # Note: we loop through copied lists of the potential component hosts
-    # to allow the callbacks to change the host names.  This is needed
-    # because a name change will cause Blender to update the host lists in
-    # mid iteration and so multiple callbacks could be executed for the same
-    # component/host.
-
-    for scene in bpy.data.scenes[:]:
-        for component in get_host_components(scene):
-            component_callback = getattr(component, callback_method)
-            try:
-                component_callback(export_settings, scene)
-            except Exception:
-                traceback.print_exc()
+    # Note: the host index holds copied lists of the component hosts to allow the callbacks to change the host names.
+    # This is needed because a name change will cause Blender to update the host lists in mid iteration and so multiple
+    # callbacks could be executed for the same component/host.
 
-    for ob in bpy.data.objects[:]:
-        for component in get_host_components(ob):
-            component_callback = getattr(component, callback_method)
-            try:
-                component_callback(export_settings, ob, ob)
-            except Exception:
-                traceback.print_exc()
+    for entry in get_host_index(export_settings)['entries']:
+        if entry['panel_type'] == PanelType.BONE and type(entry['ob']) is not bpy.types.Object:
+            # Bones from armatures without objects aren't exported.
+            continue
+
+        for _, component_class, component in entry['components']:
+            if not component_class:
+                continue
 
-        if ob.type == 'ARMATURE':
-            for bone in ob.data.bones[:]:
-                for component in get_host_components(bone):
-                    component_callback = getattr(component, callback_method)
-                    try:
-                        component_callback(export_settings, bone, ob)
-                    except Exception:
-                        traceback.print_exc()
-
-    for material in bpy.data.materials[:]:
-        for component in get_host_components(material):
             component_callback = getattr(component, callback_method)
             try:
-                component_callback(export_settings, material)
+                component_callback(export_settings, entry['host'], entry['ob'])
             except Exception:
                 traceback.print_exc()
 
@@ -81,7 +89,34 @@ def glTF2_pre_export_callback(export_settings):
         from io_scene_gltf2.blender.com.gltf2_blender_extras import BLACK_LIST
 
     BLACK_LIST.extend(glTF2ExportUserExtension.EXCLUDED_PROPERTIES)
-    export_callback("pre_export", export_settings)
+    export_settings['hubs_export_start_time'] = time.time()
+    reset_cache_stats()
+    reset_resize_stats()
+    stop_export_profiler()
+    if bpy.context.scene.HubsComponentsExtensionProperties.profile_export:
+        start_export_profiler(export_settings)
+
+    with profile(export_settings, "pre_export"):
+        export_callback("pre_export", export_settings)
+
+    props = bpy.context.scene.HubsComponentsExtensionProperties
+    if props.precompute_colliders or props.decompose_mesh_colliders:
+        export_settings['hubs_precompute_colliders'] = props.precompute_colliders
+        export_settings['hubs_decompose_mesh_colliders'] = props.decompose_mesh_colliders
+        export_settings['hubs_collider_max_hulls'] = props.collider_max_hulls
+        export_settings['hubs_collider_hull_max_vertices'] = props.collider_hull_max_vertices
+
+    if bpy.context.scene.HubsComponentsExtensionProperties.enabled:
+        if props.reuse_components:
+            component_cache.prepare_component_payloads(export_settings)
+            export_settings['hubs_reuse_components'] = True
+        with profile(export_settings, "has_lightmap_nodes"):
+            export_settings['hubs_has_lightmaps'] = has_lightmap_nodes()
+        gather_image_size_caps(export_settings, get_host_index(export_settings))
+        with profile(export_settings, "prefetch_images"):
+            prefetch_images(export_settings, get_host_index(export_settings))
+        with profile(export_settings, "batch_gather_color_properties"):
+            batch_gather_color_properties(export_settings, get_host_index(export_settings))
 
 
 def glTF2_post_export_callback(export_settings):
@@ -92,11 +127,49 @@ def glTF2_post_export_callback(export_settings):
     else:
         from io_scene_gltf2.blender.com.gltf2_blender_extras import BLACK_LIST
 
-    export_callback("post_export", export_settings)
+    with profile(export_settings, "post_export"):
+        export_callback("post_export", export_settings)
+    export_settings.pop('hubs_host_index', None)
+    clear_prefetched_images(export_settings)
+    clear_gathered_colors(export_settings)
+    clear_image_size_caps(export_settings)
+    clear_resized_images()
+    export_settings.pop('hubs_has_lightmaps', None)
+    export_settings.pop('hubs_precompute_colliders', None)
+    export_settings.pop('hubs_decompose_mesh_colliders', None)
+    export_settings.pop('hubs_collider_max_hulls', None)
+    export_settings.pop('hubs_collider_hull_max_vertices', None)
+    finish_export_profiler(export_settings)
+
+    cache_stats_report = get_cache_stats_report()
+    if cache_stats_report:
+        print(cache_stats_report)
+
+    resize_stats_report = get_resize_stats_report()
+    if resize_stats_report:
+        print(resize_stats_report)
+
+    if export_settings.pop('hubs_reuse_components', False):
+        component_cache.prune_component_payloads(export_settings)
+        payload_stats_report = component_cache.get_payload_stats_report()
+        if payload_stats_report:
+            print(payload_stats_report)
+
     for excluded_prop in glTF2ExportUserExtension.EXCLUDED_PROPERTIES:
         if excluded_prop in BLACK_LIST:
             BLACK_LIST.remove(excluded_prop)
 
+    props = bpy.context.scene.HubsComponentsExtensionProperties
+    if export_settings['gltf_format'] == 'GLB':
+        exported_file_steps = []
+        if props.optimize_glb:
+            exported_file_steps.append(run_glb_optimizer)
+        if props.write_size_report:
+            exported_file_steps.append(functools.partial(
+                run_size_report, budgets=get_size_budgets(bpy.context.scene), display_report=True))
+        if exported_file_steps:
+            run_when_written(export_settings, exported_file_steps)
+
 
 # This class name is specifically looked for by gltf-blender-io and it's hooks are automatically invoked on export
 
@@ -123,7 +196,7 @@ class glTF2ExportUserExtension:
         self.Extension = Extension
         self.properties = bpy.context.scene.HubsComponentsExtensionProperties
         self.was_used = False
-        self.delayed_gathers = []
+        self.delayed_gathers = DelayedGatherScheduler()
 
     def hubs_gather_gltf_hook(self, gltf2_object, export_settings):
         if not self.properties.enabled or not self.was_used:
@@ -152,19 +225,28 @@ class glTF2ExportUserExtension:
         if not self.properties.enabled:
             return
 
-        self.export_hubs_components(gltf2_object, blender_scene, export_settings)
-        self.call_delayed_gathers()
+        with profile(export_settings, "gather_scene_hook"):
+            self.export_hubs_components(gltf2_object, blender_scene, export_settings)
+            self.call_delayed_gathers(export_settings)
 
     def gather_node_hook(self, gltf2_object, blender_object, export_settings):
         if not self.properties.enabled:
             return
 
-        self.export_hubs_components(gltf2_object, blender_object, export_settings)
+        with profile(export_settings, "gather_node_hook"):
+            self.export_hubs_components(gltf2_object, blender_object, export_settings)
+            if export_settings.get('hubs_decompose_mesh_colliders'):
+                with profile(export_settings, "add_collider_hull_nodes"):
+                    add_collider_hull_nodes(gltf2_object, blender_object, export_settings)
 
     def gather_material_hook(self, gltf2_object, blender_material, export_settings):
         if not self.properties.enabled:
             return
 
+        with profile(export_settings, "gather_material_hook"):
+            self.gather_material(gltf2_object, blender_material, export_settings)
+
+    def gather_material(self, gltf2_object, blender_material, export_settings):
         if bpy.app.version >= (5, 2, 0):
             # The glTF add-on in Blender 5.2+ no longer passes the actual Blender material, so we need to look it up ourselves
             blender_material = bpy.data.materials[gltf2_object.name]
@@ -174,8 +256,9 @@ class glTF2ExportUserExtension:
 
         from .utils import gather_lightmap_texture_info
         if blender_material.node_tree and blender_material.use_nodes:
-            lightmap_texture_info = gather_lightmap_texture_info(
-                blender_material, export_settings)
+            with profile(export_settings, "gather_lightmap_texture_info"):
+                lightmap_texture_info = gather_lightmap_texture_info(
+                    blender_material, export_settings)
             if lightmap_texture_info:
                 gltf2_object.extensions["MOZ_lightmap"] = self.Extension(
                     name="MOZ_lightmap",
@@ -194,34 +277,54 @@ class glTF2ExportUserExtension:
     def gather_joint_hook(self, gltf2_object, blender_pose_bone, export_settings):
         if not self.properties.enabled:
             return
-        self.export_hubs_components(
-            gltf2_object, blender_pose_bone.bone, export_settings)
-
-    def call_delayed_gathers(self):
-        for delayed_gather in self.delayed_gathers:
-            component_data, component_name, gather = delayed_gather
-            component_data[component_name] = gather()
-        self.delayed_gathers.clear()
+        with profile(export_settings, "gather_joint_hook"):
+            self.export_hubs_components(
+                gltf2_object, blender_pose_bone.bone, export_settings)
+
+    def call_delayed_gathers(self, export_settings=None):
+        export_settings = export_settings or {}
+
+        def report_failure(entry, err):
+            # Like the other component gathers, a failure stops the export, this only adds which component failed.
+            raise Exception(
+                f"Failed to export the {entry['component_name']} component on {entry['host'].name}: {err}") from err
+
+        with profile(export_settings, "call_delayed_gathers"):
+            if 'vtree' in export_settings:
+                # Index the vtree once up front so the node lookups of the delayed gathers don't scan it.
+                get_vnode_index(export_settings)
+            results = self.delayed_gathers.run(
+                section=lambda entry: profile(export_settings, entry['component_name'], category="component"),
+                on_error=report_failure)
+
+        for component_name, host, duration, _ in results:
+            if duration >= SLOW_DELAYED_GATHER_TIME:
+                print(f"Warning: Gathering the {component_name} component on {host.name} took {duration * 1000:.0f} ms")
 
     def export_hubs_components(self, gltf2_object, blender_object, export_settings):
-        component_list = blender_object.hubs_component_list
-
-        registered_hubs_components = get_components_registry()
+        host_index = export_settings.get('hubs_host_index')
+        entry = host_index['hosts'].get(blender_object) if host_index else None
+        # Hosts that aren't in the index, like the ones created during the export, are resolved on the spot.
+        component_items = entry['components'] if entry else get_host_component_items(blender_object)
 
-        if component_list.items:
+        if component_items:
             extension_name = EXTENSION_NAME
             component_data = {}
-
-            for component_item in component_list.items:
-                component_name = component_item.name
-                if component_name in registered_hubs_components:
-                    component_class = registered_hubs_components[component_name]
-                    component = getattr(
-                        blender_object, component_class.get_id())
-                    data = component.gather(export_settings, blender_object)
+            reuse_components = export_settings.get('hubs_reuse_components', False)
+
+            for component_name, component_class, component in component_items:
+                if component_class:
+                    with profile(export_settings, component_class.gather_name(), category="component"):
+                        if reuse_components and component_cache.is_cacheable_component(component_class):
+                            data = component_cache.gather_component_payload(
+                                export_settings, blender_object, component_class, component)
+                        else:
+                            data = component.gather(export_settings, blender_object)
                     if hasattr(data, "delayed_gather"):
-                        self.delayed_gathers.append(
-                            (component_data, component_class.gather_name(), data))
+                        self.delayed_gathers.add(
+                            data, component_class.gather_name(), blender_object,
+                            references=get_component_references(component),
+                            on_result=functools.partial(operator.setitem, component_data, component_class.gather_name()))
                     else:
                         component_data[component_class.gather_name()] = data
                 else:
@@ -245,6 +348,76 @@ class HubsComponentsExtensionProperties(bpy.types.PropertyGroup):
         description='Include this extension in the exported glTF file',
         default=True
     )
+    optimize_glb: bpy.props.BoolProperty(
+        name="Deduplicate GLB Data",
+        description="After exporting a GLB, merge identical images, textures, samplers and buffer views and remove the unused ones, remapping the component references to them",
+        default=False
+    )
+    write_size_report: bpy.props.BoolProperty(
+        name="Write Size Report",
+        description="After exporting a GLB, break down its size by meshes, textures, animations and components, check it against the scene's size budgets and compare it with the previous export of the same file. The report is written as a JSON file next to the exported file",
+        default=False
+    )
+    size_budget_total: bpy.props.FloatProperty(
+        name="Total Size Budget",
+        description="Maximum size of the exported GLB file in megabytes, 0 disables the budget",
+        default=0.0, min=0.0
+    )
+    size_budget_meshes: bpy.props.FloatProperty(
+        name="Meshes Size Budget",
+        description="Maximum size of the mesh data of the exported GLB file in megabytes, 0 disables the budget",
+        default=0.0, min=0.0
+    )
+    size_budget_textures: bpy.props.FloatProperty(
+        name="Textures Size Budget",
+        description="Maximum size of the images of the exported GLB file in megabytes, 0 disables the budget",
+        default=0.0, min=0.0
+    )
+    reuse_components: bpy.props.BoolProperty(
+        name="Reuse Unchanged Components",
+        description="Reuse the component data gathered in the previous export for objects, bones, materials and scenes that haven't changed since. Components with custom export logic, animated hosts and properties referencing other data are always gathered again",
+        default=False
+    )
+    profile_export: bpy.props.BoolProperty(
+        name="Write Export Profile",
+        description="Record the time, call count and allocations of the Hubs export hooks and components and write them as a Chrome trace JSON file next to the exported file. Allocation tracking slows down the export",
+        default=False
+    )
+    max_env_map_size: bpy.props.IntProperty(
+        name="Max Environment Map Size",
+        description="Maximum width or height in pixels of the environment map and background images exported by the Environment Settings component. Larger images are scaled down, 0 exports them at their full resolution",
+        default=0, min=0, subtype='PIXEL'
+    )
+    max_lightmap_size: bpy.props.IntProperty(
+        name="Max Lightmap Size",
+        description="Maximum width or height in pixels of the exported lightmap images. Larger images are scaled down, 0 exports them at their full resolution",
+        default=0, min=0, subtype='PIXEL'
+    )
+    max_probe_size: bpy.props.IntProperty(
+        name="Max Reflection Probe Size",
+        description="Maximum width or height in pixels of the exported reflection probe images. Larger images are scaled down, 0 exports them at their full resolution",
+        default=0, min=0, subtype='PIXEL'
+    )
+    precompute_colliders: bpy.props.BoolProperty(
+        name="Precompute Colliders",
+        description="Compute the box half extents and sphere radius of automatically fitted Ammo Shape colliders at export, so the Hubs client doesn't have to compute them from the object's vertices when the scene loads",
+        default=False
+    )
+    decompose_mesh_colliders: bpy.props.BoolProperty(
+        name="Decompose Mesh Colliders",
+        description="Replace Ammo Shape mesh colliders with an approximate convex decomposition, exported as convex hull colliders on generated child nodes. Convex hulls are much cheaper to simulate than meshes",
+        default=False
+    )
+    collider_max_hulls: bpy.props.IntProperty(
+        name="Max Hulls",
+        description="Maximum number of convex hulls a mesh collider is decomposed into",
+        default=16, min=1, max=256
+    )
+    collider_hull_max_vertices: bpy.props.IntProperty(
+        name="Max Hull Vertices",
+        description="Maximum number of vertices of the decomposed convex hull colliders, larger hulls are simplified",
+        default=64, min=4
+    )
 
 
 class HubsGLTFExportPanel(bpy.types.Panel):
@@ -278,8 +451,22 @@ class HubsGLTFExportPanel(bpy.types.Panel):
         props = bpy.context.scene.HubsComponentsExtensionProperties
         layout.active = props.enabled
 
-        box = layout.box()
-        box.label(text="No options yet")
+        col = layout.column(heading="Max Image Size")
+        col.prop(props, 'max_env_map_size', text="Environment Maps")
+        col.prop(props, 'max_lightmap_size', text="Lightmaps")
+        col.prop(props, 'max_probe_size', text="Reflection Probes")
+
+        layout.prop(props, 'precompute_colliders')
+        layout.prop(props, 'decompose_mesh_colliders')
+        col = layout.column()
+        col.enabled = props.decompose_mesh_colliders
+        col.prop(props, 'collider_max_hulls')
+        col.prop(props, 'collider_hull_max_vertices')
+
+        layout.prop(props, 'reuse_components')
+        layout.prop(props, 'optimize_glb')
+        layout.prop(props, 'write_size_report')
+        layout.prop(props, 'profile_export')
 
 
 def register():
@@ -290,10 +477,19 @@ def register():
     bpy.types.Scene.HubsComponentsExtensionProperties = PointerProperty(
         type=HubsComponentsExtensionProperties)
     glTF2ExportUserExtension.add_excluded_property("HubsComponentsExtensionProperties")
+    size_report.register()
+    component_cache.register()
+    lightmap_cache.register()
 
 
 def unregister():
     print("Unregister glTF Exporter")
+    size_report.unregister()
+    component_cache.unregister()
+    lightmap_cache.unregister()
+    stop_export_profiler()
+    clear_resized_images()
+    clear_decompositions()
     del bpy.types.Scene.HubsComponentsExtensionProperties
     bpy.utils.unregister_class(HubsComponentsExtensionProperties)
     if bpy.app.version < (3, 0, 0):
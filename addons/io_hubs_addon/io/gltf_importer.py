@@ -1,6 +1,7 @@
 import bpy
 import traceback
 from .utils import HUBS_CONFIG, import_image, import_all_textures
+from .delayed_gathers import DelayedGatherScheduler, get_import_references
 from ..components.components_registry import get_component_by_name
 from bpy.props import BoolProperty, PointerProperty
 
@@ -19,25 +20,23 @@ else:
 EXTENSION_NAME = HUBS_CONFIG["gltfExtensionName"]
 
 armatures = {}
-delayed_gathers = []
+delayed_gathers = DelayedGatherScheduler()
 import_report = []
 
 
 def call_delayed_gathers():
     global delayed_gathers
     global import_report
-    for gather_import in delayed_gathers:
-        gather_import_args = gather_import.__closure__[0].cell_contents
-        blender_host = gather_import_args[2]
-        component_name = gather_import_args[3]
-        try:
-            gather_import()
-        except Exception:
-            traceback.print_exc()
-            print(f"Failed to import {component_name} component on {blender_host.name} continuing on...")
-            import_report.append(
-                f"Failed to import {component_name} component on {blender_host.name}.  See the console for details.")
-    delayed_gathers.clear()
+
+    def report_failure(entry, err):
+        component_name = entry['component_name']
+        blender_host = entry['host']
+        traceback.print_exc()
+        print(f"Failed to import {component_name} component on {blender_host.name} continuing on...")
+        import_report.append(
+            f"Failed to import {component_name} component on {blender_host.name}.  See the console for details.")
+
+    delayed_gathers.run(on_error=report_failure)
 
 
 def import_hubs_components(gltf_node, blender_host, gltf, blender_ob=None):
@@ -53,7 +52,9 @@ def import_hubs_components(gltf_node, blender_host, gltf, blender_ob=None):
                         gltf, blender_host, component_name, component_value, import_report, blender_ob=blender_ob)
                     if data and hasattr(data, "delayed_gather"):
                         global delayed_gathers
-                        delayed_gathers.append((data))
+                        delayed_gathers.add(
+                            data, component_name, blender_host,
+                            references=get_import_references(gltf, component_value))
                 except Exception:
                     traceback.print_exc()
                     print(f"Failed to import {component_name} component on {blender_host.name} continuing on...")
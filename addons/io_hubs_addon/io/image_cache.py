@@ -0,0 +1,204 @@
+import bpy
+import hashlib
+import os
+from ..utils import get_prefs_dir_path
+
+# Bump this whenever the way images are encoded changes so that old cache entries are ignored.
+IMAGE_CACHE_VERSION = 1
+IMAGE_CACHE_DIR = "image_cache"
+IMAGE_CACHE_EXTENSION = ".bin"
+
+cache_stats = {
+    'hits': 0,
+    'misses': 0,
+    'uncacheable': 0,
+    'evictions': 0,
+    'bytes_reused': 0,
+    'bytes_written': 0,
+}
+
+
+def get_image_cache_dir():
+    return os.path.normpath(os.path.join(get_prefs_dir_path(), IMAGE_CACHE_DIR))
+
+
+def get_image_cache_settings():
+    '''Returns whether the encoded images cache is enabled and its maximum size in bytes.'''
+    try:
+        from ..preferences import get_addon_pref
+        addon_prefs = get_addon_pref(bpy.context)
+        return addon_prefs.use_image_cache, addon_prefs.image_cache_max_size * 1024 * 1024
+    except (KeyError, AttributeError):
+        # The preferences are not available when the add-on is not enabled, for example when running the tests.
+        return False, 0
+
+
+def get_image_source_signature(blender_image):
+    '''Returns a string identifying the contents of the image source, or None if the image can't be cached.
+    Packed images are identified by the hash of the packed data, and external files by their path, modification time and size.
+    In memory images (generated, rendered, or modified and not saved) are not cached.'''
+    if blender_image.source != 'FILE' or blender_image.is_dirty:
+        return None
+
+    if blender_image.packed_file is not None:
+        return "packed:" + hashlib.sha256(blender_image.packed_file.data).hexdigest()
+
+    src_path = bpy.path.abspath(blender_image.filepath_raw, library=blender_image.library)
+    try:
+        stat = os.stat(src_path)
+    except OSError:
+        return None
+
+    return f"file:{os.path.normcase(os.path.abspath(src_path))}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def get_image_cache_key(blender_image, mime_type, export_settings, resized_size=None):
+    '''Returns the cache key for the encoded image, or None if the cache is disabled or the image can't be cached.
+    Images scaled down to their size cap are keyed by the size they are exported at as well.'''
+    use_image_cache, _ = get_image_cache_settings()
+    if not use_image_cache:
+        return None
+
+    source_signature = get_image_source_signature(blender_image)
+    if source_signature is None:
+        cache_stats['uncacheable'] += 1
+        return None
+
+    return build_image_cache_key(blender_image, source_signature, mime_type, export_settings, resized_size)
+
+
+def build_image_cache_key(blender_image, source_signature, mime_type, export_settings, resized_size=None):
+    key_parts = [
+        str(IMAGE_CACHE_VERSION),
+        bpy.app.version_string,
+        source_signature,
+        mime_type,
+        str(export_settings.get('gltf_image_format')),
+        str(export_settings.get('gltf_image_quality')),
+        blender_image.file_format,
+        blender_image.colorspace_settings.name,
+        blender_image.alpha_mode,
+        str(blender_image.channels),
+        str(tuple(blender_image.size)),
+    ]
+    if resized_size is not None:
+        key_parts.append(f"resized:{tuple(resized_size)}")
+    return hashlib.sha256("\n".join(key_parts).encode("utf-8")).hexdigest()
+
+
+def get_cache_entry_path(cache_key):
+    return os.path.join(get_image_cache_dir(), cache_key + IMAGE_CACHE_EXTENSION)
+
+
+def has_cached_image(blender_image, mime_type, export_settings, resized_size=None):
+    '''Returns whether the encoded image is in the cache, without counting it in the cache stats.'''
+    use_image_cache, _ = get_image_cache_settings()
+    if not use_image_cache:
+        return False
+
+    source_signature = get_image_source_signature(blender_image)
+    if source_signature is None:
+        return False
+
+    cache_key = build_image_cache_key(blender_image, source_signature, mime_type, export_settings, resized_size)
+    return os.path.isfile(get_cache_entry_path(cache_key))
+
+
+def read_cached_image(cache_key):
+    entry_path = get_cache_entry_path(cache_key)
+    try:
+        with open(entry_path, 'rb') as f:
+            data = f.read()
+        # Touch the entry so that eviction removes the least recently used entries first.
+        os.utime(entry_path)
+    except OSError:
+        cache_stats['misses'] += 1
+        return None
+
+    cache_stats['hits'] += 1
+    cache_stats['bytes_reused'] += len(data)
+    return data
+
+
+def write_cached_image(cache_key, data):
+    cache_dir = get_image_cache_dir()
+    entry_path = get_cache_entry_path(cache_key)
+    tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        # Replace atomically so that concurrent exports never read a partially written entry.
+        os.replace(tmp_path, entry_path)
+    except OSError as err:
+        print(f"Warning: Unable to write the image cache entry {entry_path}: {err}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
+
+    cache_stats['bytes_written'] += len(data)
+    _, max_size = get_image_cache_settings()
+    evict_image_cache(max_size)
+
+
+def get_cache_entries():
+    cache_dir = get_image_cache_dir()
+    entries = []
+    if not os.path.isdir(cache_dir):
+        return entries
+
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(IMAGE_CACHE_EXTENSION):
+            stat = entry.stat()
+            entries.append((entry.path, stat.st_size, stat.st_mtime))
+    return entries
+
+
+def evict_image_cache(max_size):
+    '''Removes the least recently used entries until the cache size is below max_size bytes.'''
+    entries = get_cache_entries()
+    total_size = sum(size for _, size, _ in entries)
+    if total_size <= max_size:
+        return
+
+    entries.sort(key=lambda entry: entry[2])
+    for path, size, _ in entries:
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
+        cache_stats['evictions'] += 1
+
+
+def clear_image_cache():
+    for path, _, _ in get_cache_entries():
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def get_image_cache_info():
+    '''Returns the number of entries and the total size in bytes of the cache.'''
+    entries = get_cache_entries()
+    return len(entries), sum(size for _, size, _ in entries)
+
+
+def reset_cache_stats():
+    for key in cache_stats:
+        cache_stats[key] = 0
+
+
+def get_cache_stats_report():
+    if not (cache_stats['hits'] or cache_stats['misses'] or cache_stats['uncacheable']):
+        return ""
+
+    entries_count, cache_size = get_image_cache_info()
+    return (f"Hubs image cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+            f"{cache_stats['uncacheable']} uncacheable, {cache_stats['evictions']} evictions, "
+            f"{cache_stats['bytes_reused'] / 1024 / 1024:.2f} MB reused, "
+            f"{cache_stats['bytes_written'] / 1024 / 1024:.2f} MB written, "
+            f"{entries_count} entries using {cache_size / 1024 / 1024:.2f} MB")
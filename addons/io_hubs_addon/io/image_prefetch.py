@@ -0,0 +1,214 @@
+import bpy
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# The file signatures the glTF exporter checks before passing an existing image file through unchanged.
+IMAGE_SIGNATURES = {
+    "image/png": (b'\x89PNG',),
+    "image/jpeg": (b'\xff\xd8\xff',),
+    "image/vnd.radiance": (b'#?RADIANCE', b'#?RGBE'),
+}
+
+IMAGE_FILE_FORMATS = {
+    "image/png": 'PNG',
+    "image/jpeg": 'JPEG',
+    "image/vnd.radiance": 'HDR',
+}
+
+MAX_PREFETCH_WORKERS = 8
+
+
+def get_exported_hosts(export_settings):
+    '''Returns the component hosts the export includes: its scenes, their exported objects, the bones of the exported
+    armatures and the materials of the exported objects. Hosts missed here, like the objects of collection instances,
+    are still exported, their images are just not prefetched.'''
+    from .ammo_shapes import is_object_exported
+    scenes = [bpy.context.scene] if export_settings.get('gltf_active_scene') else bpy.data.scenes[:]
+    hosts = set(scenes)
+    for scene in scenes:
+        for ob in scene.objects:
+            if ob in hosts or not is_object_exported(ob, export_settings):
+                continue
+
+            hosts.add(ob)
+            if ob.type == 'ARMATURE':
+                hosts.update(ob.data.bones)
+            hosts.update(slot.material for slot in ob.material_slots if slot.material)
+
+    return hosts
+
+
+def get_component_images(host_index, hosts):
+    '''Returns the images referenced by image pointer properties of the components of the given indexed hosts.'''
+    images = set()
+    image_properties = {}
+    for entry in host_index['entries']:
+        if entry['host'] not in hosts:
+            continue
+
+        for _, component_class, component in entry['components']:
+            if not component_class:
+                continue
+
+            if component_class not in image_properties:
+                image_properties[component_class] = [
+                    property_name for property_name in component_class.get_properties()
+                    if is_image_pointer_property(component_class.bl_rna.properties[property_name])
+                ]
+
+            for property_name in image_properties[component_class]:
+                blender_image = getattr(component, property_name)
+                if blender_image:
+                    images.add(blender_image)
+
+    return images
+
+
+def is_image_pointer_property(property_definition):
+    return property_definition.bl_rna.identifier == 'PointerProperty' and \
+        property_definition.fixed_type.identifier == 'Image'
+
+
+def get_lightmap_images(hosts):
+    '''Returns the images connected to MOZ_lightmap nodes of the given materials, other hosts are skipped.'''
+    from .lightmap_cache import get_lightmap_nodes
+    images = set()
+    for material in hosts:
+        if not isinstance(material, bpy.types.Material) or not material.use_nodes or not material.node_tree:
+            continue
+
+        _, image_node = get_lightmap_nodes(material)
+        if image_node:
+            images.add(image_node.image)
+
+    return images
+
+
+def get_passthrough_path(blender_image, mime_type):
+    '''Returns the path of the image file if the exporter would write it unchanged, otherwise None.
+    Only unmodified images saved to disk qualify; everything else has to be encoded through Blender on the main thread.'''
+    if blender_image.source != 'FILE' or blender_image.is_dirty or blender_image.packed_file is not None:
+        return None
+
+    if blender_image.file_format != IMAGE_FILE_FORMATS.get(mime_type):
+        return None
+
+    src_path = bpy.path.abspath(blender_image.filepath_raw)
+    if not os.path.isfile(src_path):
+        return None
+
+    return src_path
+
+
+def read_passthrough_image(src_path, mime_type, use_mapped_file):
+    from .utils import read_image_file
+    data = read_image_file(src_path, use_mapped_file=use_mapped_file)
+
+    if not bytes(data[:16]).startswith(IMAGE_SIGNATURES[mime_type]):
+        # Let the main thread encode it so that the result matches a regular export.
+        return None
+
+    if isinstance(data, memoryview) and hasattr(mmap, 'MADV_WILLNEED'):
+        # Start paging the file in while the rest of the scene is gathered.
+        data.obj.madvise(mmap.MADV_WILLNEED)
+
+    return data
+
+
+def is_passthrough_hdr(blender_image):
+    # Mirrors HubsExportImage.encode_from_image_hdr, which writes saved or packed Radiance images unchanged.
+    return blender_image.file_format == 'HDR' and blender_image.source == 'FILE' and not blender_image.is_dirty and \
+        (blender_image.packed_file is not None or os.path.isfile(bpy.path.abspath(blender_image.filepath_raw)))
+
+
+def get_encode_job(blender_image, mime_type, resized_size, export_settings):
+    '''Returns the function and arguments that encode (or resample) the image in the thread pool, or None if there is nothing to do there.
+    Radiance images are RGBE encoded and images over their size cap are resampled; PNG and JPEG files can only be written by Blender,
+    so resized ones are resampled in the pool and only written on the main thread.
+    The pixels are copied here since Blender data can only be read on the main thread.'''
+    from .image_cache import has_cached_image
+    from .image_resize import get_resized_image_key, resized_images, resize_pixels, resize_rgbe
+    from .utils import get_image_pixels, get_image_rgb_pixels
+    from .rgbe import encode_rgbe
+    if resized_size is None and (mime_type != "image/vnd.radiance" or is_passthrough_hdr(blender_image)):
+        return None
+
+    if has_cached_image(blender_image, mime_type, export_settings, resized_size):
+        return None
+
+    if resized_size is None:
+        return encode_rgbe, get_image_rgb_pixels(blender_image)
+
+    if get_resized_image_key(blender_image, resized_size, mime_type, export_settings) in resized_images:
+        return None
+
+    width, height = resized_size
+    if mime_type == "image/vnd.radiance":
+        return resize_rgbe, get_image_rgb_pixels(blender_image), width, height
+
+    return (resize_pixels, get_image_pixels(blender_image), width, height, blender_image.channels, blender_image.is_float,
+            not blender_image.is_float and blender_image.colorspace_settings.name == 'sRGB')
+
+
+def prefetch_images(export_settings, host_index):
+    '''Starts reading the component and lightmap images of the exported hosts that can be passed through unchanged in a
+    thread pool, along with the RGBE encoding and resampling of the ones that can't.
+    gather_image picks up the results through get_prefetched_image, falling back to encoding the image itself.'''
+    from .utils import get_image_mime_type, can_map_image_file
+    from .image_resize import get_resized_size
+    prefetched_images = {}
+    hosts = get_exported_hosts(export_settings)
+    images = get_component_images(host_index, hosts) | get_lightmap_images(hosts)
+
+    jobs = []
+    for blender_image in images:
+        try:
+            mime_type = get_image_mime_type(blender_image, export_settings)
+            resized_size = get_resized_size(blender_image, export_settings)
+            # Images over their size cap are resampled from their pixels, their files are never passed through.
+            src_path = get_passthrough_path(blender_image, mime_type) if resized_size is None else None
+            if src_path:
+                job = (read_passthrough_image, src_path, mime_type, can_map_image_file(src_path, export_settings))
+            else:
+                job = get_encode_job(blender_image, mime_type, resized_size, export_settings)
+        except Exception as err:
+            # The exporter encodes the image itself, and reports the images without pixels.
+            print(f"Warning: Unable to prefetch the image {blender_image.name}: {err}")
+            continue
+        if job:
+            jobs.append((blender_image, mime_type, job))
+
+    if jobs:
+        executor = ThreadPoolExecutor(max_workers=min(MAX_PREFETCH_WORKERS, len(jobs), os.cpu_count() or 1))
+        for blender_image, mime_type, job in jobs:
+            prefetched_images[(blender_image, mime_type)] = executor.submit(*job)
+        # The submitted jobs keep running, this only lets the worker threads exit once they are done.
+        executor.shutdown(wait=False)
+
+    export_settings['hubs_prefetched_images'] = prefetched_images
+
+
+def get_prefetched_image(blender_image, mime_type, export_settings):
+    '''Returns the result of the prefetch job of the image, or None if there is none or it failed.'''
+    prefetched_images = export_settings.get('hubs_prefetched_images')
+    if not prefetched_images:
+        return None
+
+    future = prefetched_images.pop((blender_image, mime_type), None)
+    if future is None:
+        return None
+
+    try:
+        return future.result()
+    except Exception as err:
+        # A failed prefetch never fails the export, the image goes through the regular encoding instead.
+        print(f"Warning: Unable to prefetch the image {blender_image.name}, encoding it instead: {err}")
+        return None
+
+
+def clear_prefetched_images(export_settings):
+    prefetched_images = export_settings.pop('hubs_prefetched_images', None)
+    if prefetched_images:
+        for future in prefetched_images.values():
+            future.cancel()
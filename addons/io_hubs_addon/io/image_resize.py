@@ -0,0 +1,256 @@
+import bpy
+import numpy as np
+from collections import OrderedDict
+
+# Component image properties whose images are capped, mapped to the scene setting with their maximum size.
+COMPONENT_IMAGE_SIZE_SETTINGS = {
+    ('environment-settings', 'envMapTexture'): 'max_env_map_size',
+    ('environment-settings', 'backgroundTexture'): 'max_env_map_size',
+    ('reflection-probe', 'envMapTexture'): 'max_probe_size',
+}
+LIGHTMAP_IMAGE_SIZE_SETTING = 'max_lightmap_size'
+
+# Number of rows (or columns) resampled at once, this keeps the float64 temporaries small for large images.
+RESAMPLE_BLOCK_SIZE = 64
+# Total size in bytes of the encoded resized images kept in memory during an export, the cache is cleared after each export.
+MAX_RESIZED_IMAGES_SIZE = 128 * 1024 * 1024
+
+# (source signature, encoding settings, size) -> encoded image data
+resized_images = OrderedDict()
+resized_images_size = 0
+
+resize_stats = {
+    'resized': 0,
+    'reused': 0,
+}
+
+
+def combine_size_caps(cap, other_cap):
+    # An image used in several places is capped to the largest size any of them allows, 0 meaning no limit.
+    if not cap or not other_cap:
+        return 0
+    return max(cap, other_cap)
+
+
+def gather_image_size_caps(export_settings, host_index):
+    '''Collects the maximum export size of the component and lightmap images from the scene settings.
+    The caps are stored in the export settings for encode_image, images without a cap are left out.'''
+    from .image_prefetch import get_lightmap_images
+    props = bpy.context.scene.HubsComponentsExtensionProperties
+    caps = {}
+
+    def add_cap(blender_image, max_size):
+        caps[blender_image] = combine_size_caps(caps[blender_image], max_size) if blender_image in caps else max_size
+
+    if any(getattr(props, setting) for setting in COMPONENT_IMAGE_SIZE_SETTINGS.values()):
+        for entry in host_index['entries']:
+            for component_name, component_class, component in entry['components']:
+                if not component_class:
+                    continue
+
+                for (name, property_name), setting in COMPONENT_IMAGE_SIZE_SETTINGS.items():
+                    blender_image = getattr(component, property_name) if name == component_name else None
+                    if blender_image:
+                        add_cap(blender_image, getattr(props, setting))
+
+    max_lightmap_size = getattr(props, LIGHTMAP_IMAGE_SIZE_SETTING)
+    if max_lightmap_size and export_settings.get('hubs_has_lightmaps', True):
+        # Caps have to cover every image the export may write, so all the materials in use are checked, not only the
+        # ones prefetching finds.
+        for blender_image in get_lightmap_images([material for material in bpy.data.materials if material.users]):
+            add_cap(blender_image, max_lightmap_size)
+
+    export_settings['hubs_image_size_caps'] = {
+        blender_image: max_size for blender_image, max_size in caps.items() if max_size}
+
+
+def get_capped_size(width, height, max_size):
+    '''Returns the size scaled down to fit max_size while keeping the aspect ratio.'''
+    if not max_size or max(width, height) <= max_size:
+        return width, height
+
+    scale = max_size / max(width, height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def get_resized_size(blender_image, export_settings):
+    '''Returns the size the image is exported at if it's over its cap, otherwise None.'''
+    max_size = export_settings.get('hubs_image_size_caps', {}).get(blender_image)
+    if not max_size:
+        return None
+
+    width, height = blender_image.size
+    size = get_capped_size(width, height, max_size)
+    return size if size != (width, height) else None
+
+
+def area_resample_axis(pixels, size, axis):
+    '''Resamples one axis of a (height, width, channels) array with an area filter.
+    Every output pixel is the average of the source pixels it covers, weighted by how much of them it covers.
+    The averages are differences of the prefix sums of the pixels, accumulated in float64 so HDR values are resampled exactly.'''
+    source_size = pixels.shape[axis]
+    if size == source_size:
+        return pixels
+
+    # The prefix sum of a row of pixels is piecewise linear, so it's interpolated exactly at fractional pixel boundaries.
+    boundaries = np.arange(size + 1, dtype=np.float64) * (source_size / size)
+    indices = np.minimum(boundaries.astype(np.intp), source_size - 1)
+    fractions = (boundaries - indices)[:, np.newaxis, np.newaxis]
+
+    pixels = np.moveaxis(pixels, axis, 0)
+    resampled = np.empty((size,) + pixels.shape[1:], dtype=np.float32)
+    for start in range(0, pixels.shape[1], RESAMPLE_BLOCK_SIZE):
+        block = pixels[:, start:start + RESAMPLE_BLOCK_SIZE].astype(np.float64)
+        prefix_sums = np.zeros((source_size + 1,) + block.shape[1:], dtype=np.float64)
+        np.cumsum(block, axis=0, out=prefix_sums[1:])
+        integrals = prefix_sums[indices] + fractions * block[indices]
+        resampled[:, start:start + RESAMPLE_BLOCK_SIZE] = np.diff(integrals, axis=0) * (size / source_size)
+
+    return np.moveaxis(resampled, 0, axis)
+
+
+def area_resample(pixels, width, height):
+    '''Resamples a (height, width, channels) array to the given size with an area filter.'''
+    return area_resample_axis(area_resample_axis(pixels, width, 1), height, 0)
+
+
+def srgb_to_linear(values):
+    return np.where(values <= 0.0404482362771082, values / 12.92, ((values + 0.055) / 1.055) ** 2.4).astype(np.float32)
+
+
+def linear_to_srgb(values):
+    values = np.clip(values, 0.0, 1.0)
+    return np.where(values <= 0.00313066844250063, values * 12.92, 1.055 * values ** (1.0 / 2.4) - 0.055).astype(np.float32)
+
+
+def resize_pixels(pixels, width, height, channels, is_float, is_srgb):
+    '''Returns the (height, width, channels) pixels resampled to the given size as a (height, width, 4) array, as stored by Blender.
+    sRGB byte images are averaged in linear space so that resampling doesn't darken them.
+    This doesn't access any Blender data so it can run in the prefetch threads.'''
+    rgba = np.ones(pixels.shape[:2] + (4,), dtype=np.float32)
+    if channels >= 3:
+        rgba[..., :min(channels, 4)] = pixels[..., :4]
+    else:
+        rgba[..., :3] = pixels[..., :1]
+        if channels == 2:
+            rgba[..., 3] = pixels[..., 1]
+
+    if is_srgb:
+        rgba[..., :3] = srgb_to_linear(rgba[..., :3])
+
+    rgba = area_resample(rgba, width, height)
+
+    if is_srgb:
+        rgba[..., :3] = linear_to_srgb(rgba[..., :3])
+    elif not is_float:
+        np.clip(rgba, 0.0, 1.0, out=rgba)
+
+    return rgba
+
+
+def resize_image_pixels(blender_image, width, height):
+    '''Returns the pixels of the image resampled to the given size as a (height, width, 4) array.'''
+    from .utils import get_image_pixels
+    return resize_pixels(get_image_pixels(blender_image), width, height, blender_image.channels, blender_image.is_float,
+                         not blender_image.is_float and blender_image.colorspace_settings.name == 'sRGB')
+
+
+def resize_rgbe(pixels, width, height):
+    '''Returns the (height, width, 3) linear float pixels resampled to the given size and RGBE encoded.
+    This doesn't access any Blender data so it can run in the prefetch threads.'''
+    from .rgbe import encode_rgbe
+    return encode_rgbe(area_resample(pixels, width, height))
+
+
+def encode_resized_ldr_image(blender_image, pixels, mime_type, export_settings):
+    '''Encodes the resized pixels through a temporary Blender image, so PNG and JPEG files are written like any other image.'''
+    from .utils import HubsExportImage
+    height, width, _ = pixels.shape
+    resized_image = bpy.data.images.new(
+        f"{blender_image.name}_resized", width, height, alpha=True, float_buffer=blender_image.is_float)
+    try:
+        resized_image.colorspace_settings.name = blender_image.colorspace_settings.name
+        resized_image.alpha_mode = blender_image.alpha_mode
+        resized_image.pixels.foreach_set(pixels.ravel())
+
+        # Only export an alpha channel if the source has one.
+        export_image = HubsExportImage()
+        for chan in range(4 if blender_image.channels in (2, 4) else 3):
+            export_image.fill_image(resized_image, dst_chan=chan, src_chan=chan)
+        data = export_image.encode(mime_type, export_settings)
+    finally:
+        bpy.data.images.remove(resized_image)
+
+    return data[0] if type(data) is tuple else data
+
+
+def get_resized_image_key(blender_image, size, mime_type, export_settings):
+    '''Returns the key of the encoded resized image in memory, or None if the image source can't be identified.'''
+    from .image_cache import get_image_source_signature
+    source_signature = get_image_source_signature(blender_image)
+    if source_signature is None:
+        return None
+
+    return (source_signature, mime_type, export_settings.get('gltf_image_format'),
+            export_settings.get('gltf_image_quality'), blender_image.colorspace_settings.name,
+            blender_image.alpha_mode, tuple(size))
+
+
+def encode_resized_image(blender_image, size, mime_type, export_settings, prefetched=None):
+    '''Encodes the image scaled down to the given size.
+    Radiance images are resampled from the linear float pixels and RGBE encoded directly, other formats are resampled with an area filter.
+    prefetched is the result of the resampling done by the prefetch threads: the RGBE data for Radiance images, the resized pixels otherwise.
+    The results are kept in memory by the signature of the image source until the end of the export, so images are only resampled once.'''
+    global resized_images_size
+    key = get_resized_image_key(blender_image, size, mime_type, export_settings)
+    if key is not None:
+        data = resized_images.get(key)
+        if data is not None:
+            resized_images.move_to_end(key)
+            resize_stats['reused'] += 1
+            return data
+
+    width, height = size
+    if mime_type == "image/vnd.radiance":
+        if prefetched is not None:
+            data = prefetched
+        else:
+            from .utils import get_image_rgb_pixels
+            data = resize_rgbe(get_image_rgb_pixels(blender_image), width, height)
+    else:
+        pixels = prefetched if prefetched is not None else resize_image_pixels(blender_image, width, height)
+        data = encode_resized_ldr_image(blender_image, pixels, mime_type, export_settings)
+    data = bytes(data)
+
+    resize_stats['resized'] += 1
+    if key is not None and len(data) <= MAX_RESIZED_IMAGES_SIZE:
+        resized_images[key] = data
+        resized_images_size += len(data)
+        while resized_images_size > MAX_RESIZED_IMAGES_SIZE:
+            _, evicted_data = resized_images.popitem(last=False)
+            resized_images_size -= len(evicted_data)
+
+    return data
+
+
+def reset_resize_stats():
+    for key in resize_stats:
+        resize_stats[key] = 0
+
+
+def get_resize_stats_report():
+    if not (resize_stats['resized'] or resize_stats['reused']):
+        return ""
+
+    return (f"Hubs image size caps: {resize_stats['resized']} images resized, "
+            f"{resize_stats['reused']} resized images reused")
+
+
+def clear_image_size_caps(export_settings):
+    export_settings.pop('hubs_image_size_caps', None)
+
+
+def clear_resized_images():
+    global resized_images_size
+    resized_images.clear()
+    resized_images_size = 0
@@ -0,0 +1,135 @@
+import bpy
+from bpy.app.handlers import persistent
+from ..nodes.lightmap import MozLightmapNode
+
+# Nodes that pass the lightmap color through, the image texture node is searched behind them.
+REROUTE_NODE_TYPES = {'NodeReroute'}
+MIX_NODE_TYPES = {'ShaderNodeMix', 'ShaderNodeMixRGB'}
+
+# Material session uid -> {'node_tree', 'lightmap_node', 'image_node'} with the session uid of the material's node tree
+# and the names of the nodes, or None. The lookups are kept across exports until the material or its node tree is updated.
+lightmap_lookups = {}
+# (whether any material has a MOZ_lightmap node, number of materials when it was checked), or None if unknown.
+lightmap_materials_state = None
+
+
+@persistent
+def lightmap_change_handler(scene, depsgraph):
+    global lightmap_materials_state
+    updated = {
+        update.id.original.session_uid for update in depsgraph.updates
+        if isinstance(update.id, (bpy.types.Material, bpy.types.NodeTree))
+    }
+    if not updated:
+        return
+
+    lightmap_materials_state = None
+    for session_uid in [session_uid for session_uid, lookup in lightmap_lookups.items()
+                        if session_uid in updated or lookup['node_tree'] in updated]:
+        del lightmap_lookups[session_uid]
+
+
+@persistent
+def clear_lightmap_lookups_handler(*args):
+    # Undo and redo can restore node trees without a depsgraph update and file load reallocates the IDs, so drop everything.
+    clear_lightmap_lookups()
+
+
+def watch_lightmap_changes():
+    # The depsgraph handler is only installed while something is cached, so it costs nothing when no export ran.
+    if lightmap_change_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(lightmap_change_handler)
+
+
+def find_lightmap_image_node(socket):
+    '''Follows the links of the lightmap socket through reroute and mix nodes to the image texture node providing the lightmap.
+    The inputs of mix nodes are searched in order, so the first color input wins, like in the glTF exporter's texture search.'''
+    visited = set()
+    sockets = [socket]
+    while sockets:
+        socket = sockets.pop(0)
+        for link in socket.links:
+            if not link.is_valid or getattr(link, 'is_muted', False):
+                continue
+
+            node = link.from_node
+            if node.bl_idname == 'ShaderNodeTexImage':
+                if node.image:
+                    return node
+                continue
+
+            if node.name in visited:
+                continue
+            visited.add(node.name)
+
+            if node.bl_idname in REROUTE_NODE_TYPES:
+                sockets.extend(node.inputs[:1])
+            elif node.bl_idname in MIX_NODE_TYPES:
+                sockets.extend(node_input for node_input in node.inputs if node_input.is_linked and node_input.type == 'RGBA')
+
+    return None
+
+
+def get_lightmap_nodes(blender_material):
+    '''Returns the MOZ_lightmap node of a material and the image texture node connected to it, either of them can be None.
+    The lookup is cached per material until the material or its node tree is updated.'''
+    node_tree = blender_material.node_tree
+    if not node_tree:
+        return None, None
+
+    nodes = node_tree.nodes
+    lookup = lightmap_lookups.get(blender_material.session_uid)
+    if lookup and lookup['node_tree'] == node_tree.session_uid:
+        lightmap_node = nodes.get(lookup['lightmap_node']) if lookup['lightmap_node'] else None
+        image_node = nodes.get(lookup['image_node']) if lookup['image_node'] else None
+        # Renaming a node doesn't always update the depsgraph, so only trust the lookup if the names still resolve.
+        if bool(lightmap_node) == bool(lookup['lightmap_node']) and bool(image_node) == bool(lookup['image_node']):
+            return lightmap_node, image_node
+
+    lightmap_node = next((n for n in nodes if isinstance(n, MozLightmapNode)), None)
+    image_node = None
+    if lightmap_node:
+        texture_socket = lightmap_node.inputs.get("Lightmap")
+        image_node = find_lightmap_image_node(texture_socket) if texture_socket else None
+
+    watch_lightmap_changes()
+    lightmap_lookups[blender_material.session_uid] = {
+        'node_tree': node_tree.session_uid,
+        'lightmap_node': lightmap_node.name if lightmap_node else None,
+        'image_node': image_node.name if image_node else None
+    }
+    return lightmap_node, image_node
+
+
+def has_lightmap_nodes():
+    '''Returns whether any material has a MOZ_lightmap node, so material exports can skip the lookup when none do.
+    Unused materials are included so that assigning one, which doesn't update the material, can't make the result stale.'''
+    global lightmap_materials_state
+    material_count = len(bpy.data.materials)
+    if lightmap_materials_state is None or lightmap_materials_state[1] != material_count:
+        has_lightmaps = any(get_lightmap_nodes(material)[0] for material in bpy.data.materials if material.use_nodes)
+        watch_lightmap_changes()
+        lightmap_materials_state = (has_lightmaps, material_count)
+
+    return lightmap_materials_state[0]
+
+
+def clear_lightmap_lookups():
+    global lightmap_materials_state
+    lightmap_lookups.clear()
+    lightmap_materials_state = None
+    if lightmap_change_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(lightmap_change_handler)
+
+
+def register():
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post):
+        handlers.append(clear_lightmap_lookups_handler)
+
+
+def unregister():
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post):
+        if clear_lightmap_lookups_handler in handlers:
+            handlers.remove(clear_lightmap_lookups_handler)
+
+    clear_lightmap_lookups()
@@ -0,0 +1,112 @@
+import numpy as np
+
+# Radiance scanlines can only be run length encoded when their width is in this range, otherwise they are stored flat.
+RGBE_RLE_MIN_WIDTH = 8
+RGBE_RLE_MAX_WIDTH = 0x7fff
+# Maximum number of bytes in a literal (non run) packet of an RLE scanline.
+RGBE_MAX_PACKET_LENGTH = 128
+# Runs of equal bytes are written as (128 + length, byte) packets, shorter runs don't save anything over literal bytes.
+RGBE_MIN_RUN_LENGTH = 3
+RGBE_MAX_RUN_LENGTH = 127
+# Largest value that can be represented with an 8 bit mantissa and exponent.
+RGBE_MAX_VALUE = np.float32(255.0 / 256.0 * 2.0 ** 127)
+# Number of scanlines converted at once, this keeps the temporary arrays small for large images.
+RGBE_ROWS_PER_BLOCK = 256
+
+
+def float_to_rgbe(rgb):
+    '''Converts an array of linear (..., 3) float colors to (..., 4) uint8 shared exponent RGBE values.'''
+    rgb = np.clip(rgb, 0.0, RGBE_MAX_VALUE).astype(np.float32, copy=False)
+    brightest = rgb.max(axis=-1)
+    mantissa, exponent = np.frexp(brightest)
+
+    # Values too small for the 8 bit exponent are stored as black, like the reference implementation does for < 1e-32.
+    visible = (brightest > 1e-32) & (exponent > -128)
+    scale = np.zeros_like(brightest)
+    np.divide(mantissa * 256.0, brightest, out=scale, where=visible)
+
+    rgbe = np.empty(rgb.shape[:-1] + (4,), dtype=np.uint8)
+    rgbe[..., :3] = np.minimum(np.floor(rgb * scale[..., np.newaxis]), 255.0)
+    rgbe[..., 3] = np.where(visible, exponent + 128, 0)
+    return rgbe
+
+
+def split_spans(starts, lengths, max_length):
+    '''Splits the spans of bytes starting at the given offsets into consecutive spans of at most max_length bytes.'''
+    span_counts = -(-lengths // max_length)
+    first_spans = np.cumsum(span_counts) - span_counts
+    offsets = (np.arange(span_counts.sum()) - np.repeat(first_spans, span_counts)) * max_length
+    return np.repeat(starts, span_counts) + offsets, np.minimum(np.repeat(lengths, span_counts) - offsets, max_length)
+
+
+def rle_encode_scanlines(rgbe):
+    '''Encodes (rows, width, 4) RGBE scanlines with the new style Radiance RLE scanline format.
+    Like Radiance, runs of equal bytes are written as run packets and the bytes between them as literal packets.
+    The packets of all the scanlines are laid out at once with array operations instead of a loop per byte.'''
+    rows, width, _ = rgbe.shape
+    # The channels of a RLE scanline are stored one after the other instead of interleaved, each channel is a plane.
+    data = rgbe.transpose(0, 2, 1).ravel()
+    count = data.size
+    plane_starts = np.arange(0, count, width)
+
+    # Find the runs of equal bytes, runs never cross planes.
+    is_run_start = np.empty(count, dtype=bool)
+    is_run_start[0] = True
+    np.not_equal(data[1:], data[:-1], out=is_run_start[1:])
+    is_run_start[plane_starts] = True
+    run_starts = np.flatnonzero(is_run_start)
+    run_lengths = np.diff(np.append(run_starts, count))
+
+    # Long runs are split into run packets, a remainder too short for a run packet is left to the literal bytes.
+    long_runs = run_lengths >= RGBE_MIN_RUN_LENGTH
+    run_starts, run_lengths = split_spans(run_starts[long_runs], run_lengths[long_runs], RGBE_MAX_RUN_LENGTH)
+    long_runs = run_lengths >= RGBE_MIN_RUN_LENGTH
+    run_starts, run_lengths = run_starts[long_runs], run_lengths[long_runs]
+
+    # The bytes between the run packets and the plane starts are split into literal packets.
+    span_starts = np.concatenate((plane_starts, run_starts))
+    span_ends = np.concatenate((plane_starts, run_starts + run_lengths))
+    order = np.lexsort((np.arange(len(span_starts)) >= len(plane_starts), span_starts))
+    literal_starts = span_ends[order]
+    literal_lengths = np.append(span_starts[order][1:], count) - literal_starts
+    has_literals = literal_lengths > 0
+    literal_starts, literal_lengths = split_spans(
+        literal_starts[has_literals], literal_lengths[has_literals], RGBE_MAX_PACKET_LENGTH)
+
+    # Only the first byte of a run is written, after the packet header.
+    run_bounds = np.zeros(count + 1, dtype=np.int8)
+    run_bounds[run_starts + 1] = 1
+    run_bounds[run_starts + run_lengths] = -1
+    packet_data = data[np.cumsum(run_bounds[:-1], dtype=np.int32) == 0]
+
+    # Insert the packet headers, and the 4 byte header of each scanline, at the packet offsets in the written bytes.
+    removed_counts = np.concatenate(([0], np.cumsum(run_lengths - 1)))
+
+    def get_packet_data_offsets(starts):
+        return starts - removed_counts[np.searchsorted(run_starts, starts)]
+
+    scanline_starts = plane_starts[::4]
+    scanline_headers = np.tile(np.array((2, 2, width >> 8, width & 0xff), dtype=np.uint8), rows)
+    header_offsets = np.concatenate((
+        np.repeat(get_packet_data_offsets(scanline_starts), 4),
+        get_packet_data_offsets(literal_starts),
+        get_packet_data_offsets(run_starts)))
+    headers = np.concatenate((scanline_headers, literal_lengths.astype(np.uint8), (128 + run_lengths).astype(np.uint8)))
+    # Scanline headers are inserted before the packet header at the same offset, np.insert keeps the order of equal offsets.
+    return np.insert(packet_data, header_offsets, headers).tobytes()
+
+
+def encode_rgbe(pixels):
+    '''Encodes a (height, width, 3) array of linear float colors, stored bottom row first like Blender images, as a Radiance .hdr file.'''
+    height, width, _ = pixels.shape
+    header = f"#?RADIANCE\nFORMAT=32-bit_rle_rgbe\n\n-Y {height} +X {width}\n".encode("ascii")
+    use_rle = RGBE_RLE_MIN_WIDTH <= width <= RGBE_RLE_MAX_WIDTH
+
+    chunks = [header]
+    # Radiance files store the top scanline first.
+    pixels = pixels[::-1]
+    for start in range(0, height, RGBE_ROWS_PER_BLOCK):
+        rgbe = float_to_rgbe(pixels[start:start + RGBE_ROWS_PER_BLOCK])
+        chunks.append(rle_encode_scanlines(rgbe) if use_rle else rgbe.tobytes())
+
+    return b"".join(chunks)
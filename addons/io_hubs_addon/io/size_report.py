@@ -0,0 +1,334 @@
+import bpy
+import json
+import os
+from bpy.props import StringProperty
+from .glb_optimizer import read_glb_layout, find_link_references, GLBFormatError
+from .utils import HUBS_CONFIG
+
+EXTENSION_NAME = HUBS_CONFIG["gltfExtensionName"]
+SIZE_REPORT_SUFFIX = ".hubs-size.json"
+# A category has regressed if it grew by more than this fraction and by more than the minimum number of bytes since the previous export.
+SIZE_REGRESSION_THRESHOLD = 0.05
+SIZE_REGRESSION_MIN_BYTES = 16 * 1024
+REPORT_TOP_ITEMS = 5
+
+BUDGET_LABELS = {
+    'total': "Total size",
+    'meshes': "Meshes",
+    'textures': "Textures",
+}
+
+
+def format_size(size):
+    if abs(size) >= 1024 * 1024:
+        return f"{size / 1024 / 1024:.2f} MB"
+    return f"{size / 1024:.1f} KB"
+
+
+def get_accessor_buffer_views(gltf, accessor_index):
+    accessor = gltf['accessors'][accessor_index]
+    buffer_views = set()
+    if 'bufferView' in accessor:
+        buffer_views.add(accessor['bufferView'])
+    sparse = accessor.get('sparse')
+    if sparse:
+        buffer_views.add(sparse['indices']['bufferView'])
+        buffer_views.add(sparse['values']['bufferView'])
+    return buffer_views
+
+
+def get_mesh_buffer_views(gltf, mesh):
+    accessors = set()
+    buffer_views = set()
+    for primitive in mesh.get('primitives', []):
+        accessors.update(primitive.get('attributes', {}).values())
+        if 'indices' in primitive:
+            accessors.add(primitive['indices'])
+        for target in primitive.get('targets', []):
+            accessors.update(target.values())
+        draco = primitive.get('extensions', {}).get('KHR_draco_mesh_compression')
+        if draco:
+            buffer_views.add(draco['bufferView'])
+
+    for accessor_index in accessors:
+        buffer_views |= get_accessor_buffer_views(gltf, accessor_index)
+    return buffer_views
+
+
+def get_animation_buffer_views(gltf, animation):
+    buffer_views = set()
+    for sampler in animation.get('samplers', []):
+        for key in ('input', 'output'):
+            if key in sampler:
+                buffer_views |= get_accessor_buffer_views(gltf, sampler[key])
+    return buffer_views
+
+
+def get_component_images(gltf, component):
+    '''Returns the indices of the images a component links to, directly or through its textures (including their MOZ_texture_rgbe source).'''
+    images = {link['index'] for link, _ in find_link_references(component, "image", [])}
+    textures = gltf.get('textures', [])
+    for link, _ in find_link_references(component, "texture", []):
+        texture = textures[link['index']]
+        if 'source' in texture:
+            images.add(texture['source'])
+        for extension in texture.get('extensions', {}).values():
+            if isinstance(extension, dict) and 'source' in extension:
+                images.add(extension['source'])
+    return images
+
+
+def get_json_size(value):
+    return len(json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+
+def analyze_glb(filepath):
+    '''Attributes the bytes of a GLB file to its meshes, images (textures), animations and Hubs components.
+    Buffer views shared between categories are only counted once, in the first of textures, meshes and animations using them.
+    Components are measured by the size of their JSON. The remaining bytes (scene graph, materials, padding) are reported as other.
+    The per component breakdown also includes the images each component type links to (environment maps, backgrounds, reflection probes),
+    those stay in the textures category so the categories still add up to the file size.'''
+    total_bytes = os.path.getsize(filepath)
+    with open(filepath, 'rb') as f:
+        gltf, bin_offset, bin_length = read_glb_layout(f)
+
+    json_bytes = (bin_offset - 8 if bin_offset else total_bytes) - 20
+    buffer_view_sizes = [buffer_view['byteLength'] for buffer_view in gltf.get('bufferViews', [])]
+    claimed_buffer_views = set()
+
+    def claim(buffer_views):
+        unclaimed = buffer_views - claimed_buffer_views
+        claimed_buffer_views.update(unclaimed)
+        return sum(buffer_view_sizes[index] for index in unclaimed)
+
+    categories = {'textures': 0, 'meshes': 0, 'animations': 0, 'components': 0}
+
+    textures = []
+    for index, image in enumerate(gltf.get('images', [])):
+        buffer_views = {image['bufferView']} if 'bufferView' in image else set()
+        categories['textures'] += claim(buffer_views)
+        textures.append({
+            "name": image.get('name', f"image {index}"),
+            "mime_type": image.get('mimeType', ""),
+            "bytes": sum(buffer_view_sizes[buffer_view] for buffer_view in buffer_views)
+        })
+    image_sizes = [texture['bytes'] for texture in textures]
+
+    meshes = []
+    for index, mesh in enumerate(gltf.get('meshes', [])):
+        buffer_views = get_mesh_buffer_views(gltf, mesh)
+        categories['meshes'] += claim(buffer_views)
+        meshes.append({
+            "name": mesh.get('name', f"mesh {index}"),
+            "bytes": sum(buffer_view_sizes[buffer_view] for buffer_view in buffer_views)
+        })
+
+    animations = []
+    for index, animation in enumerate(gltf.get('animations', [])):
+        buffer_views = get_animation_buffer_views(gltf, animation)
+        categories['animations'] += claim(buffer_views)
+        animations.append({
+            "name": animation.get('name', f"animation {index}"),
+            "bytes": sum(buffer_view_sizes[buffer_view] for buffer_view in buffer_views)
+        })
+
+    components = {}
+    component_images = {}
+    hosts = []
+    for host_type in ('scenes', 'nodes', 'materials'):
+        for index, host in enumerate(gltf.get(host_type, [])):
+            host_components = host.get('extensions', {}).get(EXTENSION_NAME)
+            if not host_components:
+                continue
+
+            component_sizes = {}
+            for name, value in host_components.items():
+                size = get_json_size(value)
+                components[name] = components.get(name, 0) + size
+                categories['components'] += size
+                images = get_component_images(gltf, value)
+                component_images.setdefault(name, set()).update(images)
+                component_sizes[name] = size + sum(image_sizes[image] for image in images)
+            hosts.append({
+                "type": host_type[:-1],
+                "name": host.get('name', f"{host_type[:-1]} {index}"),
+                "components": component_sizes
+            })
+
+    # An image shared by several components of the same type is only counted once for that type.
+    for name, images in component_images.items():
+        components[name] += sum(image_sizes[image] for image in images)
+
+    categories['other'] = total_bytes - sum(categories.values())
+
+    def by_size(items):
+        return sorted(items, key=lambda item: item['bytes'], reverse=True)
+
+    return {
+        "file": filepath,
+        "total_bytes": total_bytes,
+        "json_bytes": json_bytes,
+        "bin_bytes": bin_length if bin_offset else 0,
+        "categories": categories,
+        "textures": by_size(textures),
+        "meshes": by_size(meshes),
+        "animations": by_size(animations),
+        "components": dict(sorted(components.items(), key=lambda item: item[1], reverse=True)),
+        "hosts": hosts
+    }
+
+
+def get_size_budgets(scene):
+    '''Returns the size budgets in bytes configured for the scene, unset (zero) budgets are left out.'''
+    props = scene.HubsComponentsExtensionProperties
+    budgets = {
+        'total': props.size_budget_total,
+        'meshes': props.size_budget_meshes,
+        'textures': props.size_budget_textures,
+    }
+    return {name: int(budget * 1024 * 1024) for name, budget in budgets.items() if budget > 0}
+
+
+def check_size_budgets(report, budgets):
+    violations = []
+    for name, budget in budgets.items():
+        size = report['total_bytes'] if name == 'total' else report['categories'][name]
+        if size > budget:
+            violations.append(
+                f"{BUDGET_LABELS[name]} is {format_size(size)}, {format_size(size - budget)} over the budget of {format_size(budget)}")
+    return violations
+
+
+def compare_size_reports(previous_report, report):
+    '''Returns the categories that grew noticeably since the previous export of the same file.'''
+    regressions = []
+    sizes = {'total': report['total_bytes'], **report['categories']}
+    previous_sizes = {'total': previous_report.get('total_bytes', 0), **previous_report.get('categories', {})}
+    for name, size in sizes.items():
+        previous_size = previous_sizes.get(name, 0)
+        growth = size - previous_size
+        if growth > SIZE_REGRESSION_MIN_BYTES and growth > previous_size * SIZE_REGRESSION_THRESHOLD:
+            regressions.append(
+                f"{name.capitalize()} grew by {format_size(growth)} since the previous export ({format_size(previous_size)} to {format_size(size)})")
+    return regressions
+
+
+def format_size_report(report):
+    '''Returns the report as a list of messages for the console and the report viewer.'''
+    messages = [f"{os.path.basename(report['file'])}: {format_size(report['total_bytes'])} "
+                f"(JSON {format_size(report['json_bytes'])}, BIN {format_size(report['bin_bytes'])})"]
+    messages.append(", ".join(f"{name.capitalize()} {format_size(size)}" for name, size in report['categories'].items()))
+
+    for message in report.get('budget_violations', []):
+        messages.append(f"Over budget: {message}")
+    for message in report.get('regressions', []):
+        messages.append(f"Size regression: {message}")
+
+    for category in ('textures', 'meshes', 'animations'):
+        items = report[category][:REPORT_TOP_ITEMS]
+        if items:
+            messages.append(f"Largest {category}: " + ", ".join(f"{item['name']} {format_size(item['bytes'])}" for item in items))
+    if report['components']:
+        messages.append("Components: " + ", ".join(f"{name} {format_size(size)}" for name, size in report['components'].items()))
+
+    return messages
+
+
+def get_size_report_path(filepath):
+    return os.path.splitext(filepath)[0] + SIZE_REPORT_SUFFIX
+
+
+def run_size_report(filepath, budgets=None, display_report=False):
+    '''Analyzes an exported GLB, checks it against the budgets and the report of the previous export of the same file,
+    and writes the report next to it. Returns the report, or None if the file couldn't be analyzed.'''
+    try:
+        report = analyze_glb(filepath)
+    except (OSError, ValueError, KeyError, IndexError, GLBFormatError) as err:
+        print(f"Error: Unable to analyze the size of {filepath}: {err}")
+        return None
+
+    report_path = get_size_report_path(filepath)
+    previous_report = None
+    try:
+        with open(report_path) as f:
+            previous_report = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    report['budget_violations'] = check_size_budgets(report, budgets or {})
+    report['regressions'] = compare_size_reports(previous_report, report) if previous_report else []
+
+    try:
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+    except OSError as err:
+        print(f"Error: Unable to write the size report to {report_path}: {err}")
+
+    messages = format_size_report(report)
+    print("Hubs size report: " + "\n".join(messages))
+
+    if display_report and not bpy.app.background:
+        def show_size_report():
+            bpy.ops.wm.hubs_report_viewer('INVOKE_DEFAULT', title="Export Size Report", report_string='\n\n'.join(messages))
+        bpy.app.timers.register(show_size_report)
+
+    return report
+
+
+class HubsExportSizeReport(bpy.types.Operator):
+    bl_idname = "wm.hubs_export_size_report"
+    bl_label = "Export Size Report"
+    bl_description = "Break down the size of an exported GLB file by meshes, textures, animations and components, and check it against the scene's size budgets"
+
+    filepath: StringProperty(subtype="FILE_PATH")
+    filter_glob: StringProperty(default="*.glb", options={'HIDDEN'})
+
+    def execute(self, context):
+        if not os.path.isfile(self.filepath):
+            self.report({'ERROR'}, f"File not found: {self.filepath}")
+            return {'CANCELLED'}
+
+        report = run_size_report(self.filepath, get_size_budgets(context.scene), display_report=True)
+        if report is None:
+            self.report({'ERROR'}, "Unable to analyze the file, see the console for details")
+            return {'CANCELLED'}
+
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        if not self.filepath and bpy.data.filepath:
+            self.filepath = os.path.splitext(bpy.data.filepath)[0] + ".glb"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class HUBS_PT_ToolsExportSizePanel(bpy.types.Panel):
+    bl_idname = "HUBS_PT_ToolsExportSizePanel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_label = "Export Size"
+    bl_context = 'objectmode'
+    bl_parent_id = "HUBS_PT_ToolsPanel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        props = context.scene.HubsComponentsExtensionProperties
+
+        col = layout.column(heading="Budgets (MB)")
+        col.prop(props, 'size_budget_total', text="Total")
+        col.prop(props, 'size_budget_meshes', text="Meshes")
+        col.prop(props, 'size_budget_textures', text="Textures")
+
+        layout.operator(HubsExportSizeReport.bl_idname, icon='FILE')
+
+
+def register():
+    bpy.utils.register_class(HubsExportSizeReport)
+    bpy.utils.register_class(HUBS_PT_ToolsExportSizePanel)
+
+
+def unregister():
+    bpy.utils.unregister_class(HUBS_PT_ToolsExportSizePanel)
+    bpy.utils.unregister_class(HubsExportSizeReport)
@@ -1,7 +1,7 @@
 import bpy
+import mmap
 import os
 import re
-from ..nodes.lightmap import MozLightmapNode
 from io_scene_gltf2.io.com import gltf2_io_extensions
 from io_scene_gltf2.io.com import gltf2_io
 from typing import Optional, Tuple, Union
@@ -98,6 +98,32 @@ class HubsImageData(gltf2_io_image_data.ImageData):
         return super().file_extension
 
 
+def read_image_file(src_path, use_mapped_file=False):
+    '''Returns the contents of an image file.
+    With use_mapped_file the contents are returned as a read-only memoryview of a memory map instead of a bytes copy,
+    so large files are paged in by the OS while they are written out.  This is only usable for glTF separate exports,
+    the GLB writer needs bytes to build the binary chunk.'''
+    with open(src_path, 'rb') as f:
+        if not use_mapped_file or os.fstat(f.fileno()).st_size == 0:
+            return f.read()
+        # The map stays valid after the file is closed and is released once the last view of it is gone.
+        mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return memoryview(mapped_file)
+
+
+def can_map_image_file(src_path, export_settings):
+    '''Returns whether an image file can be passed to the writer as a memory map.
+    Only glTF separate exports can use maps, and only for sources outside the directory the images are written to:
+    writing an image over its own source would truncate the mapped file while it's being copied.'''
+    if export_settings['gltf_format'] != 'GLTF_SEPARATE' or 'gltf_filedirectory' not in export_settings:
+        return False
+
+    texture_dir = os.path.join(export_settings['gltf_filedirectory'], export_settings.get('gltf_texturedirectory', ""))
+    return os.path.normcase(os.path.realpath(os.path.dirname(src_path))) != \
+        os.path.normcase(os.path.realpath(texture_dir))
+
+
 class HubsExportImage(gltf2_blender_image.ExportImage):
     @staticmethod
     def from_blender_image(image: bpy.types.Image):
@@ -106,31 +132,116 @@ class HubsExportImage(gltf2_blender_image.ExportImage):
             export_image.fill_image(image, dst_chan=chan, src_chan=chan)
         return export_image
 
-    def encode(self, mime_type: Optional[str], export_settings) -> Union[Tuple[bytes, bool], bytes]:
+    def encode(self, mime_type: Optional[str], export_settings) -> Union[Tuple[bytes, bool], bytes, memoryview]:
         if mime_type == "image/vnd.radiance":
             if bpy.app.version < (4, 1, 0):
-                return self.encode_from_image_hdr(self.blender_image())
+                return self.encode_from_image_hdr(self.blender_image(), export_settings)
             else:
-                return self.encode_from_image_hdr(self.blender_image(export_settings))
+                return self.encode_from_image_hdr(self.blender_image(export_settings), export_settings)
         if bpy.app.version < (3, 5, 0):
             return super().encode(mime_type)
         else:
             return super().encode(mime_type, export_settings)
 
-    # TODO this should allow conversion from other HDR formats (namely EXR),
-    # in memory images, and combining separate channels like SDR images
-    def encode_from_image_hdr(self, image: bpy.types.Image) -> Union[Tuple[bytes, bool], bytes]:
+    # TODO this should allow combining separate channels like SDR images
+    def encode_from_image_hdr(self, image: bpy.types.Image, export_settings) -> Union[Tuple[bytes, bool], bytes, memoryview]:
         if image.file_format == "HDR" and image.source == 'FILE' and not image.is_dirty:
             if image.packed_file is not None:
                 return image.packed_file.data
             else:
                 src_path = bpy.path.abspath(image.filepath_raw)
                 if os.path.isfile(src_path):
-                    with open(src_path, 'rb') as f:
-                        return f.read()
+                    return read_image_file(src_path, use_mapped_file=can_map_image_file(src_path, export_settings))
 
+        # Other HDR formats (namely EXR) and in memory images are converted from their pixels.
+        from .rgbe import encode_rgbe
+        return encode_rgbe(get_image_rgb_pixels(image))
+
+
+def get_image_pixels(image: bpy.types.Image):
+    '''Returns the image pixels as a (height, width, channels) float32 array, as stored by Blender.
+    Byte images are returned in their color space, float images are always linear.'''
+    import numpy as np
+    width, height = image.size
+    channels = image.channels
+    if width == 0 or height == 0:
         raise Exception(
-            "HDR images must be saved as a .hdr file before exporting")
+            f"The image {image.name} has no pixel data and can't be exported")
+
+    pixels = np.empty(width * height * channels, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, channels)
+
+
+def get_image_rgb_pixels(image: bpy.types.Image):
+    '''Returns the image pixels as a (height, width, 3) float32 array of linear colors.'''
+    import numpy as np
+    pixels = get_image_pixels(image)
+    channels = image.channels
+
+    if channels >= 3:
+        rgb = pixels[:, :, :3]
+    else:
+        rgb = np.repeat(pixels[:, :, :1], 3, axis=2)
+
+    if not image.is_float and image.colorspace_settings.name == 'sRGB':
+        rgb = np.where(rgb <= 0.0404482362771082, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4).astype(np.float32)
+
+    return rgb
+
+
+HDR_FILE_FORMATS = {'HDR', 'OPEN_EXR', 'OPEN_EXR_MULTILAYER'}
+
+
+def is_hdr_image(blender_image):
+    return blender_image.file_format in HDR_FILE_FORMATS
+
+
+def get_image_mime_type(blender_image, export_settings):
+    if export_settings["gltf_image_format"] == "AUTO":
+        if is_hdr_image(blender_image):
+            return "image/vnd.radiance"
+        else:
+            return "image/png"
+    else:
+        return "image/jpeg"
+
+
+def encode_image(blender_image, mime_type, export_settings):
+    from .image_resize import get_resized_size, encode_resized_image
+    from .image_prefetch import get_passthrough_path, get_prefetched_image
+    # Images over their size cap are never passed through, they are resampled instead.
+    resized_size = get_resized_size(blender_image, export_settings)
+    passthrough_path = get_passthrough_path(blender_image, mime_type) if resized_size is None else None
+    if passthrough_path:
+        data = get_prefetched_image(blender_image, mime_type, export_settings)
+        if data is not None:
+            return data
+
+    from .image_cache import get_image_cache_key, read_cached_image, write_cached_image
+    # Images that are written unchanged are cheaper to read from their source than from the cache.
+    cache_key = get_image_cache_key(blender_image, mime_type, export_settings, resized_size) if not passthrough_path else None
+    if cache_key:
+        data = read_cached_image(cache_key)
+        if data is not None:
+            return data
+
+    # The prefetch threads RGBE encode and resample the images that aren't passed through unless they are cached.
+    prefetched = get_prefetched_image(blender_image, mime_type, export_settings) if not passthrough_path else None
+    if resized_size is not None:
+        data = encode_resized_image(blender_image, resized_size, mime_type, export_settings, prefetched)
+    elif prefetched is not None:
+        data = prefetched
+    else:
+        data = HubsExportImage.from_blender_image(blender_image).encode(mime_type, export_settings)
+
+    if type(data) is tuple:
+        data = data[0]
+
+    if cache_key:
+        write_cached_image(cache_key, data)
+
+    return data
 
 
 @cached
@@ -141,18 +252,9 @@ def gather_image(blender_image, export_settings):
     name, _extension = os.path.splitext(
         os.path.basename(blender_image.filepath))
 
-    if export_settings["gltf_image_format"] == "AUTO":
-        if blender_image.file_format == "HDR":
-            mime_type = "image/vnd.radiance"
-        else:
-            mime_type = "image/png"
-    else:
-        mime_type = "image/jpeg"
-
-    data = HubsExportImage.from_blender_image(blender_image).encode(mime_type, export_settings)
+    mime_type = get_image_mime_type(blender_image, export_settings)
 
-    if type(data) is tuple:
-        data = data[0]
+    data = encode_image(blender_image, mime_type, export_settings)
 
     if export_settings['gltf_format'] == 'GLTF_SEPARATE':
         # io_scene_gltf2.blender.exp.material.texture.__gather_source can be used as a reference for what's needed here.
@@ -186,7 +288,7 @@ def gather_texture(blender_image, export_settings):
         return None
 
     texture_extensions = {}
-    is_hdr = blender_image and blender_image.file_format == "HDR"
+    is_hdr = blender_image and is_hdr_image(blender_image)
 
     if is_hdr:
         ext_name = "MOZ_texture_rgbe"
@@ -212,9 +314,8 @@ def gather_texture(blender_image, export_settings):
 def gather_properties(export_settings, object, component):
     value = {}
 
-    for key in component.get_properties():
-        value[key] = gather_property(
-            export_settings, object, component, key)
+    for key, gather in get_gather_plan(type(component)).items():
+        value[key] = gather(export_settings, object, component, key)
 
     if value:
         return value
@@ -228,28 +329,69 @@ def gather_properties(export_settings, object, component):
 
 
 def gather_property(export_settings, blender_object, target, property_name):
-    property_definition = target.bl_rna.properties[property_name]
-    property_value = getattr(target, property_name)
-    isArray = getattr(property_definition, 'is_array', None)
+    gather_plan = gather_plans.get(type(target))
+    if gather_plan and property_name in gather_plan:
+        gather = gather_plan[property_name]
+    else:
+        gather = get_property_gatherer(target.bl_rna.properties[property_name])
+
+    return gather(export_settings, blender_object, target, property_name)
 
-    if isArray and property_definition.is_array:
-        if property_definition.subtype.startswith('COLOR'):
-            return gather_color_property(
-                export_settings, blender_object, target, property_name, property_definition.subtype)
+
+def gather_scalar_property(export_settings, blender_object, target, property_name):
+    return gltf2_blender_extras.__to_json_compatible(getattr(target, property_name))
+
+
+def get_property_gatherer(property_definition):
+    '''Returns the function used to export a property based on its definition.
+    The returned function has the same signature as gather_property.'''
+    if getattr(property_definition, 'is_array', None):
+        subtype = property_definition.subtype
+        if subtype.startswith('COLOR'):
+            def gather_color(export_settings, blender_object, target, property_name):
+                return gather_color_property(export_settings, blender_object, target, property_name, subtype)
+            return gather_color
+        elif is_vec_property_array(property_definition):
+            return gather_vec_array_property
         else:
-            return gather_vec_property(export_settings, blender_object, target, property_name)
+            return gather_vec_object_property
+
+    elif property_definition.bl_rna.identifier == 'PointerProperty':
+        pointer_type = property_definition.fixed_type.identifier
+        if pointer_type == 'Object':
+            return gather_node_property
+        elif pointer_type == 'Material':
+            return gather_material_property
+        elif pointer_type == 'Image':
+            return gather_image_property
+
+    return gather_scalar_property
 
-    elif (property_definition.bl_rna.identifier == 'PointerProperty'):
-        if type(property_value) is bpy.types.Object:
-            return gather_node_property(export_settings, blender_object, target, property_name)
-        elif type(property_value) is bpy.types.Material:
-            return gather_material_property(export_settings, blender_object, target, property_name)
-        elif type(property_value) is bpy.types.Image:
-            return gather_image_property(export_settings, blender_object, target, property_name)
-        elif type(property_value) is bpy.types.Texture:
-            return gather_texture_property(export_settings, blender_object, target, property_name)
 
-    return gltf2_blender_extras.__to_json_compatible(property_value)
+gather_plans = {}
+
+
+def compile_gather_plan(component_class):
+    '''Resolves the exporter function of every component property once so it can be reused for all the component instances.
+    This needs to be called after the component class has been registered as the property definitions are read from bl_rna.'''
+    gather_plan = {}
+    for property_name in component_class.get_properties():
+        property_definition = component_class.bl_rna.properties[property_name]
+        gather_plan[property_name] = get_property_gatherer(property_definition)
+
+    gather_plans[component_class] = gather_plan
+    return gather_plan
+
+
+def remove_gather_plan(component_class):
+    gather_plans.pop(component_class, None)
+
+
+def get_gather_plan(component_class):
+    gather_plan = gather_plans.get(component_class)
+    if gather_plan is None:
+        gather_plan = compile_gather_plan(component_class)
+    return gather_plan
 
 
 def gather_array_property(export_settings, blender_object, target, property_name):
@@ -264,26 +406,74 @@ def gather_array_property(export_settings, blender_object, target, property_name
     return value
 
 
+def get_vnode_index(export_settings):
+    '''Returns the Blender object and (armature, bone name) to vnode uuid lookups for the current export.
+    The lookups are built once from the export's vtree and shared by all the node/joint reference gathers.'''
+    vtree = export_settings['vtree']
+    vnode_index = export_settings.get('hubs_vnode_index')
+    if vnode_index is None or vnode_index['vtree'] is not vtree:
+        objects = {}
+        bones = {}
+        for uuid, vnode in vtree.nodes.items():
+            if vnode.blender_bone is not None:
+                # Bone vnodes keep a reference to their armature object in blender_object.
+                bones.setdefault((vnode.blender_object, vnode.blender_bone.name), uuid)
+            elif vnode.blender_object is not None:
+                # Keep the first match to preserve the previous lookup order for instanced objects.
+                objects.setdefault(vnode.blender_object, uuid)
+
+        vnode_index = {
+            'vtree': vtree,
+            'objects': objects,
+            'bones': bones
+        }
+        export_settings['hubs_vnode_index'] = vnode_index
+
+    return vnode_index
+
+
+def gather_node_reference(export_settings, blender_object):
+    if bpy.app.version < (3, 2, 0):
+        # There is no vtree before 3.2, gather_node is cached per export so it can be called directly.
+        return gltf2_blender_gather_nodes.gather_node(
+            blender_object,
+            blender_object.library.name if blender_object.library else None,
+            blender_object.users_scene[0],
+            None,
+            export_settings
+        )
+
+    vtree = export_settings['vtree']
+    vnode_index = get_vnode_index(export_settings)
+    vnode = vtree.nodes[vnode_index['objects'].get(blender_object)]
+    return vnode.node or gltf2_blender_gather_nodes.gather_node(
+        vnode,
+        export_settings
+    )
+
+
+def gather_joint_reference(export_settings, blender_object, joint):
+    if bpy.app.version < (3, 2, 0):
+        return gltf2_blender_gather_joints.gather_joint(
+            blender_object,
+            joint,
+            export_settings
+        )
+
+    vtree = export_settings['vtree']
+    vnode_index = get_vnode_index(export_settings)
+    vnode = vtree.nodes[vnode_index['bones'].get((blender_object, joint.name))]
+    return vnode.node or gltf2_blender_gather_joints.gather_joint_vnode(
+        vnode,
+        export_settings
+    )
+
+
 def gather_node_property(export_settings, blender_object, target, property_name):
     blender_object = getattr(target, property_name)
 
     if blender_object:
-        if bpy.app.version < (3, 2, 0):
-            node = gltf2_blender_gather_nodes.gather_node(
-                blender_object,
-                blender_object.library.name if blender_object.library else None,
-                blender_object.users_scene[0],
-                None,
-                export_settings
-            )
-        else:
-            vtree = export_settings['vtree']
-            vnode = vtree.nodes[next((uuid for uuid in vtree.nodes if (
-                vtree.nodes[uuid].blender_object == blender_object)), None)]
-            node = vnode.node or gltf2_blender_gather_nodes.gather_node(
-                vnode,
-                export_settings
-            )
+        node = gather_node_reference(export_settings, blender_object)
 
         return {
             "__mhc_link_type": "node",
@@ -300,20 +490,7 @@ def gather_joint_property(export_settings, blender_object, target, property_name
     joint = blender_object.pose.bones[joint_name]
 
     if joint:
-        if bpy.app.version < (3, 2, 0):
-            node = gltf2_blender_gather_joints.gather_joint(
-                blender_object,
-                joint,
-                export_settings
-            )
-        else:
-            vtree = export_settings['vtree']
-            vnode = vtree.nodes[next((uuid for uuid in vtree.nodes if (
-                vtree.nodes[uuid].blender_bone == joint)), None)]
-            node = vnode.node or gltf2_blender_gather_joints.gather_joint_vnode(
-                vnode,
-                export_settings
-            )
+        node = gather_joint_reference(export_settings, blender_object, joint)
 
         return {
             "__mhc_link_type": "node",
@@ -334,29 +511,40 @@ def gather_material_property(export_settings, blender_object, target, property_n
         return None
 
 
-def gather_vec_property(export_settings, blender_object, target, property_name):
-    vec = getattr(target, property_name)
-
-    property_definition = target.bl_rna.properties[property_name]
+def is_vec_property_array(property_definition):
     unit = getattr(property_definition, 'unit', None)
     subtype = getattr(property_definition, 'subtype', None)
 
     # We export vectors with no unit and no subtype as arrays. This is not ideal, we should find a way
     # to tag properties as Array/Object to decouple the Blender type from the export type.
-    if unit == 'NONE' and subtype == 'NONE':
-        out = []
-        for value in vec:
-            out.append(value)
+    return unit == 'NONE' and subtype == 'NONE'
+
+
+def gather_vec_property(export_settings, blender_object, target, property_name):
+    property_definition = target.bl_rna.properties[property_name]
+
+    if is_vec_property_array(property_definition):
+        return gather_vec_array_property(export_settings, blender_object, target, property_name)
     else:
-        out = {
-            "x": vec[0],
-            "y": vec[1],
-        }
+        return gather_vec_object_property(export_settings, blender_object, target, property_name)
+
 
-        if len(vec) > 2:
-            out["z"] = vec[2]
-        if len(vec) > 3:
-            out["w"] = vec[3]
+def gather_vec_array_property(export_settings, blender_object, target, property_name):
+    return list(getattr(target, property_name))
+
+
+def gather_vec_object_property(export_settings, blender_object, target, property_name):
+    vec = getattr(target, property_name)
+
+    out = {
+        "x": vec[0],
+        "y": vec[1],
+    }
+
+    if len(vec) > 2:
+        out["z"] = vec[2]
+    if len(vec) > 3:
+        out["w"] = vec[3]
 
     return out
 
@@ -402,6 +590,11 @@ def lin2srgb(lin):
 
 
 def gather_color_property(export_settings, object, component, property_name, color_type):
+    from .colors import get_gathered_color
+    hex_color = get_gathered_color(export_settings, component, property_name, color_type)
+    if hex_color is not None:
+        return hex_color
+
     c = list(getattr(component, property_name))
 
     # Blender stores colors in linear space for subtype COLOR and sRGB for COLOR_GAMMA
@@ -422,18 +615,20 @@ def gather_color_property(export_settings, object, component, property_name, col
 
 
 def gather_lightmap_texture_info(blender_material, export_settings):
-    nodes = blender_material.node_tree.nodes
-    lightmap_node = next(
-        (n for n in nodes if isinstance(n, MozLightmapNode)), None)
+    if not export_settings.get('hubs_has_lightmaps', True):
+        return
+
+    from .lightmap_cache import get_lightmap_nodes
+    lightmap_node, image_node = get_lightmap_nodes(blender_material)
 
-    if not lightmap_node:
+    if not lightmap_node or not image_node:
         return
 
     texture_socket = lightmap_node.inputs.get("Lightmap")
     intensity = lightmap_node.intensity
 
-    # TODO this assumes a single image directly connected to the socket
-    blender_image = texture_socket.links[0].from_node.image
+    # The image can be connected directly or through reroute and mix nodes.
+    blender_image = image_node.image
     texture = gather_texture(blender_image, export_settings)
     socket = lightmap_node.inputs.get("Lightmap") if bpy.app.version < (4, 1, 0) \
         else gltf2_blender_search_node_tree.NodeSocket(texture_socket, blender_material)
@@ -505,16 +700,20 @@ def import_component(component_name, blender_object):
 
 
 def set_color_from_hex(blender_component, property_name, hexcolor):
+    from .colors import get_srgb_to_linear_table
     hexcolor = hexcolor.lstrip('#')
     rgb_int = [int(hexcolor[i:i + 2], 16) for i in (0, 2, 4)]
 
-    for x, value in enumerate(rgb_int):
-        rgb_float = value / 255 if value > 0 else 0
-        if blender_component.bl_rna.properties[property_name].subtype == 'COLOR':
-            # Blender stores colors in linear space for subtype COLOR and sRGB for COLOR_GAMMA
-            # Colors in the glTF components are in sRGB so we convert them here if needed.
-            rgb_float = srgb2lin(rgb_float)
-        getattr(blender_component, property_name)[x] = rgb_float
+    if blender_component.bl_rna.properties[property_name].subtype == 'COLOR':
+        # Blender stores colors in linear space for subtype COLOR and sRGB for COLOR_GAMMA
+        # Colors in the glTF components are in sRGB so we convert them here if needed.
+        srgb_to_linear = get_srgb_to_linear_table()
+        rgb_float = [srgb_to_linear[value] for value in rgb_int]
+    else:
+        rgb_float = [value / 255 if value > 0 else 0 for value in rgb_int]
+
+    # Write all the channels at once, leaving the alpha channel of RGBA colors untouched.
+    getattr(blender_component, property_name)[:3] = rgb_float
 
 
 def assign_property(vnodes, blender_component, property_name, property_value):
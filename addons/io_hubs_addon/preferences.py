@@ -1,6 +1,6 @@
 import bpy
 from bpy.types import AddonPreferences, Context
-from bpy.props import IntProperty, StringProperty, EnumProperty, BoolProperty, PointerProperty, CollectionProperty
+from bpy.props import IntProperty, FloatProperty, StringProperty, EnumProperty, BoolProperty, PointerProperty, CollectionProperty
 from .utils import get_addon_package, is_module_available, get_browser_profile_directory
 import platform
 from os.path import join, dirname, realpath
@@ -137,6 +137,19 @@ class DeleteProfileOperator(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class ClearImageCacheOperator(bpy.types.Operator):
+    bl_idname = "pref.hubs_prefs_clear_image_cache"
+    bl_label = "Clear Image Cache"
+    bl_description = "Delete all the cached encoded images"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        from .io.image_cache import clear_image_cache
+        clear_image_cache()
+
+        return {'FINISHED'}
+
+
 def set_prefs_dirty(self, context):
     context.preferences.is_dirty = True
 
@@ -267,6 +280,31 @@ class HubsPreferences(AddonPreferences):
 
     user_components_paths: CollectionProperty(type=HubsUserComponentsPath)
 
+    use_image_cache: BoolProperty(
+        name="Cache Encoded Images",
+        description="Keep the encoded component images (environment maps, lightmaps, reflection probes, etc.) on disk and reuse them in later exports when the source images haven't changed",
+        default=False)
+    image_cache_max_size: IntProperty(
+        name="Image Cache Size (MB)",
+        description="Maximum size of the image cache on disk. The least recently used images are removed when it's exceeded",
+        default=1024,
+        min=1)
+
+    cull_gizmos: BoolProperty(
+        name="Cull Offscreen Gizmos",
+        description="Don't draw the Hubs gizmos that are outside of the view",
+        default=True)
+    gizmo_draw_distance: FloatProperty(
+        name="Gizmo Draw Distance",
+        description="Don't draw the Hubs gizmos farther than this distance from the view. Set to 0 to draw them at any distance",
+        subtype='DISTANCE',
+        default=0.0,
+        min=0.0)
+    draw_far_gizmos_as_points: BoolProperty(
+        name="Draw Far Gizmos as Points",
+        description="Draw the Hubs gizmos beyond the draw distance as points instead of hiding them",
+        default=True)
+
     def draw(self, context):
         layout = self.layout
         box = layout.box()
@@ -275,6 +313,25 @@ class HubsPreferences(AddonPreferences):
         box.row().prop(self, "recast_lib_path")
 
         draw_user_modules_path_panel(context, layout, self)
+
+        box = layout.box()
+        box.row().prop(self, "use_image_cache")
+        row = box.row()
+        row.enabled = self.use_image_cache
+        row.prop(self, "image_cache_max_size")
+        from .io.image_cache import get_image_cache_info
+        entries_count, cache_size = get_image_cache_info()
+        row = box.row()
+        row.label(text=f"{entries_count} cached images using {cache_size / 1024 / 1024:.2f} MB")
+        row.operator(ClearImageCacheOperator.bl_idname)
+
+        box = layout.box()
+        box.row().prop(self, "cull_gizmos")
+        box.row().prop(self, "gizmo_draw_distance")
+        row = box.row()
+        row.enabled = self.gizmo_draw_distance > 0
+        row.prop(self, "draw_far_gizmos_as_points")
+
         box = layout.box()
         box.label(text="Scene debugger configuration")
 
@@ -348,9 +405,11 @@ def register():
     bpy.utils.register_class(InstallDepsOperator)
     bpy.utils.register_class(UninstallDepsOperator)
     bpy.utils.register_class(DeleteProfileOperator)
+    bpy.utils.register_class(ClearImageCacheOperator)
 
 
 def unregister():
+    bpy.utils.unregister_class(ClearImageCacheOperator)
     bpy.utils.unregister_class(DeleteProfileOperator)
     bpy.utils.unregister_class(UninstallDepsOperator)
     bpy.utils.unregister_class(InstallDepsOperator)
@@ -0,0 +1,176 @@
+# Batch export utility script to export many .blend files with the Hubs add-on in parallel.
+# Usage:
+# Run with a system Python (not from inside Blender), the add-on is loaded from this repository:
+# python scripts/batch_export.py worlds/ extra/scene.blend --blender /path/to/blender --jobs 4 --glb
+# Each file is exported with tests/export_gltf.py in its own background Blender process to
+# <blend file dir>/<output dir>/<blend file name>.glb|.gltf and a JSON summary is written for the whole batch.
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXPORT_SCRIPT = os.path.join(REPO_DIR, "tests", "export_gltf.py")
+STDERR_TAIL_LINES = 20
+
+
+def find_blend_files(inputs):
+    '''Returns the .blend files passed directly or found recursively in the passed directories.'''
+    blend_files = []
+    for path in inputs:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                blend_files.extend(os.path.join(root, name) for name in sorted(files) if name.endswith(".blend"))
+        elif path.endswith(".blend") and os.path.isfile(path):
+            blend_files.append(path)
+        else:
+            print(f"Warning: Skipping {path}, it's not a .blend file or a directory", file=sys.stderr)
+
+    return sorted(set(os.path.abspath(blend_file) for blend_file in blend_files))
+
+
+def get_blender_env():
+    env = dict(os.environ)
+    # Make Blender pick up the add-on from this repository, like the test harness does.
+    env.setdefault("BLENDER_USER_SCRIPTS", REPO_DIR)
+    return env
+
+
+def export_blend_file(blend_file, args):
+    '''Exports a single .blend file, retrying failed attempts, and returns its summary entry.'''
+    result = {
+        "file": blend_file,
+        "status": "failed",
+        "attempts": 0,
+        "duration": 0.0,
+        "output": None,
+        "output_size": None,
+        "component_counts": {},
+        "warnings": [],
+        "size_report": None,
+        "error": None
+    }
+
+    summary_fd, summary_path = tempfile.mkstemp(prefix="hubs_export_", suffix=".json")
+    os.close(summary_fd)
+    cmd = [args.blender, "-b", "--factory-startup", "--addons", "io_hubs_addon", "-noaudio", blend_file,
+           "--python", EXPORT_SCRIPT, "--", args.output_dir, "--summary", summary_path]
+    if args.glb:
+        cmd.append("--glb")
+    if args.optimize:
+        cmd.append("--optimize")
+    if args.size_report:
+        cmd.append("--size-report")
+
+    try:
+        for attempt in range(1, args.retries + 2):
+            result["attempts"] = attempt
+            start = time.perf_counter()
+            try:
+                process = subprocess.run(cmd, env=get_blender_env(), capture_output=True, text=True,
+                                         errors="replace", timeout=args.timeout)
+            except subprocess.TimeoutExpired:
+                result["duration"] = time.perf_counter() - start
+                result["status"] = "timeout"
+                result["error"] = f"Export timed out after {args.timeout} seconds"
+                continue
+            except OSError as err:
+                result["duration"] = time.perf_counter() - start
+                result["error"] = str(err)
+                break
+
+            result["duration"] = time.perf_counter() - start
+            export_summary = read_export_summary(summary_path)
+            if process.returncode == 0 and export_summary:
+                result["status"] = "ok"
+                result["error"] = None
+                result["output"] = export_summary["output"]
+                result["component_counts"] = export_summary["component_counts"]
+                result["warnings"] = export_summary["warnings"]
+                result["size_report"] = export_summary.get("size_report")
+                if os.path.isfile(result["output"]):
+                    result["output_size"] = os.path.getsize(result["output"])
+                break
+
+            result["status"] = "failed"
+            stderr_lines = process.stderr.strip().splitlines()
+            result["error"] = "\n".join(stderr_lines[-STDERR_TAIL_LINES:]) or f"Blender exited with code {process.returncode}"
+    finally:
+        if os.path.exists(summary_path):
+            os.remove(summary_path)
+
+    return result
+
+
+def read_export_summary(summary_path):
+    try:
+        with open(summary_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export .blend files with the Hubs add-on in parallel background Blender processes.")
+    parser.add_argument("inputs", nargs="+", help=".blend files or directories to search for .blend files")
+    parser.add_argument("--blender", default="blender", help="Blender executable (default: %(default)s)")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="Number of Blender processes to run at once (default: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=600,
+                        help="Seconds before an export is cancelled (default: %(default)s)")
+    parser.add_argument("--retries", type=int, default=1,
+                        help="Number of times a failed export is retried (default: %(default)s)")
+    parser.add_argument("--output-dir", default="out",
+                        help="Output directory, relative to each .blend file (default: %(default)s)")
+    parser.add_argument("--glb", action="store_true", help="Export .glb files instead of .gltf files")
+    parser.add_argument("--optimize", action="store_true",
+                        help="Deduplicate the images, textures, samplers and buffer views of the exported .glb files")
+    parser.add_argument("--size-report", action="store_true",
+                        help="Write a size report for each exported .glb file, checked against the size budgets of its scene and its previous export")
+    parser.add_argument("--summary", default="batch_export_summary.json",
+                        help="Path of the JSON summary (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    blend_files = find_blend_files(args.inputs)
+    if not blend_files:
+        print("Error: No .blend files found", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = [executor.submit(export_blend_file, blend_file, args) for blend_file in blend_files]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"[{len(results)}/{len(blend_files)}] {result['status']}: {result['file']} "
+                  f"({result['duration']:.1f}s, {result['attempts']} attempt(s))")
+
+    results.sort(key=lambda result: result["file"])
+    failed_count = sum(1 for result in results if result["status"] != "ok")
+    over_budget_count = sum(1 for result in results
+                            if result["size_report"] and result["size_report"]["budget_violations"])
+    summary = {
+        "blender": args.blender,
+        "duration": time.perf_counter() - start,
+        "exported": len(results) - failed_count,
+        "failed": failed_count,
+        "over_budget": over_budget_count,
+        "files": results
+    }
+    with open(args.summary, "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"Exported {summary['exported']} of {len(results)} files, summary written to {args.summary}")
+    if over_budget_count:
+        print(f"{over_budget_count} files are over their size budget")
+    return 1 if failed_count or over_budget_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# Blender utility script to measure the "Reuse Unchanged Components" export option.
+# Usage:
+# Run Blender in the background with the add-on loaded from this repository:
+# BLENDER_USER_SCRIPTS=. blender -b --factory-startup --python scripts/benchmark_component_cache.py -- [host count] [repeats]
+# It builds a file with many component hosts, exports it, edits one object and exports it again, with and without the
+# option. The export times are printed and the components of both exports are compared.
+
+import bpy
+import json
+import os
+import sys
+import tempfile
+import time
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+DEFAULT_HOST_COUNT = 10000
+DEFAULT_REPEATS = 3
+
+
+def build_scene(host_count):
+    from io_hubs_addon.components.utils import add_component
+    for ob in list(bpy.data.objects):
+        bpy.data.objects.remove(ob)
+
+    scene = bpy.context.scene
+    for index in range(host_count):
+        ob = bpy.data.objects.new(f"Host {index}", None)
+        scene.collection.objects.link(ob)
+        ob.location = (index % 100, index // 100, 0)
+        add_component(ob, 'point-light')
+        ob.hubs_component_point_light.intensity = 1 + index % 7
+        add_component(ob, 'link')
+        ob.hubs_component_link.href = f"https://example.com/{index}"
+        add_component(ob, 'visible')
+
+
+def export(filepath):
+    start = time.perf_counter()
+    bpy.ops.export_scene.gltf(export_format='GLTF_SEPARATE', filepath=filepath)
+    return time.perf_counter() - start
+
+
+def read_components(filepath):
+    with open(filepath) as f:
+        gltf = json.load(f)
+    return {node['name']: node.get('extensions', {}).get('MOZ_hubs_components') for node in gltf['nodes']}
+
+
+def benchmark(reuse_components, output_dir, repeats):
+    '''Returns the time of the first export and the best time of re-exporting after editing one object.'''
+    bpy.context.scene.HubsComponentsExtensionProperties.reuse_components = reuse_components
+    filepath = os.path.join(output_dir, f"benchmark-{'reuse' if reuse_components else 'gather'}.gltf")
+    first_time = export(filepath)
+
+    edit_times = []
+    for repeat in range(repeats):
+        ob = bpy.data.objects["Host 0"]
+        ob.hubs_component_point_light.intensity = 10 + repeat
+        ob.location.z = repeat
+        edit_times.append(export(filepath))
+
+    return first_time, min(edit_times), read_components(filepath)
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    host_count = int(argv[0]) if len(argv) > 0 else DEFAULT_HOST_COUNT
+    repeats = int(argv[1]) if len(argv) > 1 else DEFAULT_REPEATS
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        results = {}
+        for reuse_components in (False, True):
+            build_scene(host_count)
+            results[reuse_components] = benchmark(reuse_components, output_dir, repeats)
+
+    for reuse_components, (first_time, edit_time, _) in results.items():
+        print(f"{'Reuse' if reuse_components else 'Gather'}: first export {first_time:.3f} s, "
+              f"export after editing one object {edit_time:.3f} s")
+
+    if results[False][2] != results[True][2]:
+        raise Exception("The components exported with the cache don't match the ones gathered again")
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
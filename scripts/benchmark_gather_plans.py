@@ -0,0 +1,113 @@
+# Blender utility script to measure the component gather plans against the per property dispatch they replaced.
+# Usage:
+# Run Blender in the background with the add-on loaded from this repository:
+# BLENDER_USER_SCRIPTS=. blender -b --factory-startup --python scripts/benchmark_gather_plans.py -- [host count] [repeats]
+# It adds components to many objects and gathers all of them with gather_properties, which looks the exporter of
+# every property up in the gather plan of the component class, and with the original gather_property dispatch,
+# which reads the property definition and picks its exporter for every property of every component.
+# The best time of each is printed and the gathered values are compared.
+
+import bpy
+import sys
+import time
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+DEFAULT_HOST_COUNT = 10000
+DEFAULT_REPEATS = 5
+# Components with scalar, string, enum, vector and color properties. Pointer properties need a running export.
+COMPONENT_NAMES = ['point-light', 'spot-light', 'audio-params', 'text', 'link', 'waypoint']
+
+
+def build_scene(host_count):
+    from io_hubs_addon.components.utils import add_component
+    for ob in list(bpy.data.objects):
+        bpy.data.objects.remove(ob)
+
+    scene = bpy.context.scene
+    for index in range(host_count):
+        ob = bpy.data.objects.new(f"Host {index}", None)
+        scene.collection.objects.link(ob)
+        for component_name in COMPONENT_NAMES:
+            add_component(ob, component_name)
+
+
+def get_components():
+    from io_hubs_addon.components.components_registry import get_component_by_name
+    components = []
+    for ob in bpy.context.scene.objects:
+        for component_name in COMPONENT_NAMES:
+            component_class = get_component_by_name(component_name)
+            components.append((ob, getattr(ob, component_class.get_id())))
+    return components
+
+
+def gather_property_per_call(export_settings, blender_object, target, property_name):
+    '''The dispatch of gather_property before the gather plans, without the pointer properties.'''
+    from io_hubs_addon.io.utils import gather_color_property, gather_vec_property, gather_scalar_property
+    property_definition = target.bl_rna.properties[property_name]
+    # The original read every value up front to check the type of the pointer properties.
+    getattr(target, property_name)
+    isArray = getattr(property_definition, 'is_array', None)
+
+    if isArray and property_definition.is_array:
+        if property_definition.subtype.startswith('COLOR'):
+            return gather_color_property(
+                export_settings, blender_object, target, property_name, property_definition.subtype)
+        else:
+            return gather_vec_property(export_settings, blender_object, target, property_name)
+
+    return gather_scalar_property(export_settings, blender_object, target, property_name)
+
+
+def gather_per_call(components):
+    export_settings = {}
+    gathered = []
+    for ob, component in components:
+        value = {}
+        for key in component.get_properties():
+            value[key] = gather_property_per_call(export_settings, ob, component, key)
+        gathered.append(value)
+    return gathered
+
+
+def gather_planned(components):
+    from io_hubs_addon.io.utils import gather_properties
+    export_settings = {}
+    return [gather_properties(export_settings, ob, component) for ob, component in components]
+
+
+def benchmark(gather, components, repeats):
+    '''Returns the best time of gathering all the components and the gathered values.'''
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        gathered = gather(components)
+        times.append(time.perf_counter() - start)
+    return min(times), gathered
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    host_count = int(argv[0]) if len(argv) > 0 else DEFAULT_HOST_COUNT
+    repeats = int(argv[1]) if len(argv) > 1 else DEFAULT_REPEATS
+
+    build_scene(host_count)
+    components = get_components()
+    per_call_time, per_call_values = benchmark(gather_per_call, components, repeats)
+    planned_time, planned_values = benchmark(gather_planned, components, repeats)
+
+    print(f"Per call dispatch: {per_call_time:.3f} s for {len(components)} components")
+    print(f"Gather plans: {planned_time:.3f} s for {len(components)} components, "
+          f"{per_call_time / max(planned_time, 1e-9):.2f}x faster")
+
+    if per_call_values != planned_values:
+        raise Exception("The components gathered with the gather plans don't match the ones gathered per call")
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
@@ -2,17 +2,29 @@
 # Usage:
 # Run Blender from the terminal.
 # Create a new script file, copy this script in the new file and run.
+# Save the file as addons/io_hubs_addon/components/models/<model name>.bin and load it with load_gizmo_shape("<model name>").
 
 import bpy
+import struct
+import sys
+from array import array
 
 from bpy.props import StringProperty
 from bpy_extras.io_utils import ImportHelper
 from bpy.types import Operator
 
 
+# Keep in sync with the gizmo model format in addons/io_hubs_addon/components/models/__init__.py
+GIZMO_SHAPE_MAGIC = b'HGZ1'
+GIZMO_SHAPE_HEADER = struct.Struct('<4sII')
+
+
 def convert(objects):
-    '''Prints the model vertices in gizmo format and world space'''
-    out = 'SHAPE = ('
+    '''Returns the model triangles in gizmo format and world space.
+    Vertices shared by several triangles are only written once and referenced by index.'''
+    vertex_indices = {}
+    vertices = array('f')
+    indices = array('I')
     for ob in objects:
         if ob.type == 'MESH':
             mesh = ob.data
@@ -22,9 +34,18 @@ def convert(objects):
                 for i in range(3):
                     v_index = tri.vertices[i]
                     v = mat @ mesh.vertices[v_index].co
-                    out += '(%f, %f, %f),' % (v.x, v.y, v.z)
-    out += ')'
-    return out
+                    # Round like the previous text format so that coincident vertices of different objects are merged.
+                    co = (round(v.x, 6), round(v.y, 6), round(v.z, 6))
+                    if co not in vertex_indices:
+                        vertex_indices[co] = len(vertex_indices)
+                        vertices.extend(co)
+                    indices.append(vertex_indices[co])
+
+    if sys.byteorder == 'big':
+        vertices.byteswap()
+        indices.byteswap()
+
+    return GIZMO_SHAPE_HEADER.pack(GIZMO_SHAPE_MAGIC, len(vertex_indices), len(indices)) + vertices.tobytes() + indices.tobytes()
 
 
 class SaveGizmoOperator(Operator, ImportHelper):
@@ -33,7 +54,7 @@ class SaveGizmoOperator(Operator, ImportHelper):
     bl_label = "Save Gizmo"
 
     filter_glob: StringProperty(
-        default='*.py;',
+        default='*.bin;',
         options={'HIDDEN'}
     )
 
@@ -41,7 +62,7 @@ class SaveGizmoOperator(Operator, ImportHelper):
         """Save gizmo outout to a file."""
         gizmo = convert(context.selected_objects)
 
-        f = open(self.filepath, "w")
+        f = open(self.filepath, "wb")
         f.write(gizmo)
         f.close()
 
@@ -0,0 +1,86 @@
+import bpy
+import math
+import os
+import sys
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+
+def add_mesh_object(name, primitive, parent=None, location=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1), apply_scale=False):
+    getattr(bpy.ops.mesh, primitive)(location=location, rotation=[math.radians(angle) for angle in rotation], scale=scale)
+    ob = bpy.context.active_object
+    ob.name = name
+    if apply_scale:
+        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+    if parent:
+        ob.parent = parent
+        ob.matrix_parent_inverse = parent.matrix_world.inverted()
+    bpy.context.view_layer.update()
+    return ob
+
+
+def add_ammo_shape(ob, shape_type, **props):
+    from io_hubs_addon.components.utils import add_component
+    add_component(ob, 'ammo-shape')
+    component = ob.hubs_component_ammo_shape
+    component.type = shape_type
+    component.fit = 'all'
+    for name, value in props.items():
+        setattr(component, name, value)
+
+
+def build_scene():
+    '''Builds colliders whose fit depends on rotated, scaled, nested, unselected and invisible descendants.'''
+    from io_hubs_addon.components.utils import add_component
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+
+    box = add_mesh_object("Box", 'primitive_cube_add', location=(0, 0, 1), rotation=(0, 0, 30), scale=(1, 2, 0.5), apply_scale=True)
+    add_ammo_shape(box, 'box')
+    box_child = add_mesh_object("Box Child", 'primitive_uv_sphere_add', box, location=(2, 1, 1.5), rotation=(20, 0, 45), scale=(0.5, 0.5, 1.5))
+    add_mesh_object("Box Grandchild", 'primitive_cone_add', box_child, location=(3, -1, 0))
+    # Not exported with the selection only option, so it can't grow the collider.
+    add_mesh_object("Box Unselected", 'primitive_cube_add', box, location=(10, 10, 10))
+    # Hidden with the visible component, the client skips it unless includeInvisible is set.
+    box_invisible = add_mesh_object("Box Invisible", 'primitive_cube_add', box, location=(-10, -10, -10))
+    add_component(box_invisible, 'visible')
+    box_invisible.hubs_component_visible.visible = False
+
+    sphere = add_mesh_object("Sphere", 'primitive_ico_sphere_add', location=(-4, 0, 0), rotation=(0, 45, 0))
+    sphere.data.transform(((1, 0, 0, 0.5), (0, 1, 0, 0), (0, 0, 1, 0.25), (0, 0, 0, 1)))
+    add_ammo_shape(sphere, 'sphere')
+    add_mesh_object("Sphere Child", 'primitive_torus_add', sphere, location=(-4, 3, 1), rotation=(90, 0, 0))
+
+    # The client scales automatically fitted shapes by the host's world scale, the precomputed ones have to include it.
+    scaled_box = add_mesh_object("Scaled Box", 'primitive_cube_add', location=(0, 6, 0), rotation=(0, 0, 30), scale=(2, 0.5, 1.5))
+    add_ammo_shape(scaled_box, 'box')
+    add_mesh_object("Scaled Box Child", 'primitive_cone_add', scaled_box, location=(1, 8, 1), rotation=(0, 30, 0))
+
+    scaled_sphere = add_mesh_object("Scaled Sphere", 'primitive_ico_sphere_add', location=(-4, 6, 0), scale=(1.5, 0.5, 0.75))
+    add_ammo_shape(scaled_sphere, 'sphere')
+
+    clamped_box = add_mesh_object("Clamped Box", 'primitive_plane_add', location=(4, 0, 0), scale=(3, 3, 1), apply_scale=True)
+    add_ammo_shape(clamped_box, 'box', minHalfExtent=0.25, maxHalfExtent=2.0)
+
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.data.objects["Box Unselected"].select_set(False)
+    bpy.context.scene.HubsComponentsExtensionProperties.precompute_colliders = True
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    output_dir = argv[0]
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    build_scene()
+    bpy.ops.export_scene.gltf(
+        export_format='GLTF_SEPARATE', filepath=os.path.join(output_dir, "collider-fits.gltf"), use_selection=True)
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,93 @@
+import bpy
+import numpy as np
+import sys
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+# Number of evenly spaced values swept on top of the values around the conversion thresholds.
+SWEEP_COUNT = 100000
+# Number of representable neighbors checked on each side of a threshold.
+NEIGHBORS_COUNT = 4
+
+
+def get_neighbors(values, dtype):
+    '''Returns the values with their closest representable neighbors of the given float type on each side.'''
+    values = np.asarray(values, dtype=dtype)
+    neighbors = [values]
+    below = above = values
+    for _ in range(NEIGHBORS_COUNT):
+        below = np.nextafter(below, dtype(-np.inf))
+        above = np.nextafter(above, dtype(np.inf))
+        neighbors += [below, above]
+    return np.concatenate(neighbors)
+
+
+def get_sweep_values():
+    '''Returns float64 and float32 (how Blender stores colors) values covering the input range and the edges of every level.'''
+    from io_hubs_addon.io.colors import get_linear_to_srgb_thresholds, COLOR_LEVELS
+    levels = np.arange(COLOR_LEVELS + 1, dtype=np.float64)
+    edges = np.concatenate((
+        get_linear_to_srgb_thresholds()[1:],
+        levels / 256.0,
+        levels / 255.0,
+        # The linear segment of lin2srgb and srgb2lin.
+        [0.0, 0.0031308, 0.0404482362771082, 1.0],
+    ))
+    values = [np.linspace(-0.1, 1.1, SWEEP_COUNT), [-1.0, 2.0, 1e6, -1e6]]
+    for dtype in (np.float64, np.float32):
+        values.append(get_neighbors(edges, dtype).astype(np.float64))
+    return np.unique(np.concatenate(values))
+
+
+def scalar_quantize(value, color_type):
+    # The per color conversion of gather_color_property.
+    from io_hubs_addon.io.utils import lin2srgb
+    if color_type == "COLOR":
+        value = lin2srgb(value)
+    return max(0, min(int(value * 256.0), 255))
+
+
+def check_quantize_colors(values):
+    from io_hubs_addon.io.colors import quantize_colors, format_hex_colors
+    errors = []
+    colors = np.stack((values, values[::-1], np.roll(values, 1)), axis=1)
+    for color_type in ("COLOR", "COLOR_GAMMA"):
+        levels = quantize_colors(colors, color_type)
+        expected = np.array([[scalar_quantize(channel, color_type) for channel in color] for color in colors.tolist()])
+        for index in np.flatnonzero((levels != expected).any(axis=1))[:10]:
+            errors.append(f"{color_type} {colors[index].tolist()!r}: batched {levels[index].tolist()}, scalar {expected[index].tolist()}")
+
+        hex_colors = format_hex_colors(levels)
+        expected_hex_colors = ["#{0:02x}{1:02x}{2:02x}".format(*color) for color in expected.tolist()]
+        if hex_colors != expected_hex_colors:
+            errors.append(f"{color_type}: the hex colors don't match the scalar formatting")
+    return errors
+
+
+def check_srgb_to_linear_table():
+    from io_hubs_addon.io.colors import get_srgb_to_linear_table, quantize_colors, COLOR_LEVELS
+    from io_hubs_addon.io.utils import srgb2lin
+    errors = []
+    table = get_srgb_to_linear_table()
+    for level in range(COLOR_LEVELS):
+        expected = srgb2lin(level / 255 if level > 0 else 0)
+        if table[level] != expected:
+            errors.append(f"sRGB level {level}: table {table[level]!r}, scalar {expected!r}")
+
+    # Importing and exporting a color again has to give the same level, after Blender stores it as float32.
+    stored = np.array(table, dtype=np.float32).astype(np.float64)
+    levels = quantize_colors(np.stack((stored, stored, stored), axis=1), "COLOR")[:, 0]
+    for level in range(COLOR_LEVELS):
+        expected = scalar_quantize(float(stored[level]), "COLOR")
+        if levels[level] != expected:
+            errors.append(f"sRGB level {level} round trip: batched {levels[level]}, scalar {expected}")
+    return errors
+
+
+try:
+    errors = check_quantize_colors(get_sweep_values()) + check_srgb_to_linear_table()
+    if errors:
+        raise Exception("The batched color conversions don't match the scalar ones:\n" + "\n".join(errors))
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
@@ -13,11 +13,35 @@
 # limitations under the License.
 
 import bpy
+import json
 import os
 import sys
 
 bpy.ops.preferences.addon_enable(module="io_hubs_addon")
 
+
+def get_export_summary():
+    """Collect the component counts and the migration warnings of the open file for batch export summaries."""
+    from io_hubs_addon.components import handlers
+    from io_hubs_addon.components.utils import build_host_index
+
+    # The file was already migrated when it was loaded, migrating it again would report nothing.
+    warnings = list(handlers.load_migration_report)
+
+    component_counts = {}
+    for entry in build_host_index()['entries']:
+        for component_name, component_class, _ in entry['components']:
+            if not component_class:
+                warnings.append(f"Unsupported component {component_name} on {entry['panel_type'].value} {entry['host'].name}")
+                continue
+            component_counts[component_name] = component_counts.get(component_name, 0) + 1
+
+    return {
+        "component_counts": component_counts,
+        "warnings": warnings
+    }
+
+
 try:
     argv = sys.argv
     if "--" in argv:
@@ -29,6 +53,11 @@ try:
     if '--glb' in argv:
         extension = '.glb'
 
+    summary_path = None
+    if '--summary' in argv:
+        summary_path = argv[argv.index('--summary') + 1]
+        summary = get_export_summary()
+
     path = os.path.splitext(bpy.data.filepath)[0] + extension
     path_parts = os.path.split(path)
     output_dir = os.path.join(path_parts[0], argv[0])
@@ -43,7 +72,31 @@ try:
         'export_cameras': True,
         'export_extras': True
     }
+    # Run the optimizer and the size report here once the export has returned instead of from the post export callback,
+    # which may run before the file is written.
+    props = bpy.context.scene.HubsComponentsExtensionProperties
+    optimize_glb = '--optimize' in argv or props.optimize_glb
+    write_size_report = '--size-report' in argv or props.write_size_report
+    props.optimize_glb = False
+    props.write_size_report = False
     bpy.ops.export_scene.gltf(**args)
+
+    if optimize_glb and extension == '.glb':
+        from io_hubs_addon.io.glb_optimizer import run_glb_optimizer
+        run_glb_optimizer(args['filepath'])
+
+    if write_size_report and extension == '.glb':
+        from io_hubs_addon.io.size_report import run_size_report, get_size_budgets
+        size_report = run_size_report(args['filepath'], get_size_budgets(bpy.context.scene))
+        if summary_path and size_report:
+            summary['size_report'] = {
+                key: size_report[key] for key in ('total_bytes', 'categories', 'components', 'budget_violations', 'regressions')
+            }
+
+    if summary_path:
+        summary['output'] = args['filepath']
+        with open(summary_path, 'w') as f:
+            json.dump(summary, f)
 except Exception as err:
     print(err, file=sys.stderr)
     sys.exit(1)
@@ -0,0 +1,78 @@
+import bpy
+import numpy as np
+import sys
+
+bpy.ops.preferences.addon_enable(module="io_hubs_addon")
+
+
+def decode_rle_scanlines(data, rows, width):
+    '''Decodes new style Radiance RLE scanlines like Radiance's freadcolrs, checking the packet lengths on the way.'''
+    rgbe = np.empty((rows, width, 4), dtype=np.uint8)
+    pos = 0
+    for row in range(rows):
+        if tuple(data[pos:pos + 4]) != (2, 2, width >> 8, width & 0xff):
+            raise Exception(f"Invalid header for scanline {row}")
+        pos += 4
+        for channel in range(4):
+            x = 0
+            while x < width:
+                header = data[pos]
+                pos += 1
+                length = header - 128 if header > 128 else header
+                if length == 0 or x + length > width:
+                    raise Exception(f"Invalid packet length {length} in scanline {row}")
+                if header > 128:
+                    rgbe[row, x:x + length, channel] = data[pos]
+                    pos += 1
+                else:
+                    rgbe[row, x:x + length, channel] = np.frombuffer(data[pos:pos + length], dtype=np.uint8)
+                    pos += length
+                x += length
+
+    if pos != len(data):
+        raise Exception(f"{len(data) - pos} bytes left after the last scanline")
+    return rgbe
+
+
+def get_test_scanlines():
+    '''Returns RGBE scanlines with noise, short runs, runs longer than a packet and constant channels.'''
+    rng = np.random.default_rng(0)
+    noise = rng.integers(0, 256, (3, 300, 4), dtype=np.uint8)
+    short_runs = np.repeat(rng.integers(0, 4, (3, 100, 4), dtype=np.uint8), 3, axis=1)
+    mixed_runs = rng.integers(0, 3, (3, 300, 4), dtype=np.uint8)
+    long_runs = np.repeat(rng.integers(0, 256, (3, 3, 4), dtype=np.uint8), 100, axis=1)
+    constant = np.full((2, 300, 4), 7, dtype=np.uint8)
+    return [noise, short_runs, mixed_runs, long_runs, constant, noise[:, :8]]
+
+
+def check_rle_encoding():
+    from io_hubs_addon.io.rgbe import rle_encode_scanlines
+    errors = []
+    for index, rgbe in enumerate(get_test_scanlines()):
+        rows, width, _ = rgbe.shape
+        try:
+            decoded = decode_rle_scanlines(rle_encode_scanlines(rgbe), rows, width)
+        except Exception as err:
+            errors.append(f"Scanlines {index}: {err}")
+            continue
+        if not np.array_equal(decoded, rgbe):
+            errors.append(f"Scanlines {index}: the decoded scanlines don't match the encoded ones")
+    return errors
+
+
+def check_constant_scanline_shrinks():
+    from io_hubs_addon.io.rgbe import float_to_rgbe, rle_encode_scanlines
+    rgbe = float_to_rgbe(np.full((1, 256, 3), 0.5, dtype=np.float32))
+    rle_size = len(rle_encode_scanlines(rgbe))
+    if rle_size >= rgbe.size:
+        return [f"A constant scanline takes {rle_size} bytes, {rgbe.size} bytes without RLE"]
+    return []
+
+
+try:
+    errors = check_rle_encoding() + check_constant_scanline_shrinks()
+    if errors:
+        raise Exception("The RLE encoded scanlines are invalid:\n" + "\n".join(errors))
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,170 @@
+const fs = require('fs');
+const path = require('path');
+const assert = require('assert');
+const utils = require('./utils.js');
+
+const OUT_PREFIX = process.env.OUT_PREFIX || '../tests_out';
+const EPSILON = 1e-4;
+
+process.env['BLENDER_USER_SCRIPTS'] = path.join(process.cwd(), '..');
+
+// Column major 4x4 matrices, like three.js Matrix4 elements.
+function composeMatrix(node) {
+  if (node.matrix)
+    return node.matrix.slice();
+
+  const [x, y, z, w] = node.rotation || [0, 0, 0, 1];
+  const [sx, sy, sz] = node.scale || [1, 1, 1];
+  const [tx, ty, tz] = node.translation || [0, 0, 0];
+  return [
+    (1 - 2 * (y * y + z * z)) * sx, 2 * (x * y + w * z) * sx, 2 * (x * z - w * y) * sx, 0,
+    2 * (x * y - w * z) * sy, (1 - 2 * (x * x + z * z)) * sy, 2 * (y * z + w * x) * sy, 0,
+    2 * (x * z + w * y) * sz, 2 * (y * z - w * x) * sz, (1 - 2 * (x * x + y * y)) * sz, 0,
+    tx, ty, tz, 1
+  ];
+}
+
+function multiplyMatrices(a, b) {
+  const result = new Array(16).fill(0);
+  for (let col = 0; col < 4; col++)
+    for (let row = 0; row < 4; row++)
+      for (let i = 0; i < 4; i++)
+        result[col * 4 + row] += a[i * 4 + row] * b[col * 4 + i];
+  return result;
+}
+
+function transformPoint(m, [x, y, z]) {
+  return [
+    m[0] * x + m[4] * y + m[8] * z + m[12],
+    m[1] * x + m[5] * y + m[9] * z + m[13],
+    m[2] * x + m[6] * y + m[10] * z + m[14]
+  ];
+}
+
+// The scale three.js decomposes from a matrix, three-to-ammo scales automatically fitted shapes by the host's world scale.
+function getScale(m) {
+  return [0, 4, 8].map(i => Math.hypot(m[i], m[i + 1], m[i + 2]));
+}
+
+function readPositions(gltf, buffers, accessorIndex) {
+  const accessor = gltf.accessors[accessorIndex];
+  const bufferView = gltf.bufferViews[accessor.bufferView];
+  const buffer = buffers[bufferView.buffer];
+  const stride = bufferView.byteStride || 12;
+  const offset = (bufferView.byteOffset || 0) + (accessor.byteOffset || 0);
+  const positions = [];
+  for (let i = 0; i < accessor.count; i++) {
+    const start = offset + i * stride;
+    positions.push([buffer.readFloatLE(start), buffer.readFloatLE(start + 4), buffer.readFloatLE(start + 8)]);
+  }
+  return positions;
+}
+
+// Collects the vertices of the host and its descendants in the host's space, like three-to-ammo's iterateGeometries.
+function getColliderVertices(gltf, buffers, hostIndex, includeInvisible) {
+  const vertices = [];
+  const visit = (nodeIndex, matrix) => {
+    const node = gltf.nodes[nodeIndex];
+    const components = (node.extensions || {})['MOZ_hubs_components'] || {};
+    const visible = !components.visible || components.visible.visible;
+    if (node.mesh !== undefined && (includeInvisible || visible)) {
+      gltf.meshes[node.mesh].primitives.forEach(primitive => {
+        readPositions(gltf, buffers, primitive.attributes.POSITION).forEach(position => {
+          vertices.push(transformPoint(matrix, position));
+        });
+      });
+    }
+    (node.children || []).forEach(childIndex => {
+      visit(childIndex, multiplyMatrices(matrix, composeMatrix(gltf.nodes[childIndex])));
+    });
+  };
+  visit(hostIndex, composeMatrix({}));
+  return vertices;
+}
+
+// Ports of three-to-ammo's _computeBounds, _computeHalfExtents and _computeRadius.
+function computeBounds(vertices) {
+  const min = [Infinity, Infinity, Infinity];
+  const max = [-Infinity, -Infinity, -Infinity];
+  vertices.forEach(vertex => {
+    for (let i = 0; i < 3; i++) {
+      min[i] = Math.min(min[i], vertex[i]);
+      max[i] = Math.max(max[i], vertex[i]);
+    }
+  });
+  return { min, max };
+}
+
+function computeHalfExtents(bounds, minHalfExtent, maxHalfExtent) {
+  return [0, 1, 2].map(i => Math.max(minHalfExtent, Math.min(maxHalfExtent, (bounds.max[i] - bounds.min[i]) * 0.5)));
+}
+
+function computeRadius(vertices, bounds) {
+  const center = [0, 1, 2].map(i => (bounds.max[i] + bounds.min[i]) * 0.5);
+  let maxRadiusSq = 0;
+  vertices.forEach(vertex => {
+    const radiusSq = [0, 1, 2].reduce((sum, i) => sum + (vertex[i] - center[i]) ** 2, 0);
+    maxRadiusSq = Math.max(maxRadiusSq, radiusSq);
+  });
+  return Math.sqrt(maxRadiusSq);
+}
+
+function assertClose(actual, expected, message) {
+  assert.ok(Math.abs(actual - expected) <= EPSILON * Math.max(1, Math.abs(expected)),
+    `${message}: expected ${expected}, got ${actual}`);
+}
+
+describe('Precomputed collider fits', function () {
+  utils.blenderVersions.forEach(function (blenderVersion) {
+    describe(blenderVersion + '_collider_fits', function () {
+      const outDirPath = path.resolve(OUT_PREFIX, 'out' + blenderVersion, 'collider_fits');
+      const gltfPath = path.resolve(outDirPath, 'collider-fits.gltf');
+      let gltf;
+      let buffers;
+
+      before(function (done) {
+        utils.blenderRunScript(blenderVersion, 'collider_fits.py', (error) => {
+          if (error)
+            return done(error);
+
+          gltf = JSON.parse(fs.readFileSync(gltfPath));
+          buffers = gltf.buffers.map(buffer => fs.readFileSync(path.resolve(outDirPath, decodeURIComponent(buffer.uri))));
+          utils.validateGltf(gltfPath, done);
+        }, outDirPath);
+      });
+
+      it('skips unselected objects', () => {
+        assert.strictEqual(utils.nodeWithName(gltf, 'Box Unselected').node, undefined);
+      });
+
+      ['Box', 'Scaled Box', 'Clamped Box'].forEach(name => {
+        it(`matches three-to-ammo's box fit for ${name}`, () => {
+          const { node, index } = utils.nodeWithName(gltf, name);
+          const ammoShape = node.extensions['MOZ_hubs_components']['ammo-shape'];
+          assert.strictEqual(ammoShape.fit, 'manual');
+
+          const vertices = getColliderVertices(gltf, buffers, index, ammoShape.includeInvisible);
+          const halfExtents = computeHalfExtents(computeBounds(vertices), ammoShape.minHalfExtent, ammoShape.maxHalfExtent);
+          // The hosts are root nodes, so their world scale is the scale of their own matrix.
+          const scale = getScale(composeMatrix(node));
+          ['x', 'y', 'z'].forEach((axis, i) => {
+            assertClose(ammoShape.halfExtents[axis], halfExtents[i] * scale[i], `${name} half extent ${axis}`);
+          });
+        });
+      });
+
+      ['Sphere', 'Scaled Sphere'].forEach(name => {
+        it(`matches three-to-ammo's sphere fit for ${name}`, () => {
+          const { node, index } = utils.nodeWithName(gltf, name);
+          const ammoShape = node.extensions['MOZ_hubs_components']['ammo-shape'];
+          assert.strictEqual(ammoShape.fit, 'manual');
+
+          const vertices = getColliderVertices(gltf, buffers, index, ammoShape.includeInvisible);
+          // Bullet only uses the x scale of spheres.
+          const radius = computeRadius(vertices, computeBounds(vertices)) * getScale(composeMatrix(node))[0];
+          assertClose(ammoShape.sphereRadius, radius, `${name} radius`);
+        });
+      });
+    });
+  });
+});
@@ -0,0 +1,13 @@
+const path = require('path');
+const utils = require('./utils.js');
+
+process.env['BLENDER_USER_SCRIPTS'] = path.join(process.cwd(), '..');
+
+describe('Color conversions', function () {
+  utils.blenderVersions.forEach(function (blenderVersion) {
+    it(blenderVersion + ' batched conversions match lin2srgb and srgb2lin', function (done) {
+      // The script sweeps the input range and the edges of every sRGB level, and fails on the first mismatches.
+      utils.blenderRunScript(blenderVersion, 'color_conversions.py', done);
+    });
+  });
+});
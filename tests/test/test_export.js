@@ -8,19 +8,6 @@ const OUT_PREFIX = process.env.OUT_PREFIX || '../tests_out';
 
 process.env['BLENDER_USER_SCRIPTS'] = path.join(process.cwd(), '..');
 
-const blenderVersions = (() => {
-  if (process.platform == 'darwin') {
-    return [
-      "/Applications/Blender.app/Contents/MacOS/Blender"
-    ];
-  }
-  else if (process.platform == 'linux') {
-    return [
-      "blender"
-    ];
-  }
-})();
-
 const basePath = path.join(__dirname);
 const tests = glob.sync(path.join(basePath, 'tests', '*.js')).reduce((loaded, file) => {
   const mod = require('./' + path.relative(basePath, file));
@@ -31,7 +18,7 @@ const tests = glob.sync(path.join(basePath, 'tests', '*.js')).reduce((loaded, fi
 describe('Exporter', function () {
   const blenderSampleScenes = fs.readdirSync('scenes').filter(f => f.endsWith('.blend')).map(f => f.substring(0, f.length - 6));
 
-  blenderVersions.forEach(function (blenderVersion) {
+  utils.blenderVersions.forEach(function (blenderVersion) {
     let variants = [
       ['', '']
     ];
@@ -71,7 +58,7 @@ describe('Exporter', function () {
 describe('Importer / Exporter (Roundtrip)', function () {
   const blenderSampleScenes = fs.readdirSync('scenes').filter(f => f.endsWith('.blend')).map(f => f.substring(0, f.length - 6));
 
-  blenderVersions.forEach(function (blenderVersion) {
+  utils.blenderVersions.forEach(function (blenderVersion) {
     let variants = [
       ['', '']
     ];
@@ -0,0 +1,13 @@
+const path = require('path');
+const utils = require('./utils.js');
+
+process.env['BLENDER_USER_SCRIPTS'] = path.join(process.cwd(), '..');
+
+describe('RGBE encoding', function () {
+  utils.blenderVersions.forEach(function (blenderVersion) {
+    it(blenderVersion + ' RLE scanlines decode to the encoded pixels and compress runs', function (done) {
+      // The script decodes the scanlines like Radiance does and fails on the first invalid packet.
+      utils.blenderRunScript(blenderVersion, 'rgbe_encoding.py', done);
+    });
+  });
+});
@@ -4,6 +4,19 @@ const validator = require('gltf-validator');
 
 const UUID_REGEX = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
 
+const blenderVersions = (() => {
+  if (process.platform == 'darwin') {
+    return [
+      "/Applications/Blender.app/Contents/MacOS/Blender"
+    ];
+  }
+  else if (process.platform == 'linux') {
+    return [
+      "blender"
+    ];
+  }
+})();
+
 function blenderFileToGltf(blenderVersion, blenderPath, outDirName, done, options = '') {
   const { exec } = require('child_process');
   const cmd = `${blenderVersion} -b --factory-startup --addons io_hubs_addon -noaudio ${blenderPath} --python export_gltf.py -- ${outDirName} ${options}`;
@@ -33,6 +46,20 @@ function blenderRoundtripGltf(blenderVersion, gltfPath, outDirName, done, option
   });
 }
 
+function blenderRunScript(blenderVersion, scriptPath, done, options = '') {
+  const { exec } = require('child_process');
+  const cmd = `${blenderVersion} -b --factory-startup --addons io_hubs_addon -noaudio --python ${scriptPath} -- ${options}`;
+  var prc = exec(cmd, (error, stdout, stderr) => {
+    if (error) {
+      console.log(stdout);
+      process.stderr.write(stderr);
+      done(error);
+      return;
+    }
+    done();
+  });
+}
+
 function validateGltf(gltfPath, done) {
   const asset = fs.readFileSync(gltfPath);
   validator.validateBytes(new Uint8Array(asset), {
@@ -91,8 +118,10 @@ function materialWithName(gltf, name) {
 
 module.exports = {
   UUID_REGEX,
+  blenderVersions,
   blenderFileToGltf,
   blenderRoundtripGltf,
+  blenderRunScript,
   validateGltf,
   checkExtensionAdded,
   nodeWithName,